@@ -39,6 +39,7 @@
 import abc
 import os
 
+from arg.Common import argTools
 from arg.DataInterface import argDataInterfaceBase
 from arg.Generation import argVTK
 
@@ -66,6 +67,13 @@ class argAggregatorBase:
         except:
             print("*  WARNING: could not instantiate an aggregator: a request parameters dict is required but a {} was provided".format(
                 type(r)))
+            return
+
+        # Key artifacts of request on its parameters and inputs prior to any change
+        # NB: keyed artifacts are only reused if recorded in manifest with same key
+        if hasattr(self, "Backend"):
+            self.RequestParameters["artifact_key"] = argTools.get_artifact_key(
+                r, self.Backend.Parameters.DataDir)
 
 
     def get_backend(self):
@@ -93,8 +101,9 @@ class argAggregatorBase:
                 type(di)))
 
 
-    def show_mesh_surface(self, data, file_name, do_clip=False):
+    def show_mesh_surface(self, data, file_name, do_clip=False, vtk_data=None):
         """A convenience for a request common to several aggregators
+           NB: VTK output data already read at requested time step may be provided
         """
 
         # Create artifact generator variable
@@ -109,7 +118,8 @@ class argAggregatorBase:
             data,
             variable,
             file_name,
-            do_clip)
+            do_clip,
+            vtk_data)
 
         # Include figure in report
         self.Backend.add_figure({
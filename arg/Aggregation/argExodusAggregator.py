@@ -37,9 +37,11 @@
 # HEADER
 
 import os
+import hashlib
+import json
 import math
+import numpy as np
 import vtk
-import vtkmodules.vtkFiltersExtraction as vtkFiltersExtraction
 
 from arg.Common import argMath, argTools
 from arg.Common.argMultiFontStringHelper import argMultiFontStringHelper
@@ -52,6 +54,12 @@ class argExodusAggregator(argAggregatorBase):
     """A class to aggregate information in a Exodus-specific way
     """
 
+    # Version of persistent mesh characteristics cache format
+    MeshCharacteristicsCacheVersion = 1
+
+    # Maximum number of rows of downsampled envelopes of field statistics
+    EnvelopeSize = 1000
+
     def __init__(self, b, r):
 
         # Call superclass init
@@ -76,73 +84,126 @@ class argExodusAggregator(argAggregatorBase):
         self.Backend.add_paragraph({"string": ignored_string})
 
 
-    def compute_VTK_mesh_characteristics(self, vtk_data, block_id_to_flat):
+    def compute_VTK_mesh_characteristics(self, vtk_data, block_id_to_flat, executor=None):
         """Compute per-block topological and quality values of VTK mesh
+           NB: blocks are analyzed by worker processes when an executor is given
         """
 
-        # Initialize empty dicts for per-block storage of results
-        n_verts, n_elems, t_elems, q_stats, q_histo = (
-            {} for _ in range(5))
-
         # Build reverse lookup from flat to block indices
         block_flat_to_id = dict(
             (v, k) for k, vals in block_id_to_flat.items() for v in vals)
 
-        # Iterate over non-empty blocks and extract those
-        it = vtk_data.NewIterator()
-        it.GoToFirstItem()
-        while not it.IsDoneWithTraversal():
-            # Retrieve flat index of current non-empty leaf
-            idx = it.GetCurrentFlatIndex()
-
-            # Skip ignored blocks
-            if idx in block_flat_to_id:
-                # Retrieve corresponding block ID and image file name
-                b_id = block_flat_to_id[idx]
-
-                # Extract mesh block
-                extract = vtkFiltersExtraction.vtkExtractBlock()
-                extract.SetInputData(vtk_data)
-                extract.AddIndex(idx)
-                extract.Update()
-                mesh_block = extract.GetOutput().GetBlock(0)
-
-                # Retrieve mesh block information and append it to global meta
-                n_verts[b_id] = n_verts.get(b_id, 0) + mesh_block.GetNumberOfPoints()
-                n_e_cur = n_elems.get(b_id, 0)
-                n_e_blk = mesh_block.GetNumberOfCells()
-                n_elems[b_id] = n_e_cur + n_e_blk
-                elem_type_str, elem_q_type = argVTK.get_element_types(mesh_block)
-                if True or elem_type_str:
-                    t_elems.setdefault(b_id, elem_type_str)
-
-                # Append mesh block quality when relevant
-                if elem_q_type:
-                    # Compute all desired quality statistics
-                    for q_name, q_vtk in argVTK.quality_functions.items():
-                        # Compute current block quality statistics and histogram
-                        q_s_blk, q_h_blk = argVTK.get_mesh_quality(
-                            mesh_block, q_vtk, elem_q_type, True)
-
-                        # Update or create quality statistics for current block
-                        q_stats[b_id] = argTools.update_or_create_dict_in_dict(
-                            q_stats, b_id, q_name, q_s_blk,
-                            argMath.aggregate_descriptive_statistics)
-
-                        # Update or create quality histogram for current block
-                        q_histo[b_id] = argTools.update_or_create_dict_in_dict(
-                            q_histo, b_id, q_name, q_h_blk,
-                            argMath.aggregate_histograms)
-
-            # Iterate to next non-empty leaf
-            it.GoToNextItem()
+        # Retrieve non-empty leaves of non-ignored blocks without copying them
+        mesh_blocks = [
+            (block_flat_to_id[idx], leaf)
+            for idx, leaf in argVTK.iterate_leaves(vtk_data)
+            if idx in block_flat_to_id]
+
+        # Analyze all mesh blocks and merge their characteristics
+        return self.merge_mesh_characteristics(
+            self.analyze_mesh_blocks(mesh_blocks, executor))
+
+
+    def analyze_mesh_blocks(self, mesh_blocks, executor=None):
+        """Compute characteristics of mesh blocks given with their block IDs
+           NB: blocks are analyzed by worker processes when an executor is given
+        """
+
+        # Ship mesh blocks to worker processes when possible
+        analyses = []
+        for _, mesh_block in mesh_blocks:
+            mesh_arrays = argVTK.get_mesh_arrays(mesh_block) if executor else None
+            analyses.append(executor.submit(
+                argVTK.apply_to_mesh_arrays,
+                argVTK.compute_mesh_block_characteristics,
+                mesh_arrays) if mesh_arrays else None)
+
+        # Return block IDs and mesh block characteristics in block order
+        return [
+            (b_id, analysis.result() if analysis
+             else argVTK.compute_mesh_block_characteristics(mesh_block))
+            for (b_id, mesh_block), analysis in zip(mesh_blocks, analyses)]
+
+
+    def iterate_analyzed_element_blocks(self, model_data, ignored_blocks, block_characteristics,
+                                        max_memory, executor=None):
+        """Iterate over element blocks read one at a time, appending their mesh
+           characteristics to given list before yielding them unless it is None
+        """
+
+        # Read, analyze, and yield one element block at a time
+        for b_id, output in model_data.iterate_element_blocks(0, ignored_blocks):
+            # Warn when a single block does not fit in memory budget
+            if output.GetActualMemorySize() > 1024 * max_memory:
+                print("*  WARNING: block {} alone exceeds memory budget of {} MB".format(
+                    b_id, max_memory))
+
+            # Analyze block leaves unless mesh characteristics are known
+            if block_characteristics is not None:
+                block_characteristics.extend(self.analyze_mesh_blocks(
+                    [(b_id, leaf) for _, leaf in argVTK.iterate_leaves(output)], executor))
+            yield b_id, output
+
+
+    def merge_mesh_characteristics(self, block_characteristics):
+        """Merge per-block topological and quality values of mesh blocks
+           NB: qualities are keyed by their names, suffixed with element types
+               in blocks with several supported element families
+        """
+
+        # Initialize empty dicts for per-block storage of results
+        n_verts, n_elems, t_elems, q_stats, q_histo, q_sketches = (
+            {} for _ in range(6))
+
+        # Merge mesh block characteristics in block order
+        q_partial_stats = {}
+        for b_id, (n_v_blk, n_e_blk, census, q_s_blk, q_h_blk, q_k_blk) in block_characteristics:
+            # Append mesh block information to global meta
+            n_verts[b_id] = n_verts.get(b_id, 0) + n_v_blk
+            n_elems[b_id] = n_elems.get(b_id, 0) + n_e_blk
+            t_census = t_elems.setdefault(b_id, {})
+            for type_str, count in census.items():
+                t_census[type_str] = t_census.get(type_str, 0) + count
+
+            # Aggregate quality histograms and sketches of current block
+            for q_name, q_s in q_s_blk.items():
+                # Collect partial quality statistics for current block
+                q_partial_stats.setdefault(b_id, {}).setdefault(q_name, []).append(q_s)
+
+                # Update or create quality histogram for current block
+                if q_h_blk.get(q_name):
+                    q_histo[b_id] = argTools.update_or_create_dict_in_dict(
+                        q_histo, b_id, q_name, q_h_blk[q_name],
+                        argMath.aggregate_histograms)
+
+                # Update or create quality sketch for current block
+                if q_k_blk.get(q_name):
+                    q_sketches[b_id] = argTools.update_or_create_dict_in_dict(
+                        q_sketches, b_id, q_name, q_k_blk[q_name],
+                        argMath.aggregate_quantile_sketches)
+
+        # Aggregate all partial quality statistics of each block at once
+        for b_id, q_partials in q_partial_stats.items():
+            q_stats[b_id] = {
+                q_key: argMath.aggregate_descriptive_statistics_array(q_s)
+                for q_key, q_s in q_partials.items()}
+
+        # Name qualities after element families only in mixed blocks,
+        # deciding mixedness once per block from its element type census
+        for q_dict in (q_stats, q_histo, q_sketches):
+            for b_id, q_blk in q_dict.items():
+                mixed = len(t_elems.get(b_id, {})) > 1
+                q_dict[b_id] = {
+                    "{} ({})".format(q_name, type_str) if mixed else q_name: v
+                    for (q_name, type_str), v in q_blk.items()}
 
         # Return computed values
-        return n_verts, n_elems, t_elems, q_stats, q_histo
+        return n_verts, n_elems, t_elems, q_stats, q_histo, q_sketches
 
 
-    def add_block_quality_table(self, b_id, block_name, q_stats):
-        """Add per-block mesh quality information when available
+    def add_block_quality_table(self, b_id, block_name, q_stats, q_sketches=None):
+        """Add per-block mesh quality information when available,
+           including estimated quantiles when quality sketches are provided
         """
 
         # Bail out early if no quality is available for block element type
@@ -187,6 +248,16 @@ class argExodusAggregator(argAggregatorBase):
         head[5].append("Q", 8)
         head[5].append(')', 0)
 
+        # Append quantile columns when quality sketches are available
+        blk_sketches = (q_sketches or {}).get(b_id, {})
+        quantiles = (.01, .5, .99)
+        if blk_sketches:
+            for q_label in ("P1(", "median(", "P99("):
+                head.append(argMultiFontStringHelper(self.Backend))
+                head[-1].append(q_label, 0)
+                head[-1].append("Q", 8)
+                head[-1].append(')', 0)
+
         # Create mesh quality table body
         body = []
         for q_n, q_s in elt_quality_stats.items():
@@ -202,7 +273,11 @@ class argExodusAggregator(argAggregatorBase):
             q_s[4] = stdev / q_s[1] if q_s[1] > 1e-8 else float("inf")
 
             # Create new row for current quality name
-            body.append([q_n] + ["{:.4g}".format(q) for q in q_s])
+            row = [q_n] + ["{:.4g}".format(q) for q in q_s]
+            if blk_sketches:
+                row += (["{:.4g}".format(q) for q in argMath.get_quantiles(blk_sketches[q_n], quantiles)]
+                        if blk_sketches.get(q_n) else ['-'] * len(quantiles))
+            body.append(row)
 
 
         # Assemble caption string
@@ -225,12 +300,13 @@ class argExodusAggregator(argAggregatorBase):
         # Retrieve map of block histogram data
         histo_map = q_histo.get(b_id, {})
         for q_n, q_h in histo_map.items():
-            # Bail out if no quality histogram was provided
-            if not q_h:
+            # Bail out if no quality histogram or statistics were provided
+            q_s = q_stats.get(b_id, {}).get(q_n)
+            if not q_h or not q_s:
                 continue
 
             # Decide whether to show histogram depending on CoV
-            cv_q = q_stats.get(b_id).get(q_n)[4]
+            cv_q = q_s[4]
             histo_string = argMultiFontStringHelper(self.Backend)
             histo_string.append("Histogram of {} element quality in block ".format(
                 q_n), 0)
@@ -244,7 +320,8 @@ class argExodusAggregator(argAggregatorBase):
                 # Generate and insert histogram plot
                 histo_name = argPlot.create_plot(
                     self.Backend.Parameters,
-                    {"type": "histogram", "xyratio": 3.5},
+                    {"type": "histogram", "xyratio": 3.5,
+                     "artifact_key": self.RequestParameters.get("artifact_key")},
                     histo_map,
                     "block {}".format(b_id),
                     q_n,
@@ -258,6 +335,38 @@ class argExodusAggregator(argAggregatorBase):
                         "width": self.RequestParameters.get("histogram_width", "12cm")})
 
 
+    def get_mesh_characteristics_cache(self, database_name):
+        """Return base name and index of persistent cache of mesh characteristics,
+           keyed by input database identity, ignored blocks, and quality metrics
+           NB: return None base name when caching is disabled or identity unknown
+        """
+
+        # Bail out early when caching is disabled or input identity is unknown
+        cache_dir = self.RequestParameters.get(
+            "cache_dir", self.Backend.Parameters.OutputDir)
+        identity = argDataInterface.get_database_identity(database_name)
+        if not cache_dir or identity is None:
+            return None, None
+
+        # Assemble cache index from everything mesh characteristics depend upon
+        cache_index = {
+            "version": self.MeshCharacteristicsCacheVersion,
+            "database": os.path.abspath(database_name),
+            "identity": [list(i) for i in identity],
+            "ignore_blocks": sorted(
+                str(k) for k in self.RequestParameters.get("ignore_blocks") or []),
+            "quality_functions": sorted(argVTK.quality_functions),
+            "quality_ranges": sorted(
+                [q, list(r)] for q, r in argVTK.quality_ranges.items()),
+            "quality_histogram_size": argVTK.quality_histogram_size}
+
+        # Name cache files after digest of its index
+        digest = hashlib.sha1(json.dumps(cache_index, sort_keys=True).encode("utf-8"))
+        return os.path.join(
+            cache_dir,
+            "mesh_characteristics_{}".format(digest.hexdigest()[:16])), cache_index
+
+
     def show_all_blocks(self, data, file_names):
         """Add surface rendering figures to the document for each mesh block
            for a specified point or cell data, scalar or vector variable
@@ -271,11 +380,35 @@ class argExodusAggregator(argAggregatorBase):
             print("*  WARNING: ignoring request: not enough parameters to show all blocks of input model")
             return
 
-        # Get handle on input data in VTK form
-        vtk_data = model_data.get_VTK_reader_output_data(0)
-        if not vtk_data:
-            print("*  WARNING: ignoring request: could not read VTK data from input model", model_file)
-            return
+        # Read blocks one at a time when whole model would exceed memory budget
+        ignored_blocks = argVTK.get_ignored_block_IDs(
+            self.RequestParameters.get("ignore_blocks"), model_data)
+        max_memory = self.RequestParameters.get("max_memory")
+        out_of_core = max_memory is not None and (
+            model_data.estimate_VTK_output_size() > 1024 * 1024 * max_memory)
+        if out_of_core:
+            print("[argExodusAggregator] Estimated model size exceeds memory budget of {} MB: reading blocks one at a time".format(
+                max_memory))
+
+        # Retrieve topological and quality values of mesh from cache if unchanged
+        cache_base, cache_index = self.get_mesh_characteristics_cache(
+            os.path.join(self.Backend.Parameters.DataDir, model_file))
+        cached = argTools.load_nested_data(cache_base) if cache_base else None
+        if cached and cached[0] == cache_index:
+            print("[argExodusAggregator] Reusing mesh characteristics cached in {}".format(
+                cache_base))
+            mesh_characteristics = cached[1]
+        else:
+            mesh_characteristics = None
+
+        # Read whole model only when its characteristics must be computed in core
+        vtk_data = None
+        if mesh_characteristics is None and not out_of_core:
+            # Get handle on input data in VTK form without ignored blocks
+            vtk_data = model_data.get_VTK_reader_output_data(0, ignored_blocks)
+            if not vtk_data:
+                print("*  WARNING: ignoring request: could not read VTK data from input model", model_file)
+                return
 
         # Retrieve or create block names and IDs
         meta_data = model_data.get_meta_information()[0]
@@ -286,23 +419,50 @@ class argExodusAggregator(argAggregatorBase):
         comments = argTools.map_composite_keys(
             self.RequestParameters, "string", self.Backend.Parameters.KeySeparator)
 
-        # Generate block visualizations as needed
-        variable = argVTK.argVTKAttribute(
-            model_data, self.RequestParameters.get("time_step", -1))
-        block_id_to_flat, block_images_and_captions = argVTK.all_blocks(
-            self.Backend.Parameters,
-            self.RequestParameters,
-            model_data,
-            variable,
-            model_file)
+        # Create pool of worker processes when parallel execution is requested
+        executor = argTools.create_process_pool(self.RequestParameters.get("workers", 1))
+        try:
+            # Analyze blocks as they are read when they do not fit in memory together
+            block_characteristics = [] if mesh_characteristics is None else None
+            block_outputs = self.iterate_analyzed_element_blocks(
+                model_data, ignored_blocks, block_characteristics, max_memory,
+                executor) if out_of_core else None
+
+            # Generate block visualizations as needed, reading model in core only
+            # if some are missing when non-empty blocks are known from cache
+            variable = argVTK.argVTKAttribute(
+                model_data, self.RequestParameters.get("time_step", -1))
+            block_id_to_flat, block_images_and_captions = argVTK.all_blocks(
+                self.Backend.Parameters,
+                self.RequestParameters,
+                model_data,
+                variable,
+                model_file,
+                executor,
+                block_outputs,
+                sorted(mesh_characteristics[1]) if mesh_characteristics and not out_of_core else None)
+
+            # Compute topological and quality values of mesh and cache them
+            if mesh_characteristics is None:
+                mesh_characteristics = self.merge_mesh_characteristics(
+                    block_characteristics) if out_of_core else self.compute_VTK_mesh_characteristics(
+                    vtk_data, block_id_to_flat, executor)
+                if cache_base:
+                    try:
+                        argTools.save_nested_data(cache_base, mesh_characteristics, cache_index)
+                    except OSError as e:
+                        print("*  WARNING: could not cache mesh characteristics in {}: {}".format(
+                            cache_base, e))
+            n_verts, n_elems, t_elems, q_stats, q_histo, q_sketches = mesh_characteristics
+
+        finally:
+            # Release worker processes
+            if executor:
+                executor.shutdown()
 
         # Report about ignored blocks if any
         self.add_ignored_block_keys()
 
-        # Compute topological and quality values of mesh
-        n_verts, n_elems, t_elems, q_stats, q_histo = self.compute_VTK_mesh_characteristics(
-            vtk_data, block_id_to_flat)
-
         # Create per-block pages
         for b_id, (base_name, caption) in sorted(block_images_and_captions.items()):
             # Retrieve block ID and name
@@ -323,21 +483,25 @@ class argExodusAggregator(argAggregatorBase):
                 ["number of nodes", "{}".format(n_verts[b_id])],
                 ["number of elements", "{}".format(n_elems[b_id])]]
 
-            # Add block images only when element type is known
+            # Add block images only when element types are known
             if b_id in t_elems:
-                # Add block images and element type to table body
+                # Add block images and element types census to table body
                 type_string = argMultiFontStringHelper(self.Backend)
-                type_string.append(t_elems.get(b_id), 4)
+                for i, (type_str, count) in enumerate(sorted(t_elems.get(b_id).items())):
+                    if i:
+                        type_string.append(", ", 0)
+                    type_string.append(type_str, 4)
+                    type_string.append(" ({})".format(count), 0)
                 body.append([
-                    "type of first element in block",
+                    "types of elements in block",
                     type_string])
                 self.Backend.add_figure({
                     "figure_file": base_name + ".png",
                     "caption_string": caption,
                     "width": self.RequestParameters.get("width", "12cm")})
             else:
-                # Block element type is unknown
-                body.append(["type of first element in block", "unknown"])
+                # Block element types are unknown
+                body.append(["types of elements in block", "unknown"])
 
             # Generate table of block properties
             caption_string = argMultiFontStringHelper(self.Backend)
@@ -352,7 +516,7 @@ class argExodusAggregator(argAggregatorBase):
                 "hb!")  # Put table at bottom of page
 
             # Append per-block mesh quality information when available
-            self.add_block_quality_table(b_id, block_name, q_stats)
+            self.add_block_quality_table(b_id, block_name, q_stats, q_sketches)
             
             # Create and add quality histograms for current block
             self.add_block_histograms(b_id, block_name, q_stats, q_histo)
@@ -411,37 +575,24 @@ class argExodusAggregator(argAggregatorBase):
         n_images = i_max - i_min + 1
         n_figs, n_rem = divmod(n_images, n_modes_per_image)
 
-        # Generate images and captions for each for each block of modes
-        all_base_names, all_captions = [], []
-        variable = argVTK.argVTKAttribute(data, )
-        mode_range = [i_min, i_min + n_modes_per_image - 1]
-
-        # Start with all complete images
-        for _ in range(n_figs):
-            self.RequestParameters["range"] = mode_range
-            base_name, caption = argVTK.many_modes(
-                self.Backend.Parameters,
-                self.RequestParameters,
-                data,
-                variable,
-                file_name)
-            all_base_names.append(base_name)
-            all_captions.append(caption)
-            mode_range[0] += n_modes_per_image
-            mode_range[1] += n_modes_per_image
-
-        # Create incomplete image if modes remain
+        # Assemble mode ranges of all complete images, then of incomplete one if modes remain
+        mode_ranges = [
+            [i_min + i * n_modes_per_image, i_min + (i + 1) * n_modes_per_image - 1]
+            for i in range(n_figs)]
         if n_rem:
-            mode_range[1] = mode_range[0] + n_rem - 1
-            self.RequestParameters["range"] = mode_range
-            base_name, caption = argVTK.many_modes(
-                self.Backend.Parameters,
-                self.RequestParameters,
-                data,
-                variable,
-                file_name)
-            all_base_names.append(base_name)
-            all_captions.append(caption)
+            mode_ranges.append([
+                i_min + n_figs * n_modes_per_image,
+                i_min + n_figs * n_modes_per_image + n_rem - 1])
+
+        # Generate images and captions for all blocks of modes in one rendering session
+        variable = argVTK.argVTKAttribute(data, )
+        all_base_names, all_captions = zip(*argVTK.many_modes_pages(
+            self.Backend.Parameters,
+            self.RequestParameters,
+            data,
+            variable,
+            file_name,
+            mode_ranges)) if mode_ranges else ((), ())
 
         # Add corresponding modal frequencies table
         modes = []
@@ -495,8 +646,14 @@ class argExodusAggregator(argAggregatorBase):
             var_desc = "element" if d.AttributeBinding == "cell" else "node"
             var_desc += "-based {}".format(d.AttributeType)
 
-            # Iterate over all available time
-            for i, t in enumerate(d.get_available_times()):
+            # Iterate over all available time, reading next step without ignored
+            # blocks in background so that rendering does not read it again
+            times = d.get_available_times()
+            ignored_blocks = argVTK.get_ignored_block_IDs(
+                self.RequestParameters.get("ignore_blocks"), d)
+            for i, vtk_data in d.iter_time_steps(ignored_blocks=ignored_blocks):
+                t = times[i]
+
                 # Start with a new page for each time-step
                 self.Backend.add_page_break()
 
@@ -515,20 +672,145 @@ class argExodusAggregator(argAggregatorBase):
                 variable_string.append(')', 0)
                 self.Backend.add_subtitle({"title": variable_string})
 
-                # Get handle on input data in VTK form
-                vtk_data = d.get_VTK_reader_output_data(i)
+                # Check handle on input data in VTK form
                 if not vtk_data:
                     print("* {} WARNING: could not read VTK data from input model".format(file_name))
                     return
 
-                # Generate clipped mesh surface view
+                # Generate clipped mesh surface view from data read at this step
                 self.RequestParameters["time_step"] = i
-                self.show_mesh_surface(d, file_name, True)
+                self.show_mesh_surface(d, file_name, True, vtk_data)
 
         # Clear page after last field
         self.Backend.add_page_break()
 
 
+    def show_field_statistics(self, data, file_name):
+        """Add table of per-block descriptive statistics of a point or cell
+           data variable over all time steps, and per-block envelope plots
+           NB: time steps are streamed so that only running statistics, times of
+               extrema, and envelopes downsampled to at most EnvelopeSize rows are kept
+        """
+
+        # Bail out early if variable was not found or no time steps are present
+        var_name = data.AttributeName
+        times = data.get_available_times()
+        if not var_name or not times:
+            print("*  WARNING: ignoring request: no values of variable {} in {}".format(
+                self.RequestParameters.get("var_name"), file_name))
+            return
+
+        # Retrieve ignored block IDs and block names
+        meta_data = data.get_meta_information()[0]
+        ignored_blocks = argVTK.get_ignored_block_IDs(
+            self.RequestParameters.get("ignore_blocks"), data)
+        block_names = dict(zip(meta_data["block IDs"], meta_data["block names"]))
+
+        # Vector variables are summarized by their moduli
+        modulus = data.AttributeType == "vector3"
+
+        # Assign time steps to consecutive envelope bins of fixed number
+        n_bins = min(len(times), self.EnvelopeSize)
+        bins = np.arange(len(times)) * n_bins // len(times)
+        bin_times = np.bincount(bins, times) / np.bincount(bins)
+
+        # Stream through time steps, merging per-block statistics along the way
+        running_stats, extrema_times, envelopes = {}, {}, {}
+        for i, block_values in data.iter_time_steps(
+                var_name, ignored_blocks=ignored_blocks, by_block=True):
+            for b_id, values in block_values.items():
+                # Compute statistics of block at current time step
+                s = argMath.compute_descriptive_statistics(
+                    np.linalg.norm(values, axis=-1) if modulus else values)
+                if not s:
+                    continue
+
+                # Keep times at which running extrema are first reached
+                r_s = running_stats.get(b_id)
+                t_min, t_max = extrema_times.get(b_id, (times[i], times[i]))
+                if r_s and s[0] < r_s[0]:
+                    t_min = times[i]
+                if r_s and s[2] > r_s[2]:
+                    t_max = times[i]
+                extrema_times[b_id] = (t_min, t_max)
+
+                # Merge statistics into running and envelope bin ones
+                running_stats[b_id] = argMath.aggregate_descriptive_statistics(r_s, s)
+                envelope = envelopes.setdefault(b_id, [[] for _ in range(n_bins)])
+                envelope[bins[i]] = argMath.aggregate_descriptive_statistics(envelope[bins[i]], s)
+
+        # Bail out early if no statistics were computed
+        if not running_stats:
+            print("*  WARNING: ignoring request: no values of variable {} in non-ignored blocks".format(
+                var_name))
+            return
+
+        # Create variable statistics section title
+        var_desc = "element" if data.AttributeBinding == "cell" else "node"
+        var_desc += "-based {}".format(data.AttributeType)
+        self.Backend.add_page_break()
+        variable_string = argMultiFontStringHelper(self.Backend)
+        variable_string.append("Variable ", 0)
+        variable_string.append(var_name, 4)
+        variable_string.append(" ({}{}) statistics over {} time steps".format(
+            var_desc, " modulus" if modulus else '', len(times)), 0)
+        self.Backend.add_subtitle({"title": variable_string})
+
+        # Generate statistics table head
+        head = [argMultiFontStringHelper(self.Backend) for _ in range(7)]
+        head[0].append("block", 0)
+        head[1].append("min", 0)
+        head[2].append("mu", 16)
+        head[3].append("max", 0)
+        head[4].append("sigma", 16)
+        head[5].append("t", 8)
+        head[5].append("(min)", 0)
+        head[6].append("t", 8)
+        head[6].append("(max)", 0)
+
+        # Create one row per block with times at which extrema are reached
+        body = []
+        for b_id, b_s in running_stats.items():
+            t_min, t_max = extrema_times[b_id]
+            body.append(["{} ({})".format(block_names.get(b_id, ''), b_id)] + [
+                "{:.4g}".format(v) for v in (
+                    b_s[0], b_s[1], b_s[2], math.sqrt(b_s[3]) if b_s[3] > 0. else 0., t_min, t_max)])
+
+        # Generate table of per-block statistics
+        caption_string = argMultiFontStringHelper(self.Backend)
+        caption_string.append("Per-block statistics of ", 0)
+        caption_string.append(var_name, 4)
+        caption_string.append(" over all time steps.", 0)
+        self.Backend.add_table(
+            head,
+            body,
+            caption_string)
+
+        # Create and add envelope plot for each block
+        for b_id, envelope in envelopes.items():
+            envelope_name = argPlot.create_plot(
+                self.Backend.Parameters,
+                {"type": "envelope", "artifact_key": self.RequestParameters.get("artifact_key")},
+                {"time": {"times": bin_times, "statistics": np.array(
+                    [s if s else [0.] * 5 for s in envelope], dtype=float)}},
+                "block {}".format(b_id),
+                "time",
+                var_name)
+            if envelope_name and envelope_name[0]:
+                self.Backend.add_figure({
+                    "figure_file": "{}.png".format(envelope_name[0]),
+                    "caption_string": envelope_name[1],
+                    "width": self.RequestParameters.get("width", "12cm")})
+
+        # Append comment when defined for variable
+        comments = argTools.map_composite_keys(
+            self.RequestParameters, "string", self.Backend.Parameters.KeySeparator)
+        self.Backend.add_comment(comments, var_name)
+
+        # Clear page after statistics
+        self.Backend.add_page_break()
+
+
     def aggregate(self):
         """Decide which aggregation operation is to be performed
         """
@@ -590,6 +872,27 @@ class argExodusAggregator(argAggregatorBase):
             if data:
                 self.show_enumerated_fields(data, file_name)
 
+        # Operation show_field_statistics: one table and one envelope plot per block
+        elif request_name == "show_field_statistics":
+            # Retrieve variable name
+            var_name = self.RequestParameters.get("var_name")
+            if not var_name:
+                print("*  WARNING: no variable name provided for {}".format(
+                    request_name))
+                return
+
+            # Get handle on data, bypassing VTK when possible as only arrays are needed
+            file_name = self.RequestParameters["model"]
+            full_name = os.path.join(self.Backend.Parameters.DataDir, file_name)
+            data = argDataInterface.factory(
+                argDataInterface.get_numeric_Exodus_data_type(full_name),
+                full_name,
+                var_name)
+
+            # Aggregate
+            if data:
+                self.show_field_statistics(data, file_name)
+
         # Operation show_all_modes: one figure every n_cols x n_rows modes
         elif request_name.startswith("show_all_modes"):
             # Decide whether mesh edges are to be shown or not
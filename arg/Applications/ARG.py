@@ -48,6 +48,8 @@ from arg import __version__
 from arg.Common.argReportParameters import argReportParameters
 from arg.Applications import Explorator
 from arg.Applications.argGenerator import argGenerator
+from arg.DataInterface.argDataInterface import argDataInterface
+from arg.DataInterface.argVTKExodusReader import argVTKExodusReader
 
 ARG_VERSION = __version__
 
@@ -82,6 +84,7 @@ class Runner:
         self.Version = version
         self.LatexProcessor = None
         self.TexFile = None
+        self.Jobs = 1
 
     @staticmethod
     def usage():
@@ -98,6 +101,7 @@ class Runner:
         print("\t [-p <parameters file>]    name of parameters file")
         print("\t [-l <LaTeX processor>]    name of LaTeX processor")
         print("\t [-t]                      generate just .tex file")
+        print("\t [-j <number of jobs>]     number of parallel artifact generation or partition reading processes")
         sys.exit(0)
 
     def parse_line(self, default_parameters_filename, types=None):
@@ -109,7 +113,7 @@ class Runner:
 
         # Try to hash command line with respect to allowable flags
         try:
-            opts, args = getopt.getopt(sys.argv[1:], "egEGAp:l:t")
+            opts, args = getopt.getopt(sys.argv[1:], "egEGAp:l:tj:")
         except getopt.GetoptError:
             self.usage()
             sys.exit(1)
@@ -142,6 +146,11 @@ class Runner:
                 self.LatexProcessor = a
             elif o == "-t":
                 self.TexFile = True
+            elif o == "-j":
+                try:
+                    self.Jobs = int(a)
+                except ValueError:
+                    self.usage()
 
         # Inform user if missing argument
         if not self.ParametersFile:
@@ -174,6 +183,9 @@ class Runner:
             shutil.copyfile(os.path.realpath("{}.yml".format(self.Parameters.StructureFile)),
                             os.path.realpath("{}_tmp.yml".format(self.Parameters.StructureFile)))
 
+        # Read partitions with as many worker processes as jobs
+        argVTKExodusReader.set_number_of_workers(self.Jobs)
+
         # Instantiate generator
         generator = argGenerator(self.Parameters)
             
@@ -183,7 +195,7 @@ class Runner:
 
         # Generate when required
         if self.Generate:
-            generator.generate_artefacts()
+            generator.generate_artefacts(self.Jobs)
 
         # Concatenate existing structure file content with generated content
         if concatenateStructureFile:
@@ -195,6 +207,9 @@ class Runner:
         if self.Assemble:
             generator.assemble_report()
 
+        # Release data interfaces once report was generated
+        argDataInterface.clear_registry()
+
 
 def main(types, version=None):
     """ ARG main method
@@ -36,11 +36,86 @@
 #
 #HEADER
 
+import copy
 import os
 
+import matplotlib.pyplot
+
+from arg.Backend.argBackend import argBackend
+from arg.Common import argTools
+from arg.DataInterface.argVTKExodusReader import argVTKExodusReader
 from arg.Tools import Utilities
 from arg.Generation import argPlot, argVTK
 
+# Parameters of worker process, with a backend of its own
+worker_parameters = None
+
+
+def initialize_worker(parameters):
+    """Keep track of parameters in worker process and instantiate its backend
+    """
+
+    # Backends are not shared across processes
+    global worker_parameters
+    worker_parameters = parameters
+    worker_parameters.Backend = argBackend.factory(parameters)
+
+    # Partitions are read by artifact generation workers themselves
+    argVTKExodusReader.set_number_of_workers(1)
+
+
+def generate_worker_artifact(request_params):
+    """Find or create artifact in worker process
+    """
+
+    # Do not let requests spawn processes of their own in addition to workers
+    # and delegate to artifact generation with parameters of worker process
+    return generate_artifact(worker_parameters, dict(request_params, workers=1))
+
+
+def generate_artifact(parameters, request_params):
+    """Find or create artifact and save its caption as file
+       NB: artifact base name is returned upon success, else an error message
+    """
+
+    # Retrieve artifact type
+    item_type = request_params.get('n')
+    try:
+        # VTK artifact
+        if item_type == "vtk":
+            # Find or create VTK figure artifact
+            base_name, caption = argVTK.execute_request(
+                parameters, request_params)
+            if not base_name:
+                return None, "could neither find nor create visualization"
+
+        # MatPlotLib artifact
+        elif item_type == "plot":
+            # Find or create MatPlotLib figure artifact
+            base_name, caption = argPlot.execute_request(
+                parameters, request_params)
+            if not base_name:
+                return None, "could neither find nor create plot"
+
+        # Unsupported artifact
+        else:
+            return None, "unsupported artifact type {}".format(item_type)
+
+        # Save caption as file
+        caption.write(parameters.Backend,
+                      parameters.OutputDir,
+                      base_name)
+
+    except Exception as e:
+        # Do not let figures of failed request leak into subsequent ones
+        matplotlib.pyplot.close("all")
+        return None, "{} artifact request failed with exception `{}`".format(
+            item_type, e)
+
+    # Return base name of found or created artifact
+    return base_name, None
+
+
 class argGenerator:
     """A class to generate artifacts and a report
     """
@@ -52,9 +127,18 @@ class argGenerator:
         # Keep track of parameters
         self.Parameters = parameters
 
+    def is_artifact_recorded(self, manifest, base_name, key):
+        """Tell whether artifact with given base name is recorded in manifest
+           with given key and its image is present in output directory
+        """
 
-    def generate_artefacts(self):
-        """ Generate artefacts from provided data
+        # Artifact must have been recorded with same key and not removed since
+        return (base_name is not None and manifest["artifacts"].get(base_name) == key
+                and os.path.isfile(os.path.join(self.Parameters.OutputDir, "{}.png".format(base_name))))
+
+    def generate_artefacts(self, n_jobs=1):
+        """ Generate artefacts from provided data, with n_jobs worker
+            processes when more than one is requested
         """
 
         # Open provided structure file
@@ -66,38 +150,59 @@ class argGenerator:
                 self.Parameters.Application, artifact_map))
             return False
 
-        # Iterate over requested artifacts
-        n_missing = 0
-        for request_params in artifact_map:
-            # Retrieve artifact type
-            item_type = request_params.get('n')
-
-            # VTK artifact
-            if item_type == "vtk":
-                # Find or create VTK figure artifact
-                base_name, caption = argVTK.execute_request(
-                    self.Parameters, request_params)
-                if not base_name:
-                    print("*  WARNING: could neither find nor create visualization. Skipping it.")
-                    n_missing += 1
-                    continue
-
-            # MatPlotLib artifact
-            elif item_type == "plot":
-                # Find or create MatPlotLib figure artifact
-                base_name, caption = argPlot.execute_request(
-                    self.Parameters, request_params)
+        # Existing artifacts are reused only when their image is present and
+        # recorded in manifest under its base name with same key
+        manifest = argTools.load_artifact_manifest(self.Parameters.OutputDir)
+        base_names = {key: base_name for base_name, key in manifest["artifacts"].items()}
+        keys = [argTools.get_artifact_key(request_params, self.Parameters.DataDir)
+                for request_params in artifact_map]
+        requests = [request_params if self.is_artifact_recorded(manifest, base_names.get(key), key)
+                    else dict(request_params, regenerate=True)
+                    for request_params, key in zip(artifact_map, keys)]
+        n_stale = sum(1 for r in requests if r.get("regenerate"))
+        if n_stale:
+            print("[argGenerator] {} artifact(s) to be regenerated as not found in manifest with same key".format(
+                n_stale))
+
+        # Create pool of worker processes when parallel execution is requested
+        parameters = copy.copy(self.Parameters)
+        parameters.Backend = None
+        executor = argTools.create_process_pool(
+            n_jobs, initialize_worker, (parameters,))
+        try:
+            # Find or create artifacts either concurrently or one after another
+            if executor:
+                results = executor.map(generate_worker_artifact, requests)
+            else:
+                results = (generate_artifact(self.Parameters, request_params)
+                           for request_params in requests)
+
+            # Report on requested artifacts in order
+            n_missing = 0
+            created = {}
+            for key, (base_name, error) in zip(keys, results):
                 if not base_name:
-                    print("*  WARNING: could neither find nor create plot. Skipping it.")
+                    print("*  WARNING: {}. Skipping it.".format(error))
                     n_missing += 1
                     continue
-
-            # Save caption as file
-            caption.write(self.Parameters.Backend,
-                          self.Parameters.OutputDir,
-                          base_name)
-            print("[argGenerator] Created {} artifact/caption pair".format(
-                base_name))
+                print("[argGenerator] Created {} artifact/caption pair".format(
+                    base_name))
+
+                # Artifacts shared by distinct requests cannot be safely reused
+                if created.get(base_name, key) != key:
+                    print("*  WARNING: {} artifact is shared by distinct requests. Not recording it.".format(
+                        base_name))
+                    key = None
+                created[base_name] = key
+
+        finally:
+            # Release worker processes
+            if executor:
+                executor.shutdown()
+
+        # Record keys of created artifacts only, pruning stale entries from manifest
+        manifest["artifacts"] = {base_name: key for base_name, key in created.items() if key}
+        argTools.save_artifact_manifest(self.Parameters.OutputDir, manifest)
 
         # Report on missing items and terminate
         if n_missing:
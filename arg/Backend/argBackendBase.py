@@ -48,6 +48,7 @@ import uuid
 
 import yaml
 
+from arg.Common import argTools
 from arg.Common.argInformationObject import argInformationObject
 from arg.Common.argMultiFontStringHelper import argMultiFontStringHelper
 from arg.Aggregation import argExodusAggregator, argVTKSTLAggregator
@@ -302,7 +303,7 @@ class argBackendBase:
                     caption_string, False)
 
         # Generate meta-data for Exodus mesh
-        elif data_type == "ExodusII":
+        elif data_type in ("ExodusII", "HDF5ExodusII"):
             # Retrieve base name of file
             file_name = os.path.basename(datafile)
 
@@ -495,6 +496,9 @@ class argBackendBase:
             # Unsupported data type
             print("[argBackendBase] Unknown aggregation data type: {}")
 
+        # Record artifacts generated by aggregator in manifest
+        argTools.record_checked_artifacts(self.Parameters.OutputDir)
+
     def fetch_image_and_caption(self, arguments):
         """Retrieve image and associated caption for figure creation
         """
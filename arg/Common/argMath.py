@@ -36,21 +36,106 @@
 #
 #HEADER
 
+import math
+
+import numpy as np
+
+
+def get_histogram_bin_indices(values, v_range, n_bins):
+    """Retrieve indices of uniform bins spanning v_range containing values
+       NB: values outside of range are assigned to extreme bins
+    """
+
+    # Clip values to range before scaling them to bin indices
+    v_min, v_max = v_range
+    indices = ((np.clip(values, v_min, v_max) - v_min) * (n_bins / (v_max - v_min))).astype(int)
+
+    # Upper range bound belongs to last bin
+    return np.minimum(indices, n_bins - 1)
+
+
+def create_histogram(values, v_range, n_bins):
+    """Create histogram of values with n_bins uniform bins spanning v_range
+       NB: values outside of range are accounted for in extreme bins whereas
+           non-finite values are ignored
+    """
+
+    # Ensure that histogram range is not degenerate
+    v_min, v_max = float(v_range[0]), float(v_range[1])
+    if not v_max > v_min:
+        v_min, v_max = v_min - .5, v_min + .5
+
+    # Count finite values within uniform bins
+    values = np.asarray(values)
+    counts = np.bincount(
+        get_histogram_bin_indices(values[np.isfinite(values)], (v_min, v_max), n_bins),
+        minlength=n_bins)
+
+    # Return histogram with its bins definition
+    return {"range": (v_min, v_max), "counts": counts}
+
+
+def get_histogram_bin_edges(h):
+    """Retrieve bin edges of histogram
+    """
+
+    # Bins are uniform across histogram range
+    return np.linspace(h["range"][0], h["range"][1], len(h["counts"]) + 1)
+
+
 def aggregate_histograms(h_1, h_2):
     """Aggregate two histograms
-       It is assumed that second histogram is a non-void dict
+       It is assumed that second histogram is a non-void histogram
+       NB: histograms with different bins are merged onto the union of both
+           ranges by spreading counts of each bin over overlapping target bins
+           in proportion to overlap, i.e. assuming uniform density within bins;
+           aggregated ranges are float tuples and counts are float arrays
     """
 
     # Nothing to aggregate if first histogram is empty
+    r_2 = tuple(map(float, h_2["range"]))
     if not h_1:
-        return dict(h_2)
+        return {"range": r_2, "counts": np.array(h_2["counts"], dtype=float)}
 
-    # Build set union of histogram keys
-    s_keys = set(h_1) | set(h_2)
+    # Exact aggregation when histograms share their bins, regardless of range container types
+    r_1 = tuple(map(float, h_1["range"]))
+    if r_1 == r_2 and len(h_1["counts"]) == len(h_2["counts"]):
+        return {"range": r_1, "counts": np.add(h_1["counts"], h_2["counts"], dtype=float)}
 
-    # Return aggregated histogram
-    return {
-        k: h_1.get(k, 0) + h_2.get(k, 0) for k in s_keys}
+    # Otherwise re-bin both histograms onto union of ranges
+    v_range = (min(r_1[0], r_2[0]), max(r_1[1], r_2[1]))
+    n_bins = max(len(h_1["counts"]), len(h_2["counts"]))
+    edges = np.linspace(v_range[0], v_range[1], n_bins + 1)
+    counts = np.zeros(n_bins)
+    for h in (h_1, h_2):
+        # Interpolate piecewise linear cumulative counts at target bin edges
+        cumulative = np.concatenate(([0.], np.cumsum(h["counts"], dtype=float)))
+        counts += np.diff(np.interp(edges, get_histogram_bin_edges(h), cumulative))
+
+    # Return re-binned aggregated histogram
+    return {"range": v_range, "counts": counts}
+
+
+def compute_descriptive_statistics(values):
+    """Compute descriptive statistics (min/mean/max/M2/card) of values,
+       with M2 as unbiased variance estimator for cardinalities above 1
+       NB: non-finite values are ignored and empty list returned if none remains
+    """
+
+    # Nothing to compute if no finite values are present
+    values = np.asarray(values, dtype=float).ravel()
+    values = values[np.isfinite(values)]
+    if not len(values):
+        return []
+
+    # Return statistics as Python floats
+    n = len(values)
+    return [
+        float(values.min()),
+        float(values.mean()),
+        float(values.max()),
+        float(values.var(ddof=1)) if n > 1 else 0.,
+        float(n)]
 
 
 def aggregate_descriptive_statistics(s_1, s_2):
@@ -91,3 +176,112 @@ def aggregate_descriptive_statistics(s_1, s_2):
         max(s_1[2], s_2[2]),
         M2 / (n_tot - 1) if n_tot > 1 else M2,
         n_tot]
+
+
+def aggregate_descriptive_statistics_array(stats):
+    """Aggregate (k x 5) array of sets of descriptive statistics
+       (min/mean/max/M2/card) in a single vectorized pass, skipping empty sets
+       NB: as with aggregate_descriptive_statistics, M2 entries are assumed
+           to be unbiased variance estimators for cardinalities above 1
+    """
+
+    # Nothing to aggregate if no set of statistics is non-empty
+    stats = np.asarray([s for s in stats if len(s)], dtype=float).reshape(-1, 5)
+    stats = stats[stats[:, 4] > 0]
+    if not len(stats):
+        return []
+
+    # Compute global cardinality and mean
+    n = stats[:, 4]
+    n_tot = n.sum()
+    mean = (n * stats[:, 1]).sum() / n_tot
+
+    # Retrieve M2 aggregates and compute global one
+    M2 = np.where(n > 1, stats[:, 3] * (n - 1), stats[:, 3]).sum()
+    M2 += (n * (stats[:, 1] - mean) ** 2).sum()
+
+    # Return aggregated statistics
+    return [
+        float(stats[:, 0].min()),
+        float(mean),
+        float(stats[:, 2].max()),
+        float(M2 / (n_tot - 1) if n_tot > 1 else M2),
+        float(n_tot)]
+
+
+def compress_quantile_sketch(means, weights, v_min, v_max, compression):
+    """Merge sorted weighted centroids into as many as compression allows,
+       more of them being kept near extreme quantiles (t-digest)
+    """
+
+    # Map cumulative weights to centroid indices with arcsine scale function
+    cumulative = np.cumsum(weights)
+    k = compression / (2. * math.pi) * np.arcsin(
+        np.clip(2. * cumulative / cumulative[-1] - 1., -1., 1.))
+
+    # Merge centroids with same integral scaled index
+    groups = np.floor(k + .25 * compression)
+    starts = np.flatnonzero(np.diff(groups, prepend=-1.))
+    merged_weights = np.add.reduceat(weights, starts)
+    merged_means = np.add.reduceat(weights * means, starts) / merged_weights
+
+    # Return quantile sketch
+    return {
+        "means": merged_means,
+        "weights": merged_weights,
+        "min": float(v_min),
+        "max": float(v_max),
+        "compression": compression}
+
+
+def create_quantile_sketch(values, compression=100):
+    """Create mergeable quantile sketch of values with about compression / 2
+       centroids, from which quantiles can be estimated
+       NB: non-finite values are ignored and empty sketch returned if none is left
+    """
+
+    # Nothing to sketch without finite values
+    values = np.asarray(values, dtype=float).ravel()
+    values = np.sort(values[np.isfinite(values)])
+    if not values.size:
+        return {}
+
+    # Return compressed sketch of sorted unit-weight values
+    return compress_quantile_sketch(
+        values, np.ones(values.size), values[0], values[-1], compression)
+
+
+def aggregate_quantile_sketches(s_1, s_2):
+    """Aggregate two quantile sketches, either of which may be empty
+    """
+
+    # Nothing to aggregate if either sketch is empty
+    if not s_1:
+        return dict(s_2)
+    if not s_2:
+        return dict(s_1)
+
+    # Sort union of centroids by means
+    means = np.concatenate((s_1["means"], s_2["means"]))
+    order = np.argsort(means, kind="stable")
+
+    # Return compressed aggregated sketch
+    return compress_quantile_sketch(
+        means[order],
+        np.concatenate((s_1["weights"], s_2["weights"]))[order],
+        min(s_1["min"], s_2["min"]),
+        max(s_1["max"], s_2["max"]),
+        s_1["compression"])
+
+
+def get_quantiles(sketch, quantiles):
+    """Estimate quantiles in [0, 1] from quantile sketch
+    """
+
+    # Interpolate between extrema and centroids at their cumulative mid-weights
+    weights = sketch["weights"]
+    total = weights.sum()
+    return np.interp(
+        np.asarray(quantiles) * total,
+        np.concatenate(([0.], np.cumsum(weights) - .5 * weights, [total])),
+        np.concatenate(([sketch["min"]], sketch["means"], [sketch["max"]])))
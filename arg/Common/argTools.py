@@ -36,6 +36,27 @@
 #
 #HEADER
 
+import concurrent.futures
+import hashlib
+import json
+import multiprocessing
+import os
+
+import numpy as np
+
+from arg import __version__
+from arg.DataInterface.argDataInterface import argDataInterface
+
+# Name of manifest file of generated artifacts in output directory
+ArtifactManifestFile = "artifact_manifest.json"
+
+# Request keys whose values name input files or partitions in data directory
+ArtifactInputKeys = ("model", "file", "files")
+
+# Keys and prior modification times of keyed artifact files checked for reuse
+checked_artifacts = {}
+
+
 def update_or_create_dict_in_dict(dict_of_dicts, key1, key2, value, update_fct):
     """Update or create dict entry in a dict with given primary and
        secondary keys, and value to be used by provided updating function
@@ -76,3 +97,243 @@ def map_composite_keys(in_dict, key1, separator):
 
     # Return result
     return out_dict
+
+
+def create_process_pool(n_workers, initializer=None, initargs=()):
+    """Create pool of worker processes when more than one worker is requested,
+       with all available cores used for non-positive numbers of workers,
+       each worker calling initializer with initargs upon startup when given
+       NB: workers are spawned rather than forked so that they do not inherit
+           rendering contexts and open files of parent process
+    """
+
+    # Bail out early when serial execution is requested
+    if n_workers is None:
+        return None
+    n_workers = int(n_workers)
+    if n_workers < 1:
+        n_workers = os.cpu_count() or 1
+    if n_workers < 2:
+        return None
+
+    # Return pool of spawned worker processes
+    print("[argTools] Creating pool of {} worker processes".format(n_workers))
+    return concurrent.futures.ProcessPoolExecutor(
+        n_workers, mp_context=multiprocessing.get_context("spawn"),
+        initializer=initializer, initargs=initargs)
+
+
+def encode_nested_data(data, arrays):
+    """Encode nested dicts, lists, and tuples of scalars and NumPy arrays
+       into JSON-compatible data, with arrays appended to given dict of arrays
+    """
+
+    # Store arrays separately and refer to them by name
+    if isinstance(data, np.ndarray):
+        name = "a{}".format(len(arrays))
+        arrays[name] = data
+        return {"array": name}
+
+    # Encode containers recursively, keeping key types of dicts
+    if isinstance(data, dict):
+        return {"dict": [[encode_nested_data(k, arrays), encode_nested_data(v, arrays)]
+                         for k, v in data.items()]}
+    if isinstance(data, tuple):
+        return {"tuple": [encode_nested_data(v, arrays) for v in data]}
+    if isinstance(data, list):
+        return [encode_nested_data(v, arrays) for v in data]
+
+    # Convert NumPy scalars to Python ones
+    return data.item() if isinstance(data, np.generic) else data
+
+
+def decode_nested_data(data, arrays):
+    """Decode data encoded with encode_nested_data given its dict of arrays
+    """
+
+    # Decode tagged containers and arrays recursively
+    if isinstance(data, dict):
+        if "array" in data:
+            return arrays[data["array"]]
+        if "tuple" in data:
+            return tuple(decode_nested_data(v, arrays) for v in data["tuple"])
+        return {decode_nested_data(k, arrays): decode_nested_data(v, arrays)
+                for k, v in data["dict"]}
+    if isinstance(data, list):
+        return [decode_nested_data(v, arrays) for v in data]
+
+    # Return scalars as is
+    return data
+
+
+def iterate_strings(value):
+    """Iterate over all strings nested in lists, tuples, and dicts values
+    """
+
+    # Recurse into containers and yield strings
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, (list, tuple)):
+        for v in value:
+            yield from iterate_strings(v)
+    elif isinstance(value, dict):
+        for v in value.values():
+            yield from iterate_strings(v)
+
+
+def get_artifact_key(request_params, data_dir):
+    """Digest request parameters, identity of its input files, and ARG
+       version into a key identifying contents of its artifacts
+       NB: only values of input keys naming files or partitions in data
+           directory are considered as input files
+    """
+
+    # Collect identities of all input files referenced by request
+    inputs = {}
+    for value in iterate_strings([request_params.get(k) for k in ArtifactInputKeys]):
+        identity = argDataInterface.get_database_identity(os.path.join(data_dir, value))
+        if identity is not None:
+            inputs[value] = [list(i) for i in identity]
+
+    # Return digest of everything artifacts depend upon
+    key = {
+        "version": __version__,
+        "data_dir": os.path.abspath(data_dir),
+        "request": {k: v for k, v in request_params.items() if k not in ("regenerate", "artifact_key")},
+        "inputs": inputs}
+    return hashlib.sha1(
+        json.dumps(key, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def load_artifact_manifest(output_dir):
+    """Load manifest of output directory, mapping base names of artifacts
+       and names of image files to keys of requests which generated them
+       NB: return empty manifest when file is missing or corrupt
+    """
+
+    # Read JSON manifest
+    try:
+        with open(os.path.join(output_dir, ArtifactManifestFile), 'r', encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        manifest = {}
+
+    # Return well-formed sections only
+    if not isinstance(manifest, dict):
+        manifest = {}
+    return {section: manifest.get(section) if isinstance(manifest.get(section), dict) else {}
+            for section in ("artifacts", "images")}
+
+
+def save_artifact_manifest(output_dir, manifest):
+    """Save manifest into output directory
+    """
+
+    # Write JSON manifest atomically
+    file_name = os.path.join(output_dir, ArtifactManifestFile)
+    try:
+        write_file_atomically(file_name, lambda f: f.write(
+            json.dumps(manifest, sort_keys=True, indent=1).encode("utf-8")))
+    except OSError as e:
+        print("*  WARNING: could not save artifact manifest {}: {}".format(
+            file_name, e))
+
+
+def is_artifact_reusable(file_name, request_params):
+    """Check whether existing artifact file may be reused for given request
+       NB: existing files are not reused when request demands regeneration,
+           nor when request is keyed and file is not recorded in manifest of
+           its directory with same key
+    """
+
+    # Reuse file if present unless regeneration was requested
+    reusable = os.path.isfile(file_name) and not request_params.get("regenerate")
+    key = request_params.get("artifact_key")
+    if key is None:
+        return reusable
+
+    # Keep track of keyed file so that it can be recorded once generated
+    checked_artifacts[file_name] = (
+        key, os.stat(file_name).st_mtime_ns if os.path.isfile(file_name) else None)
+
+    # Reuse file only if recorded with same key
+    dir_name, base_name = os.path.split(file_name)
+    return reusable and load_artifact_manifest(dir_name)["images"].get(base_name) == key
+
+
+def record_checked_artifacts(output_dir):
+    """Record keys of checked artifact files written since they were checked in
+       manifest of output directory, pruning entries of removed files
+    """
+
+    # Record files present in output directory which were written since checked
+    manifest = load_artifact_manifest(output_dir)
+    images = manifest["images"]
+    for file_name, (key, mtime) in list(checked_artifacts.items()):
+        dir_name, base_name = os.path.split(file_name)
+        if os.path.abspath(dir_name) != os.path.abspath(output_dir):
+            continue
+        del checked_artifacts[file_name]
+        if os.path.isfile(file_name) and os.stat(file_name).st_mtime_ns != mtime:
+            images[base_name] = key
+
+    # Save manifest without entries of removed files
+    manifest["images"] = {
+        base_name: key for base_name, key in images.items()
+        if os.path.isfile(os.path.join(output_dir, base_name))}
+    save_artifact_manifest(output_dir, manifest)
+
+
+def write_file_atomically(file_name, write):
+    """Write binary file with given writing function through a temporary file
+       so that concurrent readers never see partial contents
+    """
+
+    # Replace file only once temporary file was fully written
+    tmp_name = "{}.{}.tmp".format(file_name, os.getpid())
+    try:
+        with open(tmp_name, "wb") as f:
+            write(f)
+        os.replace(tmp_name, file_name)
+
+    # Do not leave partial temporary file behind upon failure
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.remove(tmp_name)
+        raise
+
+
+def save_nested_data(file_base, data, index=None):
+    """Save nested data as a JSON index file with optional index entries,
+       and a compressed NumPy archive of its arrays
+       NB: files are replaced atomically so that concurrent readers never see partial data
+    """
+
+    # Encode data and separate arrays from it
+    arrays = {}
+    encoded = {"index": index, "data": encode_nested_data(data, arrays)}
+
+    # Write archive first as index marks data as complete
+    for suffix, write in (
+            (".npz", lambda f: np.savez_compressed(f, **arrays)),
+            (".json", lambda f: f.write(json.dumps(encoded).encode("utf-8")))):
+        write_file_atomically(file_base + suffix, write)
+
+
+def load_nested_data(file_base):
+    """Load nested data saved with save_nested_data
+       NB: return index entries and data, or None when files are missing or corrupt
+    """
+
+    # Read JSON index and NumPy archive
+    try:
+        with open(file_base + ".json", 'r', encoding="utf-8") as f:
+            encoded = json.load(f)
+        with np.load(file_base + ".npz", allow_pickle=False) as npz:
+            arrays = {k: npz[k] for k in npz.files}
+
+        # Return index and decoded data
+        return encoded["index"], decode_nested_data(encoded["data"], arrays)
+
+    except Exception:
+        return None
@@ -36,16 +36,242 @@
 #
 #HEADER
 
+import collections
 import importlib
+import os
+import threading
 
 
 class argDataInterface:
 
+    # Process-wide registry of live data interfaces, least recently used first
+    Registry = collections.OrderedDict()
+
+    # Maximum number of live data interfaces kept in registry
+    RegistryCapacity = 8
+
+    # Memory budget in bytes shared by cached items of all data interfaces
+    MemoryBudget = 512 * 1024 * 1024
+
+    # Sizes of cached items keyed by owner and item key, least recently used first
+    CachedItems = collections.OrderedDict()
+    CachedSize = 0
+
+    # Cached items may be accessed from prefetching threads
+    CacheLock = threading.RLock()
+
+    @staticmethod
+    def make_hashable(value):
+        """Convert possibly nested lists and dicts into hashable tuples
+        """
+
+        if isinstance(value, dict):
+            return tuple(sorted(
+                (k, argDataInterface.make_hashable(v)) for k, v in value.items()))
+        elif isinstance(value, (list, tuple, set)):
+            return tuple(argDataInterface.make_hashable(v) for v in value)
+        else:
+            return value
+
+    @staticmethod
+    def get_database_identity(database_name):
+        """Return identity of file or partition from sizes and modification times
+           NB: return None when identity cannot be determined, e.g. for directories
+        """
+
+        # Single file
+        if os.path.isfile(database_name):
+            stat = os.stat(database_name)
+            return ((os.path.basename(database_name), stat.st_mtime_ns, stat.st_size),)
+
+        # Directory contents may change without changing its own identity
+        if os.path.isdir(database_name):
+            return None
+
+        # Otherwise collect all files whose name extend that of a partition
+        dir_name, base_name = os.path.split(database_name)
+        try:
+            file_names = sorted(
+                f for f in os.listdir(dir_name or '.') if f.startswith(base_name + '.'))
+        except OSError:
+            return None
+        if not file_names:
+            return None
+        identity = []
+        for f in file_names:
+            stat = os.stat(os.path.join(dir_name, f))
+            identity.append((f, stat.st_mtime_ns, stat.st_size))
+        return tuple(identity)
+
+    @staticmethod
+    def make_registry_key(data_type, database_name, *parameters):
+        """Assemble registry key from data type, database, parameters, and identity
+        """
+
+        # Return None when database identity is unknown
+        identity = argDataInterface.get_database_identity(database_name)
+        if identity is None:
+            return None
+
+        # Return None when parameters cannot be hashed
+        try:
+            key = (data_type,
+                   os.path.abspath(database_name),
+                   argDataInterface.make_hashable(parameters),
+                   identity)
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    @staticmethod
+    def release(data_interface):
+        """Release files, processes, and cached items held by data interface
+           NB: data interfaces without close method hold nothing to release
+        """
+
+        # Close data interface if it can be closed
+        close = getattr(data_interface, "close", None)
+        if close:
+            close()
+
+    @staticmethod
+    def set_registry_capacity(capacity):
+        """Set maximum number of live data interfaces, evicting oldest ones if needed
+        """
+
+        argDataInterface.RegistryCapacity = max(0, int(capacity))
+        while len(argDataInterface.Registry) > argDataInterface.RegistryCapacity:
+            argDataInterface.release(argDataInterface.Registry.popitem(last=False)[1])
+
+    @staticmethod
+    def evict(data_type=None, database_name=None):
+        """Evict registered data interfaces matching type and/or database if provided
+           NB: return number of evicted data interfaces
+        """
+
+        # Collect keys matching provided criteria
+        abs_name = os.path.abspath(database_name) if database_name else None
+        keys = [k for k in argDataInterface.Registry
+                if (data_type is None or k[0] == data_type)
+                and (abs_name is None or k[1] == abs_name)]
+
+        # Remove matching entries from registry and release them
+        for k in keys:
+            argDataInterface.release(argDataInterface.Registry.pop(k))
+        return len(keys)
+
+    @staticmethod
+    def clear_registry():
+        """Evict and release all registered data interfaces
+        """
+
+        while argDataInterface.Registry:
+            argDataInterface.release(argDataInterface.Registry.popitem(last=False)[1])
+
+    @staticmethod
+    def set_memory_budget(n_bytes):
+        """Set memory budget in bytes shared by cached items of all data
+           interfaces, evicting least recently used ones exceeding it
+        """
+
+        with argDataInterface.CacheLock:
+            argDataInterface.MemoryBudget = max(0, int(n_bytes))
+            argDataInterface.evict_cached_items(0)
+
+    @staticmethod
+    def retain_cached_item(owner, key, size):
+        """Account for item of given size cached by owner under given key,
+           evicting least recently used items of any owner until it fits
+           NB: return False when item cannot fit in budget, in which case
+               owner shall not keep it
+        """
+
+        # Items which cannot fit in memory budget are not retained
+        if size > argDataInterface.MemoryBudget:
+            return False
+
+        # Make room for item then account for it
+        with argDataInterface.CacheLock:
+            argDataInterface.release_cached_item(owner, key)
+            argDataInterface.evict_cached_items(size)
+            argDataInterface.CachedItems[(owner, key)] = size
+            argDataInterface.CachedSize += size
+        return True
+
+    @staticmethod
+    def touch_cached_item(owner, key):
+        """Mark item cached by owner under given key as most recently used
+        """
+
+        with argDataInterface.CacheLock:
+            if (owner, key) in argDataInterface.CachedItems:
+                argDataInterface.CachedItems.move_to_end((owner, key))
+
+    @staticmethod
+    def release_cached_item(owner, key):
+        """Stop accounting for item cached by owner under given key if any
+        """
+
+        with argDataInterface.CacheLock:
+            argDataInterface.CachedSize -= argDataInterface.CachedItems.pop((owner, key), 0)
+
+    @staticmethod
+    def release_cached_items(owner):
+        """Stop accounting for all items cached by owner
+        """
+
+        with argDataInterface.CacheLock:
+            for item in [i for i in argDataInterface.CachedItems if i[0] is owner]:
+                argDataInterface.CachedSize -= argDataInterface.CachedItems.pop(item)
+
+    @staticmethod
+    def evict_cached_items(size):
+        """Evict least recently used items until given size fits in budget
+           NB: owners are asked to discard evicted items
+        """
+
+        with argDataInterface.CacheLock:
+            while (argDataInterface.CachedItems
+                   and argDataInterface.CachedSize + size > argDataInterface.MemoryBudget):
+                (owner, key), evicted_size = argDataInterface.CachedItems.popitem(last=False)
+                argDataInterface.CachedSize -= evicted_size
+                owner.discard_cached_item(key)
+
+    @staticmethod
+    def get_numeric_Exodus_data_type(database_name):
+        """Return ExodusII data type best suited to array-only workloads,
+           i.e. bypassing VTK when files are stored as HDF5
+        """
+
+        # Prefer native reader when available and applicable
+        try:
+            argHDF5ExodusReader = getattr(
+                importlib.import_module("arg.DataInterface.argHDF5ExodusReader"),
+                "argHDF5ExodusReader")
+            if argHDF5ExodusReader.is_HDF5_database(database_name):
+                return "HDF5ExodusII"
+        except (ImportError, OSError):
+            pass
+
+        # Otherwise fall back to VTK reader
+        return "ExodusII"
+
     @staticmethod
     def factory(data_type, database_name, *parameters):
-        """Produce the necessary concrete data interface instance
+        """Produce the necessary concrete data interface instance, reusing
+           live instance when one is registered for same data and parameters
         """
 
+        # Return registered instance if data and parameters are unchanged
+        key = argDataInterface.make_registry_key(data_type, database_name, *parameters)
+        if key in argDataInterface.Registry:
+            argDataInterface.Registry.move_to_end(key)
+            print("[argDataInterface] Reusing {} reader for {}".format(
+                data_type,
+                database_name))
+            return argDataInterface.Registry[key]
+
         # Initialize return object
         ret_object = None
 
@@ -83,6 +309,16 @@ class argDataInterface:
             except:
                 print("*  WARNING: could not import module argVTKExodusReader. Ignoring it.")
 
+        # ExodusII file or partition stored as HDF5, read without VTK
+        elif data_type == "HDF5ExodusII":
+            try:
+                argHDF5ExodusReader = getattr(
+                    importlib.import_module("arg.DataInterface.argHDF5ExodusReader"),
+                    "argHDF5ExodusReader")
+                ret_object = argHDF5ExodusReader(database_name, *parameters)
+            except:
+                print("*  WARNING: could not import module argHDF5ExodusReader. Ignoring it.")
+
         # STL file
         elif data_type == "vtkSTL":
             try:
@@ -98,6 +334,11 @@ class argDataInterface:
             print("[argDataInterface] Instantiated {} reader for {}".format(
                 data_type,
                 database_name))
+
+            # Register instance and evict least recently used ones if needed
+            if key is not None and argDataInterface.RegistryCapacity:
+                argDataInterface.Registry[key] = ret_object
+                argDataInterface.set_registry_capacity(argDataInterface.RegistryCapacity)
         else:
             print("[argDataInterface] Could not instantiate {} reader for {}".format(
                 data_type,
@@ -0,0 +1,380 @@
+#HEADER
+#                 arg/DataInterface/argExodusReaderBase.py
+#               Automatic Report Generator (ARG) v. 1.0
+#
+# Copyright 2020 National Technology & Engineering Solutions of Sandia, LLC
+# (NTESS). Under the terms of Contract DE-NA0003525 with NTESS, the U.S.
+# Government retains certain rights in this software.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# Questions? Visit gitlab.com/AutomaticReportGenerator/arg
+#
+#HEADER
+
+import collections
+import copy
+import itertools
+import math
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from arg.Common.argInformationObject import argInformationObject
+from arg.DataInterface.argDataInterfaceBase import argDataInterfaceBase
+
+
+class argExodusReaderBase(argDataInterfaceBase):
+    """A base class for data interfaces to ExodusII files or partitions
+    """
+
+    @staticmethod
+    def get_partition_file_names(database_name):
+        """Retrieve names of all files contained in partition with given base name
+        """
+
+        # Check whether base name is that of a partition
+        try:
+            # Base name corresponds to a set of parallel files
+            n_files = int(database_name.split('.')[-1])
+        except ValueError:
+            # Partition name is inconsistent with naming convention
+            print("** ERROR: partition name {} is not consistent with naming convention. Exiting.".format(
+                database_name))
+            sys.exit(1)
+
+        # Compute number of digits for possible 0-padding
+        l_pad = int(math.ceil(math.log10(n_files)))
+
+        # Iterate over files contained in partition
+        subset_names = []
+        for i in range(n_files):
+            # Try first with padd index, then with raw index
+            found_subset = False
+            for suffix in [("%s" % i).rjust(l_pad, '0'), "%s" % i]:
+                # Assemble name of subset file
+                subset_name = database_name + '.' + suffix
+
+                # Verify whether expected subset file is found
+                if os.path.isfile(subset_name):
+                    # Break out if subset is found with current padding/non-padding convention
+                    subset_names.append(subset_name)
+                    found_subset = True
+                    break
+
+            # Partition naming convention is inconsistent with possible subset file names
+            if not found_subset:
+                print("** ERROR: partition name is {} but file with index {} was not found. Exiting.".format(
+                    database_name, i))
+                sys.exit(1)
+
+        # Return names of all subset files
+        return subset_names
+
+    def get_block_IDs(self, ignored_blocks=None):
+        """Get IDs of element blocks across all partitions in file order, except ignored ones
+        """
+
+        # Collect block IDs of all partitions once
+        block_IDs = []
+        for r_meta in self.get_meta_information_snapshots():
+            block_IDs += [b_id for b_id in r_meta["block IDs"]
+                          if b_id not in block_IDs and b_id not in (ignored_blocks or ())]
+
+        # Return block IDs
+        return block_IDs
+
+    def iter_time_steps(self, var_name=None, steps=None, prefetch=1, ignored_blocks=None, by_block=False):
+        """Iterate over (step, data) pairs for given or all time steps, where data is
+           read by read_time_step while up to prefetch next steps are read in background
+        """
+
+        # Iterate over all time steps unless specified
+        if steps is None:
+            steps = range(len(self.get_available_times()))
+
+        # Read synchronously when prefetching is disabled
+        if prefetch < 1:
+            for step in steps:
+                yield step, self.read_time_step(step, var_name, ignored_blocks, by_block)
+            return
+
+        # Read steps in background thread, bounding window of pending reads
+        steps = iter(steps)
+        pending = collections.deque()
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="argExodusPrefetch") as executor:
+            try:
+                # Submit first step and first window of prefetched ones
+                for step in itertools.islice(steps, prefetch + 1):
+                    pending.append((step, executor.submit(
+                        self.read_time_step, step, var_name, ignored_blocks, by_block)))
+
+                # Yield oldest read step then submit next one
+                while pending:
+                    step, future = pending.popleft()
+                    yield step, future.result()
+                    for next_step in itertools.islice(steps, 1):
+                        pending.append((next_step, executor.submit(
+                            self.read_time_step, next_step, var_name, ignored_blocks, by_block)))
+            finally:
+                # Cancel pending reads when iteration is interrupted
+                for _, future in pending:
+                    future.cancel()
+
+    def get_meta_information(self):
+        """Retrieve meta-information from data
+        """
+
+        # Return copy so that callers cannot alter snapshots
+        return copy.deepcopy(self.get_meta_information_snapshots())
+
+    def get_property_information(self, prop_type, prop_items=None):
+        """Retrieve all information about given sproperty from ExodusII file
+        """
+
+        # Not implemented for ExodusII data yet
+        print("*  WARNING: ExodusII property information getter not implemented yet")
+
+        # Returned information is dictionary of lists of lists
+        info_obj = argInformationObject("arg_dict_lists_lists")
+
+        # Return computed information object
+        return info_obj
+
+    def initialize_attribute(self):
+        """Initialize attribute properties
+        """
+
+        # Name of considered attribute
+        self.AttributeName = None
+
+        # Attribute can be bound to points or cells
+        self.AttributeBinding = None
+
+        # Variable type can be scalar or 3D vector
+        self.AttributeType = None
+
+        # Data is supposed to be pseudo-continuous by default
+        self.Discrete = False
+
+    def is_attribute_discrete(self):
+        """Tell whether attribute is discrete or (pseudo) continuous
+        """
+
+        return self.Discrete
+
+    def get_attribute_type(self):
+        """Return attribute binding
+        """
+
+        return self.AttributeBinding
+
+    def get_variable_type(self):
+        """Return variable type
+        """
+
+        return self.AttributeType
+
+    def get_variable_time_slice(self, t, var_name, modulus=False):
+        """Get time slice of given variable as a list of values
+        """
+
+        # Retrieve values as an array and convert them to Python types
+        values = self.get_variable_time_slice_array(t, var_name, modulus)
+        if values.ndim > 1:
+            return [tuple(v) for v in values.tolist()]
+        else:
+            return values.tolist()
+
+    def summarize(self, **args):
+        """Create summary as specified by arguments
+        """
+
+        # Return copy of summary when already built
+        summary_type = args.get("type")
+        summary_key = (summary_type, args.get("set_type"))
+        if summary_key in self.Summaries:
+            return copy.deepcopy(self.Summaries[summary_key])
+
+        # Initialize return header and body
+        header_list, body_dict = [], {}
+
+        # Call appropriate summarization method
+        if summary_type == "topology":
+            header_list, body_dict = self.summarize_topology()
+        elif summary_type == "blocks":
+            header_list, body_dict = self.summarize_blocks()
+        elif summary_type == "sets":
+            header_list, body_dict = self.summarize_sets(args.get("set_type"))
+        elif summary_type == "variable":
+            header_list, body_dict = self.summarize_variable()
+        else:
+            print("*  WARNING: incorrect summary type {} for argVTKExodusReader")
+
+        # Memoize summary then return copy of its header and body
+        self.Summaries[summary_key] = (header_list, body_dict)
+        return copy.deepcopy(self.Summaries[summary_key])
+
+    def summarize_topology(self):
+        """Create a summary of Exodus II mesh topology in the form of a
+        table abstraction with a header list and a dict of contents
+        """
+
+        # Retrieve meta-information snapshots
+        meta_info = self.get_meta_information_snapshots()
+        
+        # Iterate over all readers to aggregate topological properties
+        n_nodes = 0
+        n_elems = 0
+        for r in meta_info:
+            n_nodes += r.get("nodes")
+            n_elems += r.get("elements")
+
+        # Keep track of first reader which contains all shared information
+        reader_meta = meta_info[0]
+
+        # Create table header
+        header_list = ["item", "number"]
+
+        # Build table body
+        body_dict = {
+            "Exodus II files": [len(meta_info)],
+            "nodes": [n_nodes],
+            "elements": [n_elems]
+        }
+
+        # Retrieve block IDs if any
+        n = len(reader_meta.get("block IDs"))
+        if n:
+            body_dict["element blocks"] = [n]
+
+        # Retrieve number of node sets if any
+        n = len(list(reader_meta.get("node sets")))
+        if n:
+            body_dict["node sets"] = [n]
+
+        # Retrieve number of side sets if any
+        n = len(list(reader_meta.get("side sets")))
+        if n:
+            body_dict["side sets"] = [n]
+
+        # Retrieve number of time-steps if any
+        n = reader_meta.get("time-steps")
+        if n > 1:
+            body_dict["time-steps"] = [n]
+
+        # Retrieve number of node fields if any
+        n = len(list(reader_meta.get("node fields")))
+        if n:
+            body_dict["node fields"] = [n]
+
+        # Retrieve number of element fields if any
+        n = len(list(reader_meta.get("element fields")))
+        if n:
+            body_dict["element fields"] = [n]
+
+        # Return summary table
+        return header_list, body_dict
+
+    def summarize_blocks(self):
+        """Create a summary of Exodus II mesh blocks in the form of a
+        table abstraction with a header list and a dict of contents
+        """
+
+        # Retrieve meta-information snapshots
+        meta_info = self.get_meta_information_snapshots()
+
+        # Keep track of first reader which contains all shared information
+        reader_meta = meta_info[0]
+
+        # Retrieve list of block names and bail out early if empty
+        block_names = reader_meta.get("block names")
+        if not block_names:
+            return None, None
+
+        # Generate block ID, name, and type rows
+        body_dict = {i: [v]
+                     for i, v in zip(
+                reader_meta.get("block IDs"), block_names)}
+
+        # Return summary table
+        return ["block ID", "block name"], body_dict
+
+    def summarize_sets(self, set_type):
+        """Create a summary of Exodus II node or side sets in the form of a
+        table abstraction with a header list and a dict of contents
+        """
+
+        # Sanity check
+        if set_type not in ("node", "side"):
+            return None, None
+
+        # Retrieve meta-information snapshots
+        meta_info = self.get_meta_information_snapshots()
+
+        # Keep track of first reader which contains all shared information
+        reader_meta = meta_info[0]
+
+        # Retrieve list of node or side sets and bail out early if empty
+        set_names = reader_meta.get("{} sets".format(set_type))
+        if not set_names:
+            return None, None
+
+        # Generate node/side set ID, and name
+        set_IDs = reader_meta.get("{} set IDs".format(set_type))
+        body_dict = {i: [v]
+                     for i, v in zip(set_IDs, set_names)}
+
+        # Return summary table
+        return ["{} set ID".format(set_type), "{} set name".format(set_type)], body_dict
+
+    def summarize_variable(self):
+        """Create a summary of Exodus II mesh variables in the form of a
+        table abstraction with a header list and a dict of contents
+        """
+
+        # Retrieve meta-information snapshots
+        meta_info = self.get_meta_information_snapshots()
+
+        # Keep track of first reader which contains all shared information
+        reader_meta = meta_info[0]
+
+        # Retrieve node-based variables
+        body_list = [[v, "NODAL"]
+                     for v in sorted(reader_meta.get("node fields"))]
+
+        # Retrieve element-based variables
+        for v in sorted(reader_meta.get("element fields")):
+            body_list.append([v, "ELEMENT"])
+
+        # Retrieve global variables
+        for v in sorted(reader_meta.get("global variables")):
+            body_list.append([v, "GLOBAL"])
+
+        # Return summary table
+        return ["variable", "type"], body_list
+        
@@ -0,0 +1,611 @@
+#HEADER
+#                arg/DataInterface/argHDF5ExodusReader.py
+#               Automatic Report Generator (ARG) v. 1.0
+#
+# Copyright 2020 National Technology & Engineering Solutions of Sandia, LLC
+# (NTESS). Under the terms of Contract DE-NA0003525 with NTESS, the U.S.
+# Government retains certain rights in this software.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# Questions? Visit gitlab.com/AutomaticReportGenerator/arg
+#
+#HEADER
+
+import os
+
+import h5py
+import numpy as np
+
+from arg.DataInterface.argExodusReaderBase import argExodusReaderBase
+
+
+class argHDF5ExodusReader(argExodusReaderBase):
+    """A concrete data interface to an ExodusII file based on h5py
+       NB: only ExodusII files stored as netCDF4/HDF5 are supported
+    """
+
+    # Name of generated array of element block IDs, as with VTK
+    ObjectIdArrayName = "ObjectId"
+
+    # Suffixes of components glued into vectors, as with VTK
+    ComponentSuffixes = ("x", "y", "z")
+
+    def __init__(self, *parameters):
+        """Default constructor: serial or parallel reader
+        """
+
+        # Initialize parallel HDF5 file names, opened upon first use
+        self.FileNames = []
+        self.OpenFiles = None
+
+        # Times are to be computed only if needed then cached
+        self.Times = None
+
+        # Meta-information is snapshot per file and summaries built once
+        self.MetaInformation = {}
+        self.Summaries = {}
+
+        # Per-block node orderings are computed only if needed then cached
+        self.BlockNodeOrders = {}
+
+        # Initialize attribute (only one can be handled at a time)
+        self.initialize_attribute()
+
+        # Retrieve dataset name
+        database_name = parameters[0]
+
+        # Retrieve name if variable of interest
+        var_name = parameters[1]
+
+        # Determine whether single file or group of files were requested
+        if os.path.isfile(database_name):
+            file_names = [database_name]
+        else:
+            file_names = self.get_partition_file_names(database_name)
+
+        # Open all files and take snapshot of their meta-information
+        self.FileNames = file_names
+        for file_name, f in zip(file_names, self.Files):
+            self.MetaInformation[file_name] = self.get_file_meta_information(f)
+
+        # Look for requested variable and determine its type
+        self.get_variable_from_files(var_name)
+
+    @staticmethod
+    def is_HDF5_database(database_name):
+        """Tell whether file or all files of a partition are stored as HDF5
+        """
+
+        # Single file
+        if os.path.isfile(database_name):
+            return h5py.is_hdf5(database_name)
+
+        # Otherwise check all files whose names extend that of a partition
+        dir_name, base_name = os.path.split(database_name)
+        try:
+            file_names = [f for f in os.listdir(dir_name or '.') if f.startswith(base_name + '.')]
+        except OSError:
+            return False
+        return bool(file_names) and all(
+            h5py.is_hdf5(os.path.join(dir_name, f)) for f in file_names)
+
+    @staticmethod
+    def get_dimension(f, dim_name):
+        """Get netCDF dimension length, 0 when absent
+        """
+
+        return f[dim_name].shape[0] if dim_name in f else 0
+
+    @staticmethod
+    def get_names(f, var_name):
+        """Get list of names stored as netCDF character array
+        """
+
+        # Bail out early if names are absent
+        if var_name not in f:
+            return []
+
+        # Join and decode characters of each name
+        return [b''.join(row).decode("utf-8", "ignore").strip("\x00 ")
+                for row in f[var_name][()]]
+
+    @staticmethod
+    def get_object_IDs_and_names(f, prop_name, names_name, default):
+        """Get IDs and names of blocks or sets, assigning default names as with VTK
+        """
+
+        # Bail out early if objects are absent
+        if prop_name not in f:
+            return [], []
+
+        # Retrieve IDs and names, possibly undefined
+        IDs = [int(i) for i in f[prop_name][()]]
+        names = argHDF5ExodusReader.get_names(f, names_name)
+        names += [''] * (len(IDs) - len(names))
+
+        # Return IDs and names
+        return IDs, [n if n else "{} ID: {}".format(default, i) for i, n in zip(IDs, names)]
+
+    @staticmethod
+    def glue_components(names, n_dim):
+        """Glue consecutive component names into vector names, as with VTK
+           NB: return list of glued names and lists of component indices
+        """
+
+        # Iterate over all names
+        glued, i = [], 0
+        suffixes = argHDF5ExodusReader.ComponentSuffixes[:n_dim]
+        while i < len(names):
+            # Check whether next names differ only by component suffixes
+            group = names[i:i + n_dim]
+            prefix = group[0][:-1]
+            if (n_dim > 1 and len(group) == n_dim and prefix
+                    and all(n[:-1] == prefix and n[-1].lower() == s for n, s in zip(group, suffixes))):
+                glued.append((prefix, list(range(i, i + n_dim))))
+                i += n_dim
+            else:
+                glued.append((names[i], [i]))
+                i += 1
+
+        # Return glued names and component indices
+        return glued
+
+    def get_file_meta_information(self, f):
+        """Retrieve meta-information from single file
+        """
+
+        # Initialize meta-information for this file
+        n_dim = self.get_dimension(f, "num_dim")
+        n_steps = f["time_whole"].shape[0] if "time_whole" in f else 0
+        r_meta = {"name": f.filename, "nodes": self.get_dimension(f, "num_nodes"),
+                  "edges": self.get_dimension(f, "num_edge"), "faces": self.get_dimension(f, "num_face"),
+                  "elements": self.get_dimension(f, "num_elem"), "time-steps": n_steps}
+
+        # Retrieve meta-information on element blocks
+        r_meta["block IDs"], r_meta["block names"] = self.get_object_IDs_and_names(
+            f, "eb_prop1", "eb_names", "Unnamed block")
+
+        # Retrieve meta-information on node, edge, and side sets
+        for s_type, s_key in (("node", "ns"), ("edge", "es"), ("side", "ss")):
+            r_meta["{} set IDs".format(s_type)], r_meta["{} sets".format(s_type)] = self.get_object_IDs_and_names(
+                f, "{}_prop1".format(s_key), "{}_names".format(s_key), "Unnamed set")
+
+        # Retrieve meta-information on fields
+        r_meta["global variables"] = self.get_names(f, "name_glo_var")
+        for field, names_name in (("node fields", "name_nod_var"),
+                                  ("edge fields", "name_edge_var"),
+                                  ("face fields", "name_face_var"),
+                                  ("element fields", "name_elem_var"),
+                                  ("node set fields", "name_nset_var"),
+                                  ("edge set fields", "name_eset_var"),
+                                  ("side set fields", "name_sset_var")):
+            r_meta[field] = [n for n, _ in self.glue_components(self.get_names(f, names_name), n_dim)]
+
+        # Return meta-information of file
+        return r_meta
+
+    @property
+    def Files(self):
+        """Return handles of all files, reopening them if they were closed
+        """
+
+        # Open files upon first use after construction or closing
+        if self.OpenFiles is None:
+            self.OpenFiles = [h5py.File(file_name, 'r') for file_name in self.FileNames]
+
+        # Return file handles
+        return self.OpenFiles
+
+    def close(self):
+        """Close all files, which are reopened if reader is used again
+        """
+
+        # Close files and release their handles
+        for f in self.OpenFiles or []:
+            f.close()
+        self.OpenFiles = None
+
+    def get_accessors(self):
+        """Return list of HDF5 file handles
+        """
+
+        return self.Files
+
+    def get_meta_information_snapshots(self):
+        """Retrieve meta-information snapshots of all files
+        """
+
+        return [self.MetaInformation[f.filename] for f in self.Files]
+
+    def get_available_times(self):
+        """Return variable time steps
+        """
+
+        # If time-steps where already cached return those
+        if self.Times:
+            return self.Times
+
+        # Otherwise, try to retrieve time-steps from first file
+        if not self.Files:
+            print("*  WARNING: no HDF5 files are available. No available timesteps")
+            self.Times = []
+        elif "time_whole" not in self.Files[0]:
+            self.Times = []
+        else:
+            self.Times = self.Files[0]["time_whole"][()].tolist()
+
+        # Return retrieved time steps
+        if self.Times:
+            print("[argDataInterface] Retrieved {} time-steps".format(
+                len(self.Times)))
+        else:
+            print("[argDataInterface] No time-steps available to reader")
+        return self.Times
+
+    def find_variable(self, f, var_name):
+        """Find variable binding and indices of its components in file
+           NB: return (None, None) when variable is not found
+        """
+
+        # Look for variable among nodal then element variables
+        n_dim = self.get_dimension(f, "num_dim")
+        for binding, names_name in (("point", "name_nod_var"), ("cell", "name_elem_var")):
+            for name, components in self.glue_components(self.get_names(f, names_name), n_dim):
+                if name == var_name:
+                    return binding, components
+
+        # Variable was not found
+        return None, None
+
+    def get_variable_from_files(self, var_name):
+        """Retrieve variable and its type from files
+        """
+
+        # Initialize attribute parameters
+        self.initialize_attribute()
+
+        # Check whether requested variable is block Id
+        if var_name == self.ObjectIdArrayName:
+            # Set data attribute properties
+            self.AttributeName = var_name
+            self.AttributeBinding = "cell"
+            self.AttributeType = "scalar"
+            self.Discrete = True
+
+            # Variable was found, break out early
+            print("[argDataInterface] Data array {} generated as block Ids".format(
+                var_name))
+            return
+
+        # Otherwise look for requested variable in first file
+        binding, components = self.find_variable(self.Files[0], var_name) if self.Files else (None, None)
+        if binding:
+            # Set data attribute properties
+            self.AttributeName = var_name
+            self.AttributeBinding = binding
+            self.AttributeType = "scalar" if len(components) == 1 else "vector3"
+            print("[argDataInterface] Data array {} found as {} attribute of type {}".format(
+                var_name,
+                self.AttributeBinding,
+                self.AttributeType))
+            return
+
+        # No variable was found if this point is reached
+        print("*  WARNING No data array {} found in dataset".format(
+            var_name))
+
+    def get_block_node_order(self, i_f, i_b):
+        """Get file node indices of element block in order of first appearance
+           in its connectivity, i.e. in order of VTK block points
+        """
+
+        # Compute node ordering only once
+        key = (i_f, i_b)
+        if key not in self.BlockNodeOrders:
+            f = self.Files[i_f]
+            conn_name = "connect{}".format(i_b + 1)
+            if conn_name in f:
+                conn = f[conn_name][()].ravel().astype(np.int64) - 1
+                nodes, first = np.unique(conn, return_index=True)
+                self.BlockNodeOrders[key] = nodes[np.argsort(first)]
+            else:
+                self.BlockNodeOrders[key] = np.empty(0, dtype=np.int64)
+
+        # Return node ordering
+        return self.BlockNodeOrders[key]
+
+    @staticmethod
+    def read_values(f, binding, k, i_b, steps, sel):
+        """Read hyperslab of values of variable component k at given steps
+           and at given increasing node or element block indices
+           NB: return None when values are not stored
+        """
+
+        # Nodal variables are stored either per variable or all together
+        if binding == "point":
+            var_name = "vals_nod_var{}".format(k + 1)
+            if var_name in f:
+                return f[var_name][steps, sel]
+            elif "vals_nod_var" in f:
+                return f["vals_nod_var"][steps, k, sel]
+            return None
+
+        # Element variables are stored per block when truth table allows
+        var_name = "vals_elem_var{}eb{}".format(k + 1, i_b + 1)
+        return f[var_name][steps, sel] if var_name in f else None
+
+    def get_leaves(self, var_name, blocks=None):
+        """Get element blocks carrying given variable in VTK traversal order
+           NB: return list of (file index, block index, block ID, binding, components, size)
+        """
+
+        # Iterate over all files and their non-empty element blocks
+        leaves = []
+        for i_f, f in enumerate(self.Files):
+            # Find variable within current file
+            if var_name == self.ObjectIdArrayName:
+                binding, components = "cell", None
+            else:
+                binding, components = self.find_variable(f, var_name)
+            if not binding:
+                continue
+
+            # Iterate over element blocks, restricted to requested ones if any
+            r_meta = self.MetaInformation[f.filename]
+            for i_b, b_id in enumerate(r_meta["block IDs"]):
+                n_elems = self.get_dimension(f, "num_el_in_blk{}".format(i_b + 1))
+                if not n_elems or (blocks is not None and b_id not in blocks):
+                    continue
+
+                # Skip blocks without values of element variable
+                if binding == "cell" and components and "vals_elem_var{}eb{}".format(
+                        components[0] + 1, i_b + 1) not in f:
+                    continue
+
+                # Append leaf with number of values it carries
+                size = len(self.get_block_node_order(i_f, i_b)) if binding == "point" else n_elems
+                leaves.append((i_f, i_b, b_id, binding, components, size))
+
+        # Return leaves
+        return leaves
+
+    def read_leaf_values(self, leaf, steps, local):
+        """Read values of leaf at given steps and local indices as
+           (number of steps x number of indices x number of components) array
+        """
+
+        # Block ID values are generated
+        i_f, i_b, b_id, binding, components, size = leaf
+        n_steps = len(range(*steps.indices(len(self.get_available_times())))) if isinstance(
+            steps, slice) else 1
+        if components is None:
+            return np.full((n_steps, len(local), 1), b_id, dtype=np.float64)
+
+        # Map local indices to increasing file indices as required by HDF5 selections
+        file_indices = self.get_block_node_order(i_f, i_b)[local] if binding == "point" else local
+        sel, inverse = np.unique(file_indices, return_inverse=True)
+
+        # Read contiguous hyperslab when selection spans most of it
+        if len(sel) and len(sel) > (sel[-1] - sel[0] + 1) // 2:
+            read_sel, read_inverse = slice(int(sel[0]), int(sel[-1]) + 1), sel[inverse] - sel[0]
+        else:
+            read_sel, read_inverse = sel, inverse
+
+        # Read and gather all components
+        values = np.empty((n_steps, len(local), len(components)))
+        f = self.Files[i_f]
+        for i_c, k in enumerate(components):
+            values[:, :, i_c] = np.reshape(
+                self.read_values(f, binding, k, i_b, steps, read_sel), (n_steps, -1))[:, read_inverse]
+
+        # Return values
+        return values
+
+    @staticmethod
+    def finalize_values(values, modulus):
+        """Pad 2D vectors to 3D as with VTK and optionally compute moduli
+           NB: values are expected with components as last axis
+        """
+
+        # Pad 2D vectors with zeros
+        if values.shape[-1] == 2:
+            values = np.concatenate((values, np.zeros(values.shape[:-1] + (1,))), axis=-1)
+
+        # Return either values or their moduli
+        if values.shape[-1] == 1:
+            return np.abs(values[..., 0]) if modulus else values[..., 0]
+        else:
+            return np.linalg.norm(values, axis=-1) if modulus else values
+
+    def read_time_step(self, step, var_name=None, ignored_blocks=None, by_block=False):
+        """Read given time step as NumPy array of variable, defaulting to attribute,
+           or as map from element block IDs to NumPy arrays if by_block
+        """
+
+        # Restrict blocks when some are ignored
+        blocks = self.get_block_IDs(ignored_blocks) if ignored_blocks else None
+
+        # Return values of variable
+        if by_block:
+            return self.get_variable_time_slice_block_arrays(step, var_name or self.AttributeName, False, blocks)
+        return self.get_variable_time_slice_array(step, var_name or self.AttributeName, False, blocks)
+
+    def get_variable_time_slice_array(self, t, var_name, modulus=False, blocks=None):
+        """Get time slice of given variable as a NumPy array
+           NB: values are ordered as with argVTKExodusReader, restricted to given block IDs if any
+        """
+
+        # Read whole leaves at given time step
+        arrays = [self.read_leaf_values(leaf, t if t > -1 else 0, np.arange(leaf[-1]))[0]
+                  for leaf in self.get_leaves(var_name, blocks)]
+
+        # Return empty array if no values were found
+        if not arrays:
+            return np.empty((0, 3) if self.AttributeType == "vector3" else (0,))
+
+        # Concatenate values and return either those or their moduli
+        return self.finalize_values(np.concatenate(arrays), modulus)
+
+    def get_variable_time_slice_block_arrays(self, t, var_name, modulus=False, blocks=None):
+        """Get time slice of given variable as a map from element block IDs to NumPy arrays
+           NB: values of all files are concatenated per block, restricted to given block IDs if any,
+               with values of nodes shared across partitions kept once
+        """
+
+        # Read whole leaves at given time step grouped by block
+        block_arrays, block_node_ids = {}, {}
+        for leaf in self.get_leaves(var_name, blocks):
+            i_f, i_b, b_id, binding = leaf[:4]
+            block_arrays.setdefault(b_id, []).append(
+                self.read_leaf_values(leaf, t if t > -1 else 0, np.arange(leaf[-1]))[0])
+
+            # Keep track of global node IDs when shared nodes may be present
+            if binding == "point" and len(self.Files) > 1:
+                f = self.Files[i_f]
+                nodes = self.get_block_node_order(i_f, i_b)
+                block_node_ids.setdefault(b_id, []).append(
+                    f["node_num_map"][()][nodes] if "node_num_map" in f else None)
+
+        # Concatenate values of each block
+        block_values = {}
+        for b_id, arrays in block_arrays.items():
+            values = np.concatenate(arrays)
+
+            # Keep first occurrence of each shared node when global IDs are available
+            node_ids = block_node_ids.get(b_id)
+            if node_ids and all(ids is not None for ids in node_ids):
+                values = values[np.unique(np.concatenate(node_ids), return_index=True)[1]]
+
+            # Return either values or their moduli
+            block_values[b_id] = self.finalize_values(values, modulus)
+        return block_values
+
+    def get_variable_time_series(self, var_name, indices, blocks=None, modulus=False):
+        """Get time series of given variable at given value indices as a
+           (number of time steps x number of indices) NumPy array
+           NB: indices refer to time slice values, restricted to given block IDs if any
+        """
+
+        # Retrieve available times and requested indices
+        times = self.get_available_times()
+        indices = np.atleast_1d(np.asarray(indices, dtype=np.int64))
+        leaves = self.get_leaves(var_name, blocks)
+        n_c = 1 if not leaves or leaves[0][4] is None else len(leaves[0][4])
+
+        # Initialize time series container
+        series = np.empty((len(times), len(indices), n_c))
+
+        # Bail out early if indices are not all within range
+        offsets = np.cumsum([0] + [leaf[-1] for leaf in leaves])
+        if not len(indices) or indices.min() < 0 or indices.max() >= offsets[-1]:
+            print("*  WARNING: value indices out of range [0, {}[ for variable {}".format(
+                offsets[-1], var_name))
+            return self.finalize_values(series[:, :0], modulus)
+
+        # Read hyperslabs of all time steps for each relevant leaf
+        i_leaves = np.searchsorted(offsets, indices, side="right") - 1
+        for i_l in np.unique(i_leaves):
+            sel = np.flatnonzero(i_leaves == i_l)
+            series[:, sel] = self.read_leaf_values(
+                leaves[i_l], slice(None), indices[sel] - offsets[i_l])
+
+        # Return either values or their moduli
+        return self.finalize_values(series, modulus)
+
+    def get_global_variable_time_series(self, var_name):
+        """Get time series of given global variable as a NumPy array
+           NB: return None when variable is not found
+        """
+
+        # Look for global variable in first file
+        f = self.Files[0] if self.Files else None
+        names = self.get_names(f, "name_glo_var") if f else []
+        if var_name not in names or "vals_glo_var" not in f:
+            print("*  WARNING No global variable {} found in dataset".format(
+                var_name))
+            return None
+
+        # Return global variable values at all time steps
+        return f["vals_glo_var"][:, names.index(var_name)]
+
+    def get_coordinates(self):
+        """Get node coordinates of all files as (number of nodes x 3) NumPy array
+        """
+
+        # Iterate over all files
+        arrays = []
+        for f in self.Files:
+            # Coordinates are stored either per dimension or all together
+            n_dim = self.get_dimension(f, "num_dim")
+            if "coordx" in f:
+                coords = [f["coord{}".format(c)][()] for c in "xyz"[:n_dim]]
+            elif "coord" in f:
+                coords = list(f["coord"][()][:n_dim])
+            else:
+                coords = []
+
+            # Pad missing dimensions with zeros
+            n_nodes = self.get_dimension(f, "num_nodes")
+            coords += [np.zeros(n_nodes)] * (3 - len(coords))
+            arrays.append(np.stack(coords, axis=1))
+
+        # Return concatenated coordinates
+        return np.concatenate(arrays) if arrays else np.empty((0, 3))
+
+    def get_block_connectivity(self, block_ID):
+        """Get 0-based connectivity of element block of all files as
+           (number of elements x number of nodes per element) NumPy array
+           NB: node indices refer to concatenated coordinates of all files
+        """
+
+        # Iterate over all files
+        arrays, offset = [], 0
+        for f in self.Files:
+            # Retrieve connectivity of block if present in file
+            b_IDs = self.MetaInformation[f.filename]["block IDs"]
+            conn_name = "connect{}".format(b_IDs.index(block_ID) + 1) if block_ID in b_IDs else None
+            if conn_name in f:
+                arrays.append(f[conn_name][()].astype(np.int64) - 1 + offset)
+            offset += self.get_dimension(f, "num_nodes")
+
+        # Return concatenated connectivities
+        return np.concatenate(arrays) if arrays else np.empty((0, 0), dtype=np.int64)
+
+    def get_ID_map(self, map_name):
+        """Get node or element ID map of all files, i.e. for map_name in
+           node_num_map or elem_num_map, defaulting to 1-based indices
+        """
+
+        # Iterate over all files
+        dim_name = "num_nodes" if map_name == "node_num_map" else "num_elem"
+        arrays = [f[map_name][()].astype(np.int64) if map_name in f
+                  else np.arange(1, self.get_dimension(f, dim_name) + 1)
+                  for f in self.Files]
+
+        # Return concatenated ID maps
+        return np.concatenate(arrays) if arrays else np.empty(0, dtype=np.int64)
@@ -36,23 +36,91 @@
 #
 #HEADER
 
-import math
+import collections
+import concurrent.futures
+import multiprocessing
 import os
-import sys
+import threading
+import time
 
+import numpy as np
+import vtkmodules.vtkCommonCore as vtkCommonCore
 import vtkmodules.vtkCommonDataModel as vtkCommonDataModel
 import vtkmodules.vtkCommonExecutionModel as vtkCommonExecutionModel
 import vtkmodules.vtkFiltersCore as vtkFiltersCore
+import vtkmodules.vtkFiltersGeometry as vtkFiltersGeometry
 import vtkmodules.vtkIOExodus as vtkIOExodus
+import vtkmodules.vtkParallelCore as vtkParallelCore
+from vtkmodules.util.numpy_support import numpy_to_vtk, vtk_to_numpy
 
-from arg.Common.argInformationObject import argInformationObject
-from arg.DataInterface.argDataInterfaceBase import argDataInterfaceBase
+from arg.DataInterface.argDataInterface import argDataInterface
+from arg.DataInterface.argExodusReaderBase import argExodusReaderBase
 
+# Readers of worker process, kept across reads by file name and displacement
+worker_readers = {}
 
-class argVTKExodusReader(argDataInterfaceBase):
+
+def read_VTK_reader_shard(settings, t):
+    """Read time step of partition in worker process with given reader settings
+       NB: output is returned marshaled along with worker PID, wall clock
+           interval, and elapsed time of read
+    """
+
+    # Create and keep reader upon first read of this partition
+    key = (settings["file"], settings["displace"])
+    reader = worker_readers.get(key)
+    if reader is None:
+        reader = vtkIOExodus.vtkExodusIIReader()
+        reader.SetFileName(settings["file"])
+        reader.SetApplyDisplacements(settings["displace"])
+        reader.UpdateInformation()
+        worker_readers[key] = reader
+
+    # Apply settings of parent reader which may have changed since last read
+    argVTKExodusReader.set_VTK_reader_settings(reader, settings)
+
+    # Read time step and keep track of elapsed time
+    start, wall_start = time.perf_counter(), time.time()
+    reader.SetTimeStep(t)
+    reader.Update()
+    elapsed, wall_end = time.perf_counter() - start, time.time()
+
+    # Marshal output so that it can be sent to parent process
+    buffer = vtkCommonCore.vtkCharArray()
+    vtkParallelCore.vtkCommunicator.MarshalDataObject(reader.GetOutput(), buffer)
+    return {"data": vtk_to_numpy(buffer).tobytes(),
+            "worker": os.getpid(),
+            "interval": (wall_start, wall_end),
+            "update": elapsed}
+
+
+class argVTKExodusReader(argExodusReaderBase):
     """A concrete data interface to an ExodusII file based on VTK
     """
 
+    # Number of worker processes used by new readers to read partitions concurrently
+    # NB: netCDF and HDF5 libraries bundled with VTK are not built thread-safe,
+    #     hence partitions are read in processes of their own
+    NumberOfWorkers = 1
+
+    # Lock serializing calls of all VTK readers of this process into netCDF and
+    # HDF5 libraries, shared by all instances as these hold process-wide state
+    NetCDFLock = threading.Lock()
+
+    # Types of objects and arrays whose selections are forwarded to workers
+    ObjectTypes = (
+        vtkIOExodus.vtkExodusIIReader.EDGE_BLOCK,
+        vtkIOExodus.vtkExodusIIReader.FACE_BLOCK,
+        vtkIOExodus.vtkExodusIIReader.ELEM_BLOCK,
+        vtkIOExodus.vtkExodusIIReader.NODE_SET,
+        vtkIOExodus.vtkExodusIIReader.EDGE_SET,
+        vtkIOExodus.vtkExodusIIReader.FACE_SET,
+        vtkIOExodus.vtkExodusIIReader.SIDE_SET,
+        vtkIOExodus.vtkExodusIIReader.ELEM_SET)
+    ArrayTypes = ObjectTypes + (
+        vtkIOExodus.vtkExodusIIReader.GLOBAL,
+        vtkIOExodus.vtkExodusIIReader.NODAL)
+
     def __init__(self, *parameters):
         """Default constructor: serial or parallel reader
         """
@@ -63,6 +131,28 @@ class argVTKExodusReader(argDataInterfaceBase):
         # Times are to be computed only if needed then cached
         self.Times = None
 
+        # Merged outputs and their surfaces are cached per time step within
+        # memory budget shared by all data interfaces
+        self.OutputCache = {}
+
+        # Readers and cache may be accessed from prefetching threads
+        self.ReadLock = threading.RLock()
+        self.CacheLock = threading.Lock()
+
+        # Worker processes are spawned only if partitions are to be read
+        self.NumberOfWorkers = argVTKExodusReader.NumberOfWorkers
+        self.WorkerPools = []
+
+        # Keep track of per-partition meta-information and read times
+        self.PartitionTimings = collections.OrderedDict()
+
+        # Meta-information is snapshot per reader and summaries built once
+        self.MetaInformation = {}
+        self.Summaries = {}
+
+        # Maps from block IDs to output leaves are built once per selection
+        self.BlockFlatIndices = {}
+
         # Initialize attribute (only one can be handled at a time)
         self.initialize_attribute()
 
@@ -85,44 +175,16 @@ class argVTKExodusReader(argDataInterfaceBase):
 
         # Now handle case where basename is that of a partition
         else:
-            # Check whether base name is that of a partition
-            try:
-                # Base name corresponds to a set of parallel files
-                n_files = int(database_name.split('.')[-1])
-            except ValueError:
-                # Partition name is inconsistent with naming convention
-                print("** ERROR: partition name {} is not consistent with naming convention. Exiting.".format(
-                    database_name))
-                sys.exit(1)
-
-            # Compute number of digits for possible 0-padding
-            l_pad = int(math.ceil(math.log10(n_files)))
-
-            # Iterate over files contained in partition
-            for i in range(n_files):
-                # Try first with padd index, then with raw index
-                found_subset = False
-                for suffix in [("%s" % i).rjust(l_pad, '0'), "%s" % i]:
-                    # Assemble name of subset file
-                    subset_name = database_name + '.' + suffix
-
-                    # Verify whether expected subset file is found
-                    if os.path.isfile(subset_name):
-                        # Instantiate VTK Exodus II for each subset
-                        reader = self.create_VTK_reader(subset_name, displace)
-
-                        # Look for requested variable and determine its type
-                        self.get_variable_from_VTK_reader(reader, var_name)
-
-                        # Break out if subset is found with current padding/non-padding convention
-                        found_subset = True
-                        break
-
-                # Partition naming convention is inconsistent with possible subset file names
-                if not found_subset:
-                    print("** ERROR: partition name is {} but file with index {} was not found. Exiting.".format(
-                        database_name, i))
-                    sys.exit(1)
+            # Retrieve names of all files contained in partition
+            subset_names = self.get_partition_file_names(database_name)
+
+            # Instantiate VTK Exodus II readers for all subsets
+            for reader in self.create_VTK_readers(subset_names, displace):
+                # Look for requested variable and determine its type
+                self.get_variable_from_VTK_reader(reader, var_name)
+
+            # Report on partition meta-information loading times
+            self.report_partition_timings("information")
 
     def get_accessors(self):
         """Return list of Exodus II readers
@@ -130,96 +192,66 @@ class argVTKExodusReader(argDataInterfaceBase):
 
         return self.Readers
 
-    def get_meta_information(self):
-        """Retrieve meta-information from data
+    def get_meta_information_snapshots(self):
+        """Retrieve meta-information snapshots of all readers, taking missing ones
         """
 
-        # Initialize global meta-information
-        meta = []
-
-        # Iterate over all readers
+        # Take snapshot of readers whose meta-information was not yet retrieved
         for r in self.Readers:
-            # Initialize meta-information for this reader
-            r_meta = {"name": r.GetFileName(), "nodes": r.GetNumberOfNodesInFile(), "edges": r.GetNumberOfEdgesInFile(),
-                      "faces": r.GetNumberOfFacesInFile(), "elements": r.GetNumberOfElementsInFile(),
-                      "time-steps": r.GetNumberOfTimeSteps()}
-
-            # Retrieve meta-information on element blocks
-            rng = range(r.GetNumberOfElementBlockArrays())
-            r_meta["block IDs"] = [r.GetObjectId(vtkIOExodus.vtkExodusIIReader.ELEM_BLOCK, i) for i in rng]
-            r_meta["block names"] = [r.GetElementBlockArrayName(x) for x in rng]
-            # r_meta["block types"] = [m._get_element_type(i) for i in b_ids]
-
-            # Retrieve meta-information on node sets
-            rng = range(r.GetNumberOfNodeSetArrays())
-            r_meta["node set IDs"] = [r.GetObjectId(vtkIOExodus.vtkExodusIIReader.NODE_SET, i) for i in rng]
-            r_meta["node sets"] = [r.GetNodeSetArrayName(x) for x in rng]
-
-            # Retrieve meta-information on edge sets
-            rng = range(r.GetNumberOfEdgeSetArrays())
-            r_meta["edge set IDs"] = [r.GetObjectId(vtkIOExodus.vtkExodusIIReader.EDGE_SET, i) for i in rng]
-            r_meta["edge sets"] = [r.GetEdgeSetArrayName(x) for x in rng]
-
-            # Retrieve meta-information on side sets
-            rng = range(r.GetNumberOfSideSetArrays())
-            r_meta["side set IDs"] = [r.GetObjectId(vtkIOExodus.vtkExodusIIReader.SIDE_SET, i) for i in rng]
-            r_meta["side sets"] = [r.GetSideSetArrayName(x) for x in rng]
-
-            # Retrieve meta-information on fields
-            r_meta["global variables"] = [r.GetGlobalResultArrayName(x) for x in
-                                          range(r.GetNumberOfGlobalResultArrays())]
-            r_meta["node fields"] = [r.GetPointResultArrayName(x) for x in range(r.GetNumberOfPointResultArrays())]
-            r_meta["edge fields"] = [r.GetEdgeResultArrayName(x) for x in range(r.GetNumberOfEdgeResultArrays())]
-            r_meta["face fields"] = [r.GetFaceResultArrayName(x) for x in range(r.GetNumberOfFaceResultArrays())]
-            r_meta["element fields"] = [r.GetElementResultArrayName(x) for x in
-                                        range(r.GetNumberOfElementResultArrays())]
-            r_meta["node set fields"] = [r.GetNodeSetResultArrayName(x) for x in
-                                         range(r.GetNumberOfNodeSetResultArrays())]
-            r_meta["edge set fields"] = [r.GetEdgeSetResultArrayName(x) for x in
-                                         range(r.GetNumberOfEdgeSetResultArrays())]
-            r_meta["side set fields"] = [r.GetSideSetResultArrayName(x) for x in
-                                         range(r.GetNumberOfSideSetResultArrays())]
+            if r.GetFileName() not in self.MetaInformation:
+                self.MetaInformation[r.GetFileName()] = self.get_reader_meta_information(r)
 
-            # Append local meta-information to global list
-            meta.append(r_meta)
+        # Return snapshots in reader order
+        return [self.MetaInformation[r.GetFileName()] for r in self.Readers]
 
-        # Return global meta-information
-        return meta
-
-    def get_property_information(self, prop_type, prop_items=None):
-        """Retrieve all information about given sproperty from ExodusII file
-        """
-
-        # Not implemented for ExodusII data yet
-        print("*  WARNING: ExodusII property information getter not implemented yet")
-
-        # Returned information is dictionary of lists of lists
-        info_obj = argInformationObject("arg_dict_lists_lists")
-
-        # Return computed information object
-        return info_obj
-
-    def initialize_attribute(self):
-        """Initialize attribute properties
-        """
-
-        # Name of considered attribute
-        self.AttributeName = None
-
-        # Attribute can be bound to points or cells
-        self.AttributeBinding = None
-
-        # Variable type can be scalar or 3D vector
-        self.AttributeType = None
-
-        # Data is supposed to be pseudo-continuous by default
-        self.Discrete = False
-
-    def is_attribute_discrete(self):
-        """Tell whether attribute is discrete or (pseudo) continuous
+    @staticmethod
+    def get_reader_meta_information(r):
+        """Retrieve meta-information from single reader
         """
 
-        return self.Discrete
+        # Initialize meta-information for this reader
+        r_meta = {"name": r.GetFileName(), "nodes": r.GetNumberOfNodesInFile(), "edges": r.GetNumberOfEdgesInFile(),
+                  "faces": r.GetNumberOfFacesInFile(), "elements": r.GetNumberOfElementsInFile(),
+                  "time-steps": r.GetNumberOfTimeSteps()}
+
+        # Retrieve meta-information on element blocks
+        rng = range(r.GetNumberOfElementBlockArrays())
+        r_meta["block IDs"] = [r.GetObjectId(vtkIOExodus.vtkExodusIIReader.ELEM_BLOCK, i) for i in rng]
+        r_meta["block names"] = [r.GetElementBlockArrayName(x) for x in rng]
+        # r_meta["block types"] = [m._get_element_type(i) for i in b_ids]
+
+        # Retrieve meta-information on node sets
+        rng = range(r.GetNumberOfNodeSetArrays())
+        r_meta["node set IDs"] = [r.GetObjectId(vtkIOExodus.vtkExodusIIReader.NODE_SET, i) for i in rng]
+        r_meta["node sets"] = [r.GetNodeSetArrayName(x) for x in rng]
+
+        # Retrieve meta-information on edge sets
+        rng = range(r.GetNumberOfEdgeSetArrays())
+        r_meta["edge set IDs"] = [r.GetObjectId(vtkIOExodus.vtkExodusIIReader.EDGE_SET, i) for i in rng]
+        r_meta["edge sets"] = [r.GetEdgeSetArrayName(x) for x in rng]
+
+        # Retrieve meta-information on side sets
+        rng = range(r.GetNumberOfSideSetArrays())
+        r_meta["side set IDs"] = [r.GetObjectId(vtkIOExodus.vtkExodusIIReader.SIDE_SET, i) for i in rng]
+        r_meta["side sets"] = [r.GetSideSetArrayName(x) for x in rng]
+
+        # Retrieve meta-information on fields
+        r_meta["global variables"] = [r.GetGlobalResultArrayName(x) for x in
+                                      range(r.GetNumberOfGlobalResultArrays())]
+        r_meta["node fields"] = [r.GetPointResultArrayName(x) for x in range(r.GetNumberOfPointResultArrays())]
+        r_meta["edge fields"] = [r.GetEdgeResultArrayName(x) for x in range(r.GetNumberOfEdgeResultArrays())]
+        r_meta["face fields"] = [r.GetFaceResultArrayName(x) for x in range(r.GetNumberOfFaceResultArrays())]
+        r_meta["element fields"] = [r.GetElementResultArrayName(x) for x in
+                                    range(r.GetNumberOfElementResultArrays())]
+        r_meta["node set fields"] = [r.GetNodeSetResultArrayName(x) for x in
+                                     range(r.GetNumberOfNodeSetResultArrays())]
+        r_meta["edge set fields"] = [r.GetEdgeSetResultArrayName(x) for x in
+                                     range(r.GetNumberOfEdgeSetResultArrays())]
+        r_meta["side set fields"] = [r.GetSideSetResultArrayName(x) for x in
+                                     range(r.GetNumberOfSideSetResultArrays())]
+
+        # Return meta-information of reader
+        return r_meta
 
     def get_available_times(self):
         """Return variable time steps
@@ -271,130 +303,640 @@ class argVTKExodusReader(argDataInterfaceBase):
             print("[argDataInterface] No time-steps available to reader")
         return self.Times
 
-    def get_attribute_type(self):
-        """Return attribute binding
-        """
-
-        return self.AttributeBinding
-
-    def get_variable_type(self):
-        """Return variable type
-        """
-
-        return self.AttributeType
-
-    def get_variable_time_slice(self, t, var_name, modulus=False):
-        """Get time slice of given variable
-        """
-
-        # Container for values
-        values = []
-
-        # Iterate over all readers
-        for reader in self.Readers:
-            # Set time step
-            reader.SetTimeStep(t)
-
-            # Update reader
-            reader.Update()
-
-            # Iterate over non-empty leaves of multiblock dataset
-            it = reader.GetOutput().NewIterator()
-            it.InitTraversal()
-            while not it.IsDoneWithTraversal():
-                # Get data depending on attribute type
-                data = None
-                if self.AttributeBinding == "point":
-                    data = it.GetCurrentDataObject().GetPointData()
-                elif self.AttributeBinding == "cell":
-                    data = it.GetCurrentDataObject().GetCellData()
-
-                # Retrieve and append data depending on its type
-                if data:
-                    if self.AttributeType == "scalar":
-                        data_array = data.GetScalars(var_name)
-                        for i in range(data_array.GetNumberOfTuples()):
-                            v = data_array.GetTuple1(i)
-                            # Store either vector or modulus
-                            if modulus:
-                                values.append(abs(v))
-                            else:
-                                values.append(v)
-                    elif self.AttributeType == "vector3":
-                        data_array = data.GetVectors(var_name)
-                        for i in range(data_array.GetNumberOfTuples()):
-                            v = data_array.GetTuple3(i)
-                            # Store either vector or modulus
-                            if modulus:
-                                values.append(math.sqrt(sum(x * x for x in v)))
-                            else:
-                                values.append(v)
-
-                # Traverse to next block
-                it.GoToNextItem()
+    def get_variable_time_slice_array(self, t, var_name, modulus=False):
+        """Get time slice of given variable as a NumPy array
+           NB: values of all readers and blocks are concatenated in traversal order
+               into an array of their own, as readers are overwritten upon update
+        """
+
+        # Readers cannot be driven concurrently
+        with self.ReadLock:
+            # Container for per-leaf views of data arrays
+            arrays = []
+
+            # Update all readers at given time step
+            outputs = self.update_VTK_readers(self.Readers, t)
+
+            # Iterate over outputs of all readers
+            for output in outputs:
+                # Iterate over non-empty leaves of multiblock dataset
+                it = output.NewIterator()
+                it.InitTraversal()
+                while not it.IsDoneWithTraversal():
+                    # Append zero-copy view of data array when present
+                    data_array = self.get_leaf_data_array(it.GetCurrentDataObject(), var_name)
+                    if data_array is not None:
+                        arrays.append(vtk_to_numpy(data_array))
+
+                    # Traverse to next block
+                    it.GoToNextItem()
+
+            # Return empty array if no values were found
+            if not arrays:
+                return np.empty((0, 3) if self.AttributeType == "vector3" else (0,))
+
+            # Copy values of single leaf or concatenate values of all leaves
+            values = arrays[0].copy() if len(arrays) == 1 else np.concatenate(arrays)
+
+            # Return either values or their moduli
+            if not modulus:
+                return values
+            elif values.ndim > 1:
+                return np.linalg.norm(values, axis=1)
+            else:
+                return np.abs(values)
+
+    def get_variable_time_slice_block_arrays(self, t, var_name, modulus=False, blocks=None):
+        """Get time slice of given variable as a map from element block IDs to NumPy arrays
+           NB: values of all readers are concatenated per block, restricted to given block IDs if any,
+               with values of nodes shared across partitions kept once when global IDs are available
+        """
+
+        # Shared nodes are only present with point data of partitions
+        node_ids_name = vtkIOExodus.vtkExodusIIReader.GetGlobalNodeIdArrayName()
+        deduplicate = self.AttributeBinding == "point" and len(self.Readers) > 1
+
+        # Readers cannot be driven concurrently
+        with self.ReadLock:
+            # Deselect element blocks that were not requested prior to reading
+            block_statuses = []
+            for reader, r_meta in zip(self.Readers, self.get_meta_information_snapshots()):
+                block_statuses.append(self.set_element_block_statuses(reader, {
+                    b_name: 0 for b_id, b_name in zip(r_meta["block IDs"], r_meta["block names"])
+                    if blocks is not None and b_id not in blocks}))
+
+            # Update all readers at given time step
+            outputs = self.update_VTK_readers(self.Readers, t if t > -1 else 0)
+
+            # Iterate over all readers and their outputs
+            block_arrays, block_node_ids = {}, {}
+            for reader, output in zip(self.Readers, outputs):
+                # Iterate over non-empty leaves of multiblock dataset
+                it = output.NewIterator()
+                it.InitTraversal()
+                while not it.IsDoneWithTraversal():
+                    # Append zero-copy view of data array to those of its block
+                    b_id = self.get_leaf_block_ID(reader, it.GetCurrentMetaData())
+                    data_array = self.get_leaf_data_array(it.GetCurrentDataObject(), var_name)
+                    if b_id is not None and data_array is not None:
+                        block_arrays.setdefault(b_id, []).append(vtk_to_numpy(data_array))
+
+                        # Keep track of global node IDs when shared nodes may be present
+                        if deduplicate:
+                            ids = it.GetCurrentDataObject().GetPointData().GetArray(node_ids_name)
+                            block_node_ids.setdefault(b_id, []).append(
+                                vtk_to_numpy(ids) if ids is not None else None)
+
+                    # Traverse to next block
+                    it.GoToNextItem()
+
+            # Restore block statuses as readers may be shared
+            for reader, statuses in zip(self.Readers, block_statuses):
+                self.set_element_block_statuses(reader, statuses)
+
+            # Copy values of each block as readers are overwritten upon update
+            block_values = {}
+            for b_id, arrays in block_arrays.items():
+                values = np.concatenate(arrays)
+
+                # Keep first occurrence of each shared node when global IDs are available
+                node_ids = block_node_ids.get(b_id)
+                if node_ids and all(ids is not None for ids in node_ids):
+                    values = values[np.unique(np.concatenate(node_ids), return_index=True)[1]]
+                block_values[b_id] = values
+
+        # Return either values or their moduli
+        if not modulus:
+            return block_values
+        return {b_id: np.linalg.norm(values, axis=1) if values.ndim > 1 else np.abs(values)
+                for b_id, values in block_values.items()}
+
+    def get_variable_time_series(self, var_name, indices, blocks=None, modulus=False):
+        """Get time series of given variable at given value indices as a
+           (number of time steps x number of indices) NumPy array
+           NB: indices refer to time slice values, restricted to given block IDs if any
+        """
+
+        # Readers cannot be driven concurrently
+        with self.ReadLock:
+            # Retrieve available times and requested indices
+            times = self.get_available_times()
+            indices = np.atleast_1d(np.asarray(indices, dtype=np.int64))
+            n_c = 3 if self.AttributeType == "vector3" else 1
+
+            # Traverse output once to map indices to leaves of each reader
+            leaf_readers, leaf_flat_ids, leaf_names, leaf_sizes = [], [], [], []
+            outputs = self.update_VTK_readers(self.Readers, 0)
+            for i_r, (reader, output) in enumerate(zip(self.Readers, outputs)):
+                # Iterate over non-empty leaves of multiblock dataset
+                it = output.NewIterator()
+                it.InitTraversal()
+                while not it.IsDoneWithTraversal():
+                    # Skip leaves that do not belong to requested blocks if any
+                    if blocks is None or self.get_leaf_block_ID(
+                            reader, it.GetCurrentMetaData()) in blocks:
+                        # Keep track of leaves carrying requested variable
+                        data_array = self.get_leaf_data_array(it.GetCurrentDataObject(), var_name)
+                        if data_array is not None:
+                            leaf_readers.append(i_r)
+                            leaf_flat_ids.append(it.GetCurrentFlatIndex())
+                            leaf_names.append(it.GetCurrentMetaData().Get(
+                                vtkCommonDataModel.vtkCompositeDataSet.NAME()))
+                            leaf_sizes.append(data_array.GetNumberOfTuples())
+
+                    # Traverse to next block
+                    it.GoToNextItem()
+
+            # Initialize time series container
+            series = np.empty((len(times), len(indices)) + ((n_c,) if n_c > 1 else ()))
+
+            # Bail out early if indices are not all within range
+            offsets = np.cumsum([0] + leaf_sizes)
+            if not len(indices) or indices.min() < 0 or indices.max() >= offsets[-1]:
+                print("*  WARNING: value indices out of range [0, {}[ for variable {}".format(
+                    offsets[-1], var_name))
+                return series[:, :0]
+
+            # Assign each requested index to its leaf with local position
+            i_leaves = np.searchsorted(offsets, indices, side="right") - 1
+            gather_map = {}
+            for i_l in np.unique(i_leaves):
+                sel = np.flatnonzero(i_leaves == i_l)
+                gather_map.setdefault(leaf_readers[i_l], {})[leaf_flat_ids[i_l]] = (
+                    sel, indices[sel] - offsets[i_l])
+
+            # Only read element blocks that contain requested values during sweep
+            block_statuses = {}
+            for i_r in gather_map:
+                reader = self.Readers[i_r]
+                needed = {leaf_names[i_l] for i_l in np.unique(i_leaves) if leaf_readers[i_l] == i_r}
+                block_statuses[i_r] = self.set_element_block_statuses(reader, {
+                    reader.GetElementBlockArrayName(i_b): 0
+                    for i_b in range(reader.GetNumberOfElementBlockArrays())
+                    if reader.GetElementBlockArrayName(i_b) not in needed})
+
+            # Sweep all time steps once, only updating readers that are needed
+            swept_readers = [self.Readers[i_r] for i_r in gather_map]
+            for t in range(len(times)):
+                outputs = self.update_VTK_readers(swept_readers, t)
+                for output, leaf_map in zip(outputs, gather_map.values()):
+                    # Gather requested values from relevant leaves
+                    it = output.NewIterator()
+                    it.InitTraversal()
+                    while not it.IsDoneWithTraversal():
+                        idx = it.GetCurrentFlatIndex()
+                        if idx in leaf_map:
+                            sel, local = leaf_map[idx]
+                            series[t, sel] = vtk_to_numpy(
+                                self.get_leaf_data_array(it.GetCurrentDataObject(), var_name))[local]
+                        it.GoToNextItem()
+
+            # Restore element block statuses of swept readers
+            for i_r, statuses in block_statuses.items():
+                self.set_element_block_statuses(self.Readers[i_r], statuses)
+
+            # Return either values or their moduli
+            if not modulus:
+                return series
+            elif n_c > 1:
+                return np.linalg.norm(series, axis=2)
+            else:
+                return np.abs(series)
+
+    def get_leaf_data_array(self, leaf, var_name):
+        """Get data array of given variable on multiblock dataset leaf
+        """
+
+        # Get data depending on attribute type
+        data = None
+        if self.AttributeBinding == "point":
+            data = leaf.GetPointData()
+        elif self.AttributeBinding == "cell":
+            data = leaf.GetCellData()
+
+        # Retrieve data array depending on its type
+        if data:
+            if self.AttributeType == "scalar":
+                return data.GetScalars(var_name)
+            elif self.AttributeType == "vector3":
+                return data.GetVectors(var_name)
+
+    @staticmethod
+    def set_element_block_statuses(reader, statuses):
+        """Set element block statuses by name and return previous ones
+        """
+
+        # Keep track of previous statuses to allow for restoration
+        previous = {}
+        for b_name, status in statuses.items():
+            previous[b_name] = reader.GetElementBlockArrayStatus(b_name)
+            reader.SetElementBlockArrayStatus(b_name, status)
+
+        # Return previous statuses
+        return previous
 
-        # Return retrieved values
-        return values
+    @staticmethod
+    def get_leaf_block_ID(reader, leaf_meta_data):
+        """Get element block ID of multiblock dataset leaf, None if not a block
+        """
+
+        # Retrieve leaf name and corresponding element block index
+        name = leaf_meta_data.Get(vtkCommonDataModel.vtkCompositeDataSet.NAME())
+        b_idx = reader.GetObjectIndex(vtkIOExodus.vtkExodusIIReader.ELEM_BLOCK, name)
+
+        # Return block ID when leaf is an element block
+        return reader.GetObjectId(
+            vtkIOExodus.vtkExodusIIReader.ELEM_BLOCK, b_idx) if b_idx > -1 else None
+
+    def get_block_flat_indices(self, ignored_blocks=None):
+        """Get map from element block IDs to flat indices of their non-empty
+           leaves in VTK output data without ignored blocks
+           NB: map is built once per set of ignored blocks as output structure
+               does not vary across time steps
+        """
+
+        # Return map if already built for these ignored blocks
+        key = frozenset(ignored_blocks or ())
+        with self.CacheLock:
+            block_flat_indices = self.BlockFlatIndices.get(key)
+        if block_flat_indices is not None:
+            return block_flat_indices
+
+        # Iterate over non-empty leaves of output data once
+        block_flat_indices = {}
+        it = self.get_VTK_reader_output_data(0, key).NewIterator()
+        it.InitTraversal()
+        while not it.IsDoneWithTraversal():
+            # Map leaf flat index to its block ID when it is a block
+            b_id = self.get_leaf_block_ID(self.Readers[0], it.GetCurrentMetaData())
+            if b_id is not None:
+                block_flat_indices.setdefault(b_id, []).append(it.GetCurrentFlatIndex())
+            it.GoToNextItem()
+
+        # Store and return map
+        with self.CacheLock:
+            self.BlockFlatIndices[key] = block_flat_indices
+        return block_flat_indices
+
+    def read_time_step(self, step, var_name=None, ignored_blocks=None, by_block=False):
+        """Read given time step as VTK output data, or as NumPy array of variable if provided,
+           or as map from element block IDs to NumPy arrays of variable if by_block
+        """
+
+        # Values are copied as readers are overwritten upon update
+        if var_name and by_block:
+            return self.get_variable_time_slice_block_arrays(
+                step, var_name, blocks=self.get_block_IDs(ignored_blocks) if ignored_blocks else None)
+        if var_name:
+            return self.get_variable_time_slice_array(step, var_name)
+
+        # Otherwise cache output data so that consumers can retrieve it again
+        return self.get_VTK_reader_output_data(step, ignored_blocks)
 
-    def get_VTK_reader_output_data(self, t):
+    def get_VTK_reader_output_data(self, t, ignored_blocks=None):
         """Get time and possibly block slice of data set as VTK reader output data
+           NB: element blocks with IDs in ignored_blocks are not read and left empty
         """
 
-        # Iterate over parallel readers and store output shards
-        shards = []
-        for reader in self.Readers:
-            # Set time step
-            if t > -1:
-                reader.SetTimeStep(t)
+        # Default to first time step as readers may be shared
+        step = t if t > -1 else 0
+
+        # Read and cache merged output only when not already cached
+        key = (step, frozenset(ignored_blocks or ()))
+        output = self.get_cached_VTK_output_data(key)
+        if output is None:
+            # Readers cannot be driven concurrently
+            with self.ReadLock:
+                # Output may have been cached while waiting for readers
+                output = self.get_cached_VTK_output_data(key)
+                if output is None:
+                    output = self.read_VTK_reader_output_data(step, key[1])
+                    self.cache_VTK_output_data(key, output)
+
+        # Return shallow copy so that callers cannot alter cached output
+        return self.copy_VTK_output_data(output)
+
+    def get_VTK_surface_mesh(self, t, ignored_blocks=None):
+        """Get surface of time and possibly block slice of data set as polydata
+           NB: surface is extracted once per time step and ignored blocks, then
+               cached along with reader outputs
+        """
 
-            # Update reader and store output shard
-            reader.Update()
-            shards.append(reader.GetOutput())
+        # Default to first time step as readers may be shared
+        step = t if t > -1 else 0
+
+        # Extract and cache surface only when not already cached
+        key = ("surface", step, frozenset(ignored_blocks or ()))
+        surface = self.get_cached_VTK_output_data(key)
+        if surface is None:
+            geometry = vtkFiltersGeometry.vtkCompositeDataGeometryFilter()
+            geometry.SetInputData(self.get_VTK_reader_output_data(step, key[2]))
+            geometry.Update()
+            surface = geometry.GetOutput()
+            self.cache_VTK_output_data(key, surface)
+
+        # Return shallow copy so that callers cannot alter cached surface
+        surface_copy = surface.NewInstance()
+        surface_copy.ShallowCopy(surface)
+        return surface_copy
+
+    def iterate_element_blocks(self, t, ignored_blocks=None):
+        """Iterate over element blocks read one at a time, yielding block ID and
+           VTK reader output data where only leaves of that block are non-empty
+           NB: outputs are not cached so that each can be released once consumed
+        """
 
-        # Create container for output data with same structure as input
-        output = shards[0].NewInstance()
-        output.DeepCopy(shards[0])
+        # Default to first time step as readers may be shared
+        step = t if t > -1 else 0
+
+        # Collect IDs of element blocks across all partitions in file order
+        block_IDs = self.get_block_IDs()
+
+        # Read each non-ignored element block alone by ignoring all others
+        ignored = frozenset(ignored_blocks or ())
+        for b_id in block_IDs:
+            if b_id in ignored:
+                continue
+            with self.ReadLock:
+                output = self.read_VTK_reader_output_data(
+                    step, frozenset(block_IDs).difference([b_id]))
+            yield b_id, output
+
+            # Release block before reading next one
+            del output
+
+    def estimate_VTK_output_size(self):
+        """Estimate memory footprint in bytes of VTK output data of all blocks
+           NB: rough upper bound from node and element counts, accounting for
+               coordinates, connectivities, global IDs, and one scalar field,
+               with reader outputs coexisting with their copies
+        """
 
-        # Break out early when mesh is not split
+        # Sum node and element counts across partitions
+        snapshots = self.get_meta_information_snapshots()
+        n_nodes = sum(r_meta["nodes"] for r_meta in snapshots)
+        n_elems = sum(r_meta["elements"] for r_meta in snapshots)
+
+        # Assume up to 8 nodes per element and 64-bit IDs and values
+        return 2 * (40 * n_nodes + 96 * n_elems)
+
+    def get_cached_VTK_output_data(self, key):
+        """Get cached output marking it as most recently used, None if absent
+        """
+
+        # Cache may be accessed concurrently
+        with self.CacheLock:
+            output = self.OutputCache.get(key)
+        if output is not None:
+            argDataInterface.touch_cached_item(self, key)
+
+        # Return cached output if any
+        return output
+
+    def cache_VTK_output_data(self, key, output):
+        """Insert output in per time step cache, evicting least recently used
+           cached items of all data interfaces until it fits in shared budget
+        """
+
+        # Store output then discard it if it cannot fit in memory budget
+        with self.CacheLock:
+            self.OutputCache[key] = output
+        if not argDataInterface.retain_cached_item(self, key, 1024 * output.GetActualMemorySize()):
+            self.discard_cached_item(key)
+
+    def discard_cached_item(self, key):
+        """Discard cached output evicted from shared memory budget
+        """
+
+        # Cache may be accessed concurrently
+        with self.CacheLock:
+            self.OutputCache.pop(key, None)
+
+    @staticmethod
+    def copy_VTK_output_data(output):
+        """Copy multiblock structure and shallow copy its leaves
+        """
+
+        # Create container with same structure as output
+        output_copy = output.NewInstance()
+        output_copy.CopyStructure(output)
+
+        # Shallow copy leaves so that attribute settings are not shared
+        it = output.NewIterator()
+        it.InitTraversal()
+        while not it.IsDoneWithTraversal():
+            leaf = it.GetCurrentDataObject()
+            leaf_copy = leaf.NewInstance()
+            leaf_copy.ShallowCopy(leaf)
+            output_copy.SetDataSet(it, leaf_copy)
+            it.GoToNextItem()
+
+        # Return copied output
+        return output_copy
+
+    def invalidate_output_cache(self):
+        """Discard all cached outputs, e.g. after reader selections changed
+        """
+
+        # Empty cache and stop accounting for its outputs
+        with self.CacheLock:
+            self.OutputCache.clear()
+            self.BlockFlatIndices.clear()
+        argDataInterface.release_cached_items(self)
+
+    def read_VTK_reader_output_data(self, t, ignored_blocks=()):
+        """Read time slice of data set and merge shards into VTK output data
+        """
+
+        # Deselect ignored element blocks by name prior to reading them
+        block_statuses = []
+        for reader, r_meta in zip(self.Readers, self.get_meta_information_snapshots()):
+            block_statuses.append(self.set_element_block_statuses(reader, {
+                b_name: 0 for b_id, b_name in zip(r_meta["block IDs"], r_meta["block names"])
+                if b_id in ignored_blocks}))
+
+        # Update parallel readers and store output shards
+        shards = self.update_VTK_readers(self.Readers, t)
+
+        # Restore block statuses as readers may be shared
+        for reader, statuses in zip(self.Readers, block_statuses):
+            self.set_element_block_statuses(reader, statuses)
+
+        # Deep copy output data as reader output is overwritten upon update
         if len(self.Readers) < 2:
+            output = shards[0].NewInstance()
+            output.DeepCopy(shards[0])
             return output
 
-        # Merge all shards
-        merge_map = {}
+        # Create container for output data with same structure as input
+        output = shards[0].NewInstance()
+        output.CopyStructure(shards[0])
+
+        # Merge all shards block by block
         it_shards = [s.NewIterator() for s in shards]
         for i in it_shards:
             vtkCommonDataModel.vtkCompositeDataIterator.InitTraversal(i)
+        n_fallbacks = 0
         while not it_shards[0].IsDoneWithTraversal():
-            # Merge duplicate points when merging blocks
-            append = vtkFiltersCore.vtkAppendFilter()
-            append.MergePointsOn()
-
-            # Merge all corresponding blocks
-            for it in it_shards:
-                append.AddInputData(it.GetCurrentDataObject())
-            append.Update()
-            merge_map[it.GetCurrentFlatIndex()] = append.GetOutput()
+            # Stitch blocks using global IDs when available
+            blocks = [it.GetCurrentDataObject() for it in it_shards]
+            merged = self.merge_blocks_by_global_IDs(blocks)
+
+            # Otherwise merge duplicate points with a point locator
+            if merged is None:
+                n_fallbacks += 1
+                append = vtkFiltersCore.vtkAppendFilter()
+                append.MergePointsOn()
+                for block in blocks:
+                    append.AddInputData(block)
+                append.Update()
+                merged = append.GetOutput()
+
+            # Insert merged block at same location in output
+            output.SetDataSet(it_shards[0], merged)
 
             # Move to next items in inputs
             for it in it_shards:
                 it.GoToNextItem()
 
-        # Aggregate and return output data
-        it = output.NewIterator()
-        it.GoToFirstItem()
-        it_shards[0].GoToFirstItem()
-        while not it.IsDoneWithTraversal():
-            idx = it.GetCurrentFlatIndex()
-            if idx in merge_map:
-                it.GetCurrentDataObject().DeepCopy(merge_map[idx])
-            it.GoToNextItem()
-            it_shards[0].GoToNextItem()
+        # Report use of slower merging strategy
+        if n_fallbacks:
+            print("[argDataInterface] Merged {} block(s) with point locator as global IDs are unavailable".format(
+                n_fallbacks))
+
+        # Report on partition read times
+        self.report_partition_timings()
+
+        # Return merged output data
         return output
 
+    @staticmethod
+    def merge_blocks_by_global_IDs(blocks):
+        """Stitch unstructured grid blocks with their global node and element IDs
+           NB: return None when IDs are missing or inconsistent with geometry
+        """
+
+        # Only unstructured grids carrying global IDs can be stitched
+        node_ids_name = vtkIOExodus.vtkExodusIIReader.GetGlobalNodeIdArrayName()
+        elem_ids_name = vtkIOExodus.vtkExodusIIReader.GetGlobalElementIdArrayName()
+        for block in blocks:
+            if (not isinstance(block, vtkCommonDataModel.vtkUnstructuredGrid)
+                    or block.GetPointData().GetArray(node_ids_name) is None
+                    or block.GetCellData().GetArray(elem_ids_name) is None):
+                return None
+
+        # Assemble unique points sorted by global node IDs
+        node_ids = np.concatenate([
+            vtk_to_numpy(b.GetPointData().GetArray(node_ids_name)) for b in blocks])
+        _, first_nodes, inverse = np.unique(node_ids, return_index=True, return_inverse=True)
+        coords = np.concatenate([vtk_to_numpy(b.GetPoints().GetData()) for b in blocks])
+        points = coords[first_nodes]
+
+        # Verify that shared global node IDs map to identical points
+        if not np.allclose(points[inverse], coords):
+            return None
+
+        # Assemble unique cells sorted by global element IDs
+        elem_ids = np.concatenate([
+            vtk_to_numpy(b.GetCellData().GetArray(elem_ids_name)) for b in blocks])
+        _, first_elems = np.unique(elem_ids, return_index=True)
+
+        # Renumber cell connectivities into unique point indices
+        offsets, connectivity, types = [np.zeros(1, dtype=np.int64)], [], []
+        n_points, n_conn = 0, 0
+        for b in blocks:
+            cells = b.GetCells()
+            b_offsets = vtk_to_numpy(cells.GetOffsetsArray()).astype(np.int64)
+            b_conn = vtk_to_numpy(cells.GetConnectivityArray()).astype(np.int64)
+            connectivity.append(inverse[n_points + b_conn])
+            offsets.append(n_conn + b_offsets[1:])
+            types.append(vtk_to_numpy(b.GetCellTypesArray()))
+            n_points += b.GetNumberOfPoints()
+            n_conn += len(b_conn)
+        offsets = np.concatenate(offsets)
+        connectivity = np.concatenate(connectivity)
+        types = np.concatenate(types)
+
+        # Polyhedral face streams cannot be renumbered this way
+        if (types == vtkCommonDataModel.VTK_POLYHEDRON).any():
+            return None
+
+        # Keep first occurrence of each cell only
+        sizes = np.diff(offsets)[first_elems]
+        starts = offsets[:-1][first_elems]
+        new_offsets = np.concatenate(([0], np.cumsum(sizes)))
+        gather = np.repeat(starts - new_offsets[:-1], sizes) + np.arange(new_offsets[-1])
+
+        # Create merged unstructured grid
+        merged = vtkCommonDataModel.vtkUnstructuredGrid()
+        vtk_points = vtkCommonCore.vtkPoints()
+        vtk_points.SetData(numpy_to_vtk(points, deep=1))
+        merged.SetPoints(vtk_points)
+        cell_array = vtkCommonDataModel.vtkCellArray()
+        cell_array.SetData(
+            numpy_to_vtk(new_offsets, deep=1, array_type=vtkCommonCore.VTK_ID_TYPE),
+            numpy_to_vtk(connectivity[gather], deep=1, array_type=vtkCommonCore.VTK_ID_TYPE))
+        merged.SetCells(
+            numpy_to_vtk(types[first_elems], deep=1, array_type=vtkCommonCore.VTK_UNSIGNED_CHAR),
+            cell_array)
+
+        # Gather point and cell data arrays present in all blocks
+        for attr, first in (("GetPointData", first_nodes), ("GetCellData", first_elems)):
+            source = getattr(blocks[0], attr)()
+            target = getattr(merged, attr)()
+            for i in range(source.GetNumberOfArrays()):
+                name = source.GetArrayName(i)
+                arrays = [getattr(b, attr)().GetArray(name) for b in blocks]
+                if name is None or any(a is None for a in arrays):
+                    continue
+                merged_array = numpy_to_vtk(
+                    np.concatenate([vtk_to_numpy(a) for a in arrays])[first], deep=1)
+                merged_array.SetName(name)
+                target.AddArray(merged_array)
+
+            # Preserve active attributes of first block
+            for i_a in range(vtkCommonDataModel.vtkDataSetAttributes.NUM_ATTRIBUTES):
+                active = source.GetAbstractAttribute(i_a)
+                if active is not None and active.GetName():
+                    target.SetActiveAttribute(active.GetName(), i_a)
+
+        # Carry over field data of first block
+        merged.GetFieldData().ShallowCopy(blocks[0].GetFieldData())
+
+        # Return stitched block
+        return merged
+
     def create_VTK_reader(self, file_name, displace):
         """Create VTK reader and to existing ones
         """
 
+        # Initialize single VTK Exodus II file reader and append it to list
+        reader = self.make_VTK_reader(file_name, displace)
+        self.Readers.append(reader)
+
+        # Return reader
+        return reader
+
+    def create_VTK_readers(self, file_names, displace):
+        """Create VTK readers and append them in given order
+        """
+
+        # Meta-information of readers is loaded one after another
+        readers = [self.make_VTK_reader(f, displace) for f in file_names]
+
+        # Global IDs are needed to stitch partitions together
+        for reader in readers:
+            reader.GenerateGlobalNodeIdArrayOn()
+            reader.GenerateGlobalElementIdArrayOn()
+        self.Readers.extend(readers)
+
+        # Return readers
+        return readers
+
+    def make_VTK_reader(self, file_name, displace):
+        """Instantiate VTK reader and update its meta-information
+        """
+
         # Initialize single VTK Exodus II file reader
         reader = vtkIOExodus.vtkExodusIIReader()
         reader.SetFileName(file_name)
@@ -405,13 +947,175 @@ class argVTKExodusReader(argDataInterfaceBase):
         else:
             reader.ApplyDisplacementsOff()
 
-        # Update reader meta-information and append it to list
-        reader.UpdateInformation()
-        self.Readers.append(reader)
+        # Update reader meta-information and take snapshot of it
+        with argVTKExodusReader.NetCDFLock:
+            start = time.perf_counter()
+            reader.UpdateInformation()
+            elapsed = time.perf_counter() - start
+        self.MetaInformation[file_name] = self.get_reader_meta_information(reader)
+
+        # Record elapsed time
+        self.PartitionTimings[file_name] = {
+            "information": elapsed,
+            "reads": 0,
+            "update": 0.,
+            "worker": None,
+            "interval": None}
 
         # Return reader
         return reader
 
+    def get_worker_pools(self):
+        """Return single process pools of workers reading partitions
+           NB: each partition is always read by same worker which thus only
+               loads meta-information of its own partitions
+        """
+
+        # Spawn worker processes lazily upon first use
+        if not self.WorkerPools:
+            n_workers = min(self.NumberOfWorkers, len(self.Readers))
+            print("[argDataInterface] Creating {} worker processes to read partitions".format(
+                n_workers))
+            self.WorkerPools = [concurrent.futures.ProcessPoolExecutor(
+                1, mp_context=multiprocessing.get_context("spawn"))
+                for _ in range(n_workers)]
+
+        # Return worker pools
+        return self.WorkerPools
+
+    def close(self):
+        """Release worker processes and cached outputs
+        """
+
+        # Shut worker processes down along with their readers
+        for pool in self.WorkerPools:
+            pool.shutdown()
+        self.WorkerPools = []
+
+        # Discard cached outputs
+        self.invalidate_output_cache()
+
+    @staticmethod
+    def set_number_of_workers(n_workers):
+        """Set number of worker processes used to read partitions concurrently,
+           with all available cores used for non-positive numbers of workers
+        """
+
+        # Ensure at least one worker, applicable to new readers only
+        n_workers = int(n_workers)
+        argVTKExodusReader.NumberOfWorkers = n_workers if n_workers > 0 else os.cpu_count() or 1
+
+    @staticmethod
+    def get_VTK_reader_settings(reader):
+        """Get settings of VTK reader needed to reproduce its output elsewhere
+        """
+
+        # Retrieve file, displacement, global IDs, and object and array selections
+        # NB: object types are passed as integers so that settings can be pickled
+        return {
+            "file": reader.GetFileName(),
+            "displace": reader.GetApplyDisplacements(),
+            "node IDs": reader.GetGenerateGlobalNodeIdArray(),
+            "element IDs": reader.GetGenerateGlobalElementIdArray(),
+            "objects": {int(t): [reader.GetObjectStatus(t, i) for i in range(reader.GetNumberOfObjects(t))]
+                        for t in argVTKExodusReader.ObjectTypes},
+            "arrays": {int(t): [reader.GetObjectArrayStatus(t, i) for i in range(reader.GetNumberOfObjectArrays(t))]
+                       for t in argVTKExodusReader.ArrayTypes}}
+
+    @staticmethod
+    def set_VTK_reader_settings(reader, settings):
+        """Apply settings retrieved with get_VTK_reader_settings to VTK reader
+           NB: reader output is only modified by settings that differ
+        """
+
+        # Set global IDs generation
+        reader.SetGenerateGlobalNodeIdArray(settings["node IDs"])
+        reader.SetGenerateGlobalElementIdArray(settings["element IDs"])
+
+        # Set object and array selections
+        for t, statuses in settings["objects"].items():
+            for i, status in enumerate(statuses):
+                reader.SetObjectStatus(t, i, status)
+        for t, statuses in settings["arrays"].items():
+            for i, status in enumerate(statuses):
+                reader.SetObjectArrayStatus(t, i, status)
+
+    def update_VTK_readers(self, readers, t):
+        """Set time step of given readers and update them, in worker processes
+           if several, returning their outputs in given order
+        """
+
+        # Read partitions in worker processes when several are to be read
+        if len(readers) > 1 and self.NumberOfWorkers > 1:
+            # Each partition is read by worker given by its position
+            pools = self.get_worker_pools()
+            positions = {id(r): i for i, r in enumerate(self.Readers)}
+            futures = [pools[positions[id(r)] % len(pools)].submit(
+                read_VTK_reader_shard, self.get_VTK_reader_settings(r), t)
+                for r in readers]
+
+            # Unmarshal outputs once read and keep track of elapsed times
+            outputs = []
+            for reader, future in zip(readers, futures):
+                result = future.result()
+                output = vtkCommonDataModel.vtkMultiBlockDataSet()
+                vtkParallelCore.vtkCommunicator.UnMarshalDataObject(numpy_to_vtk(
+                    np.frombuffer(result["data"], dtype=np.int8), deep=1,
+                    array_type=vtkCommonCore.VTK_CHAR), output)
+                outputs.append(output)
+                self.record_partition_timing(reader.GetFileName(), result)
+
+            # Return outputs in reader order
+            return outputs
+
+        # Otherwise read partitions in this process one after another
+        for reader in readers:
+            # Update reader only once lock is acquired so as to time read only
+            with argVTKExodusReader.NetCDFLock:
+                start, wall_start = time.perf_counter(), time.time()
+                reader.SetTimeStep(t)
+                reader.Update()
+                elapsed = time.perf_counter() - start
+            self.record_partition_timing(reader.GetFileName(), {
+                "worker": os.getpid(),
+                "interval": (wall_start, time.time()),
+                "update": elapsed})
+
+        # Return reader outputs
+        return [reader.GetOutput() for reader in readers]
+
+    def record_partition_timing(self, file_name, timing):
+        """Accumulate read time of partition and keep track of its last read
+        """
+
+        # Only partitions are timed
+        timings = self.PartitionTimings.get(file_name)
+        if timings is not None:
+            timings["reads"] += 1
+            timings["update"] += timing["update"]
+            timings["worker"] = timing["worker"]
+            timings["interval"] = timing["interval"]
+
+    def report_partition_timings(self, phase="update"):
+        """Print summary across partitions of meta-information or read times
+        """
+
+        # Nothing to report if no timings were recorded
+        durations = np.array([v[phase] for v in self.PartitionTimings.values()])
+        if not durations.any():
+            return
+
+        # Report statistics of phase across partitions
+        slowest = list(self.PartitionTimings)[int(durations.argmax())]
+        n_reads = max(v["reads"] for v in self.PartitionTimings.values())
+        print("[argDataInterface] {} time{} of {} partition(s) with {} worker(s): "
+              "total {:.3g} s, min {:.3g} s, mean {:.3g} s, max {:.3g} s ({})".format(
+                  phase.capitalize(),
+                  " over {} read(s)".format(n_reads) if phase == "update" else "",
+                  len(self.PartitionTimings), len(self.WorkerPools) or 1,
+                  durations.sum(), durations.min(), durations.mean(), durations.max(),
+                  os.path.basename(slowest)))
+
     def get_variable_from_VTK_reader(self, reader, var_name):
         """Retrieve variable and its type from VTK reader
         """
@@ -463,170 +1167,3 @@ class argVTKExodusReader(argDataInterfaceBase):
         # No variable was found if this point is reached
         print("*  WARNING No data array {} found in dataset".format(
             var_name))
-
-
-    def summarize(self, **args):
-        """Create summary as specified by arguments
-        """
-
-        # Initialize return header and body
-        header_list, body_dict = [], {}
-
-        # Call appropriate summarization method
-        summary_type = args.get("type")
-        if summary_type == "topology":
-            header_list, body_dict = self.summarize_topology()
-        elif summary_type == "blocks":
-            header_list, body_dict = self.summarize_blocks()
-        elif summary_type == "sets":
-            header_list, body_dict = self.summarize_sets(args.get("set_type"))
-        elif summary_type == "variable":
-            header_list, body_dict = self.summarize_variable()
-        else:
-            print("*  WARNING: incorrect summary type {} for argVTKExodusReader")
-
-        # Return summary header and body
-        return header_list, body_dict
-
-    def summarize_topology(self):
-        """Create a summary of Exodus II mesh topology in the form of a
-        table abstraction with a header list and a dict of contents
-        """
-
-        # Retrieve meta-information
-        meta_info = self.get_meta_information()
-        
-        # Iterate over all readers to aggregate topological properties
-        n_nodes = 0
-        n_elems = 0
-        for r in meta_info:
-            n_nodes += r.get("nodes")
-            n_elems += r.get("elements")
-
-        # Keep track of first reader which contains all shared information
-        reader_meta = meta_info[0]
-
-        # Create table header
-        header_list = ["item", "number"]
-
-        # Build table body
-        body_dict = {
-            "Exodus II files": [len(meta_info)],
-            "nodes": [n_nodes],
-            "elements": [n_elems]
-        }
-
-        # Retrieve block IDs if any
-        n = len(reader_meta.get("block IDs"))
-        if n:
-            body_dict["element blocks"] = [n]
-
-        # Retrieve number of node sets if any
-        n = len(list(reader_meta.get("node sets")))
-        if n:
-            body_dict["node sets"] = [n]
-
-        # Retrieve number of side sets if any
-        n = len(list(reader_meta.get("side sets")))
-        if n:
-            body_dict["side sets"] = [n]
-
-        # Retrieve number of time-steps if any
-        n = reader_meta.get("time-steps")
-        if n > 1:
-            body_dict["time-steps"] = [n]
-
-        # Retrieve number of node fields if any
-        n = len(list(reader_meta.get("node fields")))
-        if n:
-            body_dict["node fields"] = [n]
-
-        # Retrieve number of element fields if any
-        n = len(list(reader_meta.get("element fields")))
-        if n:
-            body_dict["element fields"] = [n]
-
-        # Return summary table
-        return header_list, body_dict
-
-
-    def summarize_blocks(self):
-        """Create a summary of Exodus II mesh blocks in the form of a
-        table abstraction with a header list and a dict of contents
-        """
-
-        # Retrieve meta-information
-        meta_info = self.get_meta_information()
-
-        # Keep track of first reader which contains all shared information
-        reader_meta = meta_info[0]
-
-        # Retrieve list of block names and bail out early if empty
-        block_names = reader_meta.get("block names")
-        if not block_names:
-            return None, None
-
-        # Generate block ID, name, and type rows
-        body_dict = {i: [v]
-                     for i, v in zip(
-                reader_meta.get("block IDs"), block_names)}
-
-        # Return summary table
-        return ["block ID", "block name"], body_dict
-
-
-    def summarize_sets(self, set_type):
-        """Create a summary of Exodus II node or side sets in the form of a
-        table abstraction with a header list and a dict of contents
-        """
-
-        # Sanity check
-        if set_type not in ("node", "side"):
-            return None, None
-
-        # Retrieve meta-information
-        meta_info = self.get_meta_information()
-
-        # Keep track of first reader which contains all shared information
-        reader_meta = meta_info[0]
-
-        # Retrieve list of node or side sets and bail out early if empty
-        set_names = reader_meta.get("{} sets".format(set_type))
-        if not set_names:
-            return None, None
-
-        # Generate node/side set ID, and name
-        set_IDs = reader_meta.get("{} set IDs".format(set_type))
-        body_dict = {i: [v]
-                     for i, v in zip(set_IDs, set_names)}
-
-        # Return summary table
-        return ["{} set ID".format(set_type), "{} set name".format(set_type)], body_dict
-
-
-    def summarize_variable(self):
-        """Create a summary of Exodus II mesh variables in the form of a
-        table abstraction with a header list and a dict of contents
-        """
-
-        # Retrieve meta-information
-        meta_info = self.get_meta_information()
-
-        # Keep track of first reader which contains all shared information
-        reader_meta = meta_info[0]
-
-        # Retrieve node-based variables
-        body_list = [[v, "NODAL"]
-                     for v in sorted(reader_meta.get("node fields"))]
-
-        # Retrieve element-based variables
-        for v in sorted(reader_meta.get("element fields")):
-            body_list.append([v, "ELEMENT"])
-
-        # Retrieve global variables
-        for v in sorted(reader_meta.get("global variables")):
-            body_list.append([v, "GLOBAL"])
-
-        # Return summary table
-        return ["variable", "type"], body_list
-        
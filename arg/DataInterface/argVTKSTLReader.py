@@ -40,6 +40,7 @@
 import os
 
 import vtkmodules.vtkCommonDataModel as vtkCommonDataModel
+import vtkmodules.vtkFiltersGeometry as vtkFiltersGeometry
 import vtkmodules.vtkIOGeometry as vtkIOGeometry
 
 from arg.Common.argInformationObject import argInformationObject
@@ -119,7 +120,7 @@ class argVTKSTLReader(argDataInterfaceBase):
 
         return "scalar"
 
-    def get_VTK_reader_output_data(self, _):
+    def get_VTK_reader_output_data(self, *_):
         """Get data set as VTK reader output data
         """
 
@@ -132,3 +133,15 @@ class argVTKSTLReader(argDataInterfaceBase):
 
         # Return constructed multi-block data set
         return output
+
+    def get_VTK_surface_mesh(self, *_):
+        """Get surface of data set as polydata
+        """
+
+        # Extract surface from reader output
+        geometry = vtkFiltersGeometry.vtkCompositeDataGeometryFilter()
+        geometry.SetInputData(self.get_VTK_reader_output_data())
+        geometry.Update()
+
+        # Return extracted surface
+        return geometry.GetOutput()
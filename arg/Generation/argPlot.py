@@ -47,6 +47,7 @@ import matplotlib.pylab as mpl
 import numpy as np
 import yaml
 
+from arg.Common import argMath, argTools
 from arg.Common.argMultiFontStringHelper import argMultiFontStringHelper
 from arg.DataInterface.argDataInterface import argDataInterface
 
@@ -87,6 +88,16 @@ constant_shift = .05
 decrease_factor = .95
 increase_factor = 1.05
 
+def save_PNG_figure(fig, image_full_name):
+    """Save figure as tightly bounded and transparent PNG file
+       NB: file is replaced atomically as concurrent requests may produce it
+    """
+
+    # Write PNG image file atomically
+    argTools.write_file_atomically(image_full_name, lambda f: fig.savefig(
+        f, format="png", bbox_inches="tight", pad_inches=0, transparent=True))
+
+
 def safely_evaluate_expression(expr, x):
     """Evaluate expression at x only allowing for explicitly supported expressions
     """
@@ -316,8 +327,8 @@ def time(parameters, plot_params):
         model,
         material)
 
-    # Generate image only if not already present
-    if os.path.isfile(image_full_name):
+    # Generate image only if no reusable one is present
+    if argTools.is_artifact_reusable(image_full_name, plot_params):
         return output_base_name, caption, None
 
     # Retrieve list of labels
@@ -340,19 +351,23 @@ def time(parameters, plot_params):
     for i, (f, l) in enumerate(zip(files, labels)):
         # Try to retrieve variable data and available times
         data, times, values = None, None, None
-        if data_type == "ExodusII":
+        if data_type in ("ExodusII", "HDF5ExodusII"):
             var_name = plot_params.get("variable")
             if not var_name:
                 continue
+            # Time series only need arrays, hence VTK is bypassed when possible
+            full_name = os.path.join(parameters.DataDir, f)
             data = argDataInterface.factory(
-                data_type,
-                os.path.join(parameters.DataDir, f),
+                argDataInterface.get_numeric_Exodus_data_type(full_name),
+                full_name,
                 var_name)
+            if not data:
+                continue
 
             # ExodusII files provide available times
             time_type = "numeric"
             times = data.get_available_times()
-            values = [data.get_variable_time_slice(t, var_name, True)[val_index] for t in range(len(times))]
+            values = data.get_variable_time_series(var_name, [val_index], None, True)[:, 0]
 
         elif data_type == "key-value":
             data = argDataInterface.factory(
@@ -372,7 +387,7 @@ def time(parameters, plot_params):
             # Values is given by second data columns
             values = [float(v) for v in data.Dictionaries[0].values()]
 
-        if not data or not times or not values:
+        if not data or not times or values is None or not len(values):
             continue
 
         # Try to update time range
@@ -442,7 +457,7 @@ def time(parameters, plot_params):
 
     # Export chart to PNG file
     try:
-        fig.savefig(image_full_name, bbox_inches="tight", pad_inches=0, transparent=True)
+        save_PNG_figure(fig, image_full_name)
         fig.clf()
         matplotlib.pyplot.close(fig)
     except:
@@ -512,8 +527,8 @@ def xy(parameters, plot_params):
         model,
         material)
 
-    # Generate image only if not already present
-    if os.path.isfile(image_full_name):
+    # Generate image only if no reusable one is present
+    if argTools.is_artifact_reusable(image_full_name, plot_params):
         return output_base_name, caption, None
 
     # Retrieve data for x and y variables
@@ -593,7 +608,7 @@ def xy(parameters, plot_params):
 
     # Export chart to PNG file
     try:
-        fig.savefig(image_full_name, bbox_inches="tight", pad_inches=0, transparent=True)
+        save_PNG_figure(fig, image_full_name)
         fig.clf()
         matplotlib.pyplot.close(fig)
     except:
@@ -653,8 +668,8 @@ def lin_exp(parameters, plot_params):
         model,
         material)
 
-    # Generate image only if not already present
-    if os.path.isfile(image_full_name):
+    # Generate image only if no reusable one is present
+    if argTools.is_artifact_reusable(image_full_name, plot_params):
         return output_base_name, caption, None
 
     # If no available or incorrect data values were found, do not do anything
@@ -724,7 +739,7 @@ def lin_exp(parameters, plot_params):
 
     # Export chart to PNG file
     try:
-        fig.savefig(image_full_name, bbox_inches="tight", pad_inches=0, transparent=True)
+        save_PNG_figure(fig, image_full_name)
         fig.clf()
         matplotlib.pyplot.close(fig)
     except:
@@ -784,8 +799,8 @@ def analytic(parameters, plot_params):
         model,
         material)
 
-    # Generate image only if not already present
-    if os.path.isfile(image_full_name):
+    # Generate image only if no reusable one is present
+    if argTools.is_artifact_reusable(image_full_name, plot_params):
         return output_base_name, caption, None
 
     # If no available or incorrect data values were found, do not do anything
@@ -851,7 +866,7 @@ def analytic(parameters, plot_params):
 
     # Export chart to PNG file
     try:
-        fig.savefig(image_full_name, bbox_inches="tight", pad_inches=0, transparent=True)
+        save_PNG_figure(fig, image_full_name)
         fig.clf()
         matplotlib.pyplot.close(fig)
     except:
@@ -898,8 +913,8 @@ def histogram(parameters, plot_params):
         title,
         var_y_name)
 
-    # Generate image only if not already present
-    if os.path.isfile(image_full_name):
+    # Generate image only if no reusable one is present
+    if argTools.is_artifact_reusable(image_full_name, plot_params):
         return output_base_name, caption, None
 
     # Retrieve data for x and y variables
@@ -907,11 +922,21 @@ def histogram(parameters, plot_params):
     if not data:
         return None, None, "*  WARNING: no data provided for histogram plot request. Ignoring it."
 
-    # Iterate over data map
-    x, w = [], []
-    for k, v in sorted(data.items()):
-        x.append(float(k))
-        w.append(v)
+    # Retrieve bins directly from fixed-bin histograms
+    if "counts" in data:
+        # Restrict bins to range of non-empty ones
+        non_empty = np.flatnonzero(data["counts"])
+        i_min, i_max = (non_empty[0], non_empty[-1] + 1) if non_empty.size else (0, 0)
+        bins = argMath.get_histogram_bin_edges(data)[i_min:i_max + 1]
+        x, w = list(bins[:-1]), list(data["counts"][i_min:i_max])
+
+    else:
+        # Iterate over data map
+        bins = 15
+        x, w = [], []
+        for k, v in sorted(data.items()):
+            x.append(float(k))
+            w.append(v)
 
     # If no available or incorrect data values were found, do not do anything
     if not len(x):
@@ -940,12 +965,104 @@ def histogram(parameters, plot_params):
     marker_type = plot_params.get("marker")
 
     # Create histogam if it makes sense
-    n, bins, patches = ax.hist(x, 15, weights=w, facecolor="blue", alpha=.5)
-    ax.set_aspect(compute_aspect_ratio(x, [0., max(n)], plot_params["xyratio"]))
+    n, bins, patches = ax.hist(x, bins, weights=w, facecolor="blue", alpha=.5)
+    ax.set_aspect(compute_aspect_ratio(list(bins), [0., max(n)], plot_params["xyratio"]))
+
+    # Export chart to PNG file
+    try:
+        save_PNG_figure(fig, image_full_name)
+        fig.clf()
+        matplotlib.pyplot.close(fig)
+    except:
+        return None, None, "*  WARNING: plot request could not save created file {} with exception `{}`. Ignoring it.".format(
+            output_base_name,
+            sys.exc_info())
+
+    # If this point was reached everything went well
+    return output_base_name, caption, None
+
+
+def envelope(parameters, plot_params):
+    """Create envelope plot of per time step descriptive statistics
+       (min/mean/max/M2/card), showing min-max band and mean +/- one stdev
+    """
+
+    # Retrieve plot title
+    title = plot_params.get("title")
+    if not title:
+        return None, None, "*  WARNING: no title provided for envelope plot request. Ignoring it."
+
+    # Retrieve variable names
+    try:
+        var_x_name = plot_params["var_x_name"].replace('_', r"\_")
+    except:
+        var_x_name = "Time"
+    try:
+        var_y_name = plot_params["var_y_name"].replace('_', r"\_")
+    except:
+        return None, None, "*  WARNING: no variable name provided for envelope plot request. Ignoring it."
+
+    # Assemble image name
+    output_base_name = make_base_name(
+        title,
+        '',
+        '',
+        var_y_name,
+        "envelope_plot")
+    image_full_name = os.path.join(parameters.OutputDir, output_base_name) + ".png"
+
+    # Create caption
+    caption = create_caption(
+        parameters.Backend,
+        "envelope",
+        title,
+        var_y_name)
+
+    # Generate image only if no reusable one is present
+    if argTools.is_artifact_reusable(image_full_name, plot_params):
+        return output_base_name, caption, None
+
+    # Retrieve times and per time step statistics, omitting steps without values
+    data = plot_params.get("data")
+    if not data:
+        return None, None, "*  WARNING: no data provided for envelope plot request. Ignoring it."
+    times = np.asarray(data["times"], dtype=float)
+    stats = np.asarray(data["statistics"], dtype=float).reshape(-1, 5)
+    valid = stats[:, 4] > 0
+    if not valid.any():
+        return None, None, "*  WARNING: no available data found for envelope plot request. Ignoring it."
+    times, stats = times[valid], stats[valid]
+    stdev = np.sqrt(np.maximum(stats[:, 3], 0.))
+
+    # Create chart
+    mpl.rc("text", usetex=True)
+    fig, ax = matplotlib.pyplot.subplots()
+
+    # Add title
+    if parameters.BackendType == "LaTeX":
+        ax.set_title(
+            r"\large\texttt{{{}}}".format(title.replace('_', r"\_")),
+            fontweight="bold")
+    else:
+        ax.set_title(
+            r"{}".format(title.replace('_', r"\_")),
+            fontweight="bold")
+
+    # Set labels
+    ax.set_xlabel(var_x_name)
+    ax.set_ylabel(var_y_name)
+    matplotlib.pyplot.grid(True)
+
+    # Add min-max band, mean curve, and one stdev band around mean
+    ax.fill_between(times, stats[:, 0], stats[:, 2], facecolor="blue", alpha=.2, label="min -- max")
+    ax.plot(times, stats[:, 1], color="blue", ls="solid", lw=1., label="mean")
+    ax.plot(times, stats[:, 1] - stdev, color="blue", ls="dashed", lw=.5, label=r"mean $\pm$ stdev")
+    ax.plot(times, stats[:, 1] + stdev, color="blue", ls="dashed", lw=.5)
+    ax.legend(loc="best", fontsize=8)
 
     # Export chart to PNG file
     try:
-        fig.savefig(image_full_name, bbox_inches="tight", pad_inches=0, transparent=True)
+        save_PNG_figure(fig, image_full_name)
         fig.clf()
         matplotlib.pyplot.close(fig)
     except:
@@ -1018,8 +1135,8 @@ def constant(parameters, plot_params):
         var_y_name,
         str_caption)
 
-    # Generate image only if not already present
-    if os.path.isfile(image_full_name):
+    # Generate image only if no reusable one is present
+    if argTools.is_artifact_reusable(image_full_name, plot_params):
         return output_base_name, caption, None
 
     # If no available or incorrect data values were found, do not do anything
@@ -1078,7 +1195,7 @@ def constant(parameters, plot_params):
 
     # Export chart to PNG file
     try:
-        fig.savefig(image_full_name, bbox_inches="tight", pad_inches=0, transparent=True)
+        save_PNG_figure(fig, image_full_name)
         fig.clf()
         matplotlib.pyplot.close(fig)
     except:
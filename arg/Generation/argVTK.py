@@ -36,9 +36,9 @@
 #
 # HEADER
 
+import collections
 import math
 import os
-import subprocess
 
 import numpy as np
 import vtkmodules.vtkCommonCore as vtkCommonCore
@@ -47,13 +47,18 @@ import vtkmodules.vtkFiltersCore as vtkFiltersCore
 import vtkmodules.vtkFiltersExtraction as vtkFiltersExtraction
 import vtkmodules.vtkFiltersGeneral as vtkFiltersGeneral
 import vtkmodules.vtkFiltersGeometry as vtkFiltersGeometry
-import vtkmodules.vtkFiltersStatistics as vtkFiltersStatistics
 import vtkmodules.vtkFiltersVerdict as vtkFiltersVerdict
 import vtkmodules.vtkIOImage as vtkIOImage
+import vtkmodules.vtkImagingCore as vtkImagingCore
 import vtkmodules.vtkRenderingAnnotation as vtkRenderingAnnotation
 import vtkmodules.vtkRenderingCore as vtkRenderingCore
+# Rendering backends are needed by render windows, including in worker processes
+import vtkmodules.vtkRenderingFreeType  # noqa: F401
+import vtkmodules.vtkRenderingOpenGL2  # noqa: F401
 import yaml
+from vtkmodules.util.numpy_support import numpy_to_vtk, vtk_to_numpy
 
+from arg.Common import argMath, argTools
 from arg.Common.argMultiFontStringHelper import argMultiFontStringHelper
 from arg.DataInterface.argDataInterface import argDataInterface
 
@@ -68,14 +73,46 @@ with open(os.path.join(common_dir, "../Common/argTypes.yml"),
 visualization_functions = supported_types.get(
     "VisualizationFunctions")
 
+
+def get_quality_measure(measure_name):
+    """Resolve VTK mesh quality measure from its name across VTK versions
+    """
+
+    # Older VTK versions define measures as module constants
+    measure = getattr(vtkFiltersVerdict, measure_name, None)
+
+    # Newer VTK versions define measures as enumeration of vtkMeshQuality
+    if measure is None:
+        measure = getattr(
+            getattr(vtkFiltersVerdict.vtkMeshQuality, "QualityMeasureTypes", None),
+            measure_name.replace("VTK_QUALITY_", ''),
+            None)
+
+    # Return measure as integer when found
+    return None if measure is None else int(measure)
+
+
 # Retrieve supported VTK quality functions
-quality_functions = {k: getattr(vtkFiltersVerdict, v, None)
+quality_functions = {k: get_quality_measure(v)
                      for k, v in supported_types.get(
         "QualityFunctions").items()}
 
+# Retrieve histogram ranges of supported VTK quality functions
+quality_ranges = {k: tuple(v) for k, v in supported_types.get(
+    "QualityRanges", {}).items()}
+
+# Number of bins of quality histograms
+quality_histogram_size = 100
+
 # Global VTK setting
 vtkRenderingCore.vtkMapper.SetResolveCoincidentTopologyToPolygonOffset()
 
+# Idle off-screen render windows keyed by resolution and rendering options,
+# reused across images to avoid repeated context creation and shader compilation,
+# least recently released ones being finalized beyond pool size
+render_window_pool = collections.OrderedDict()
+render_window_pool_size = 3
+
 
 class argVTKAttribute:
     """A class to encapsulate variable (VTK attribute) properties
@@ -108,6 +145,110 @@ class argVTKAttribute:
         return self.TimeStep
 
 
+class argVTKModeViewport:
+    """A class to render mode shapes in one viewport of a render window,
+       reusing surface topology and rendering pipeline across modes
+    """
+
+    def __init__(self, surface_mesh, variable, actor_edges, show_edges, font_size, x_scaling):
+        """Create rendering pipeline on copy of surface mesh topology
+        """
+
+        # Copy surface topology so that points and values can be swapped per mode
+        self.Mesh = vtkCommonDataModel.vtkPolyData()
+        self.Mesh.ShallowCopy(surface_mesh)
+        self.Variable = variable
+        self.EdgesActor = actor_edges
+        self.ShowEdges = show_edges
+
+        # Mapper and actor
+        self.Mapper = vtkRenderingCore.vtkPolyDataMapper()
+        self.Mapper.SetInputData(self.Mesh)
+        self.Mapper.SelectColorArray(variable.GetAttributeName())
+        self.Mapper.SetScalarModeToUsePointFieldData()
+        self.Actor = create_surface_or_wireframe_actor(self.Mapper, self.Mesh)
+
+        # Text actor
+        self.TextActor = vtkRenderingCore.vtkTextActor()
+        props = self.TextActor.GetTextProperty()
+        props.SetColor(0., 0., 0.)
+        props.SetFontSize(font_size)
+
+        # Renderers, whose cameras are set when viewport is placed
+        self.Renderer = create_unique_renderer(None, (0., 0., 1.))
+        self.Renderer.AddViewProp(self.Actor)
+        if x_scaling:
+            self.Renderer.GetActiveCamera().UseHorizontalViewAngleOn()
+        self.TextRenderer = create_unique_renderer(None, (0., 0., 1.))
+        self.TextRenderer.AddViewProp(self.TextActor)
+
+    def set_mode(self, points, values, frequency):
+        """Show mode shape with given surface points, variable values, and frequency,
+           or leave viewport empty when points are None
+        """
+
+        # Show actors only when a mode is assigned to viewport
+        self.Actor.SetVisibility(points is not None)
+        if self.ShowEdges and points is not None:
+            self.Renderer.AddViewProp(self.EdgesActor)
+        else:
+            self.Renderer.RemoveViewProp(self.EdgesActor)
+        if points is None:
+            self.TextActor.SetInput('')
+            return
+
+        # Swap surface points and variable values
+        var_name = self.Variable.GetAttributeName()
+        vtk_points = vtkCommonCore.vtkPoints()
+        vtk_points.SetData(numpy_to_vtk(points, deep=1))
+        self.Mesh.SetPoints(vtk_points)
+        vtk_values = numpy_to_vtk(values, deep=1)
+        vtk_values.SetName(var_name)
+        self.Mesh.GetPointData().AddArray(vtk_values)
+        self.Mesh.GetPointData().SetActiveVectors(var_name)
+
+        # Color transfer function
+        ctf, variable_range = create_color_transfer_function(self.Variable, self.Mesh)
+        self.Mapper.SetLookupTable(ctf)
+        if variable_range is not None:
+            self.Mapper.SetScalarRange(variable_range)
+
+        # Frequency
+        self.TextActor.SetInput("      %.1f" % frequency + " Hz")
+
+    def place(self, window, viewport, text_height, view_direction):
+        """Add renderers to window at given viewport location and reset their cameras
+        """
+
+        # Set viewports of mode and text renderers
+        x_min, y_min, x_max, y_max = viewport
+        self.Renderer.SetViewport(x_min, text_height, x_max, y_max)
+        self.TextRenderer.SetViewport(x_min, y_min, x_max, text_height)
+
+        # Iterate over mode and text renderers
+        for renderer, focal_point in (
+                (self.Renderer, self.EdgesActor.GetCenter()),
+                (self.TextRenderer, (0., 0., 0.))):
+            # Point camera to focal point from given direction before resetting it
+            camera = renderer.GetActiveCamera()
+            camera.SetFocalPoint(focal_point)
+            camera.SetPosition(view_direction[0], view_direction[1], view_direction[2])
+            renderer.ResetCamera()
+
+            # Add renderer to window unless already present
+            if not window.HasRenderer(renderer):
+                window.AddRenderer(renderer)
+
+    def remove(self, window):
+        """Remove renderers from window
+        """
+
+        # Remove renderers when present
+        for renderer in (self.Renderer, self.TextRenderer):
+            if window.HasRenderer(renderer):
+                window.RemoveRenderer(renderer)
+
+
 def absolute_zero_round(x):
     """Round to 0 values below a certain absolute threshold
     """
@@ -134,95 +275,112 @@ def set_active_variable(variable, mesh):
             mesh.GetCellData().SetActiveVectors(variable.GetAttributeName())
 
 
-def get_ignored_block_flat_indices(ignored_block_keys, data, step=0):
-    """Determine ranks of blocks ignored by key: name or index
+def get_ignored_block_IDs(ignored_block_keys, data):
+    """Determine IDs of blocks ignored by key: name or ID
+       NB: only meta-information is used so that ignored blocks need not be read
     """
 
     # By default no blocks are ignored
-    flat_indices = []
+    block_IDs = []
     if not ignored_block_keys:
-        return flat_indices
+        return block_IDs
 
     # Retrieve block meta-information
     meta_data = data.get_meta_information()[0]
-    block_names_lower = [n.lower() for n in meta_data["block names"]]
-    block_IDs = meta_data["block IDs"]
-
-    # Get handle on data reader output
-    input_data = data.get_VTK_reader_output_data(step)
-
-    # Iterate over non-empty leaves to find ignored blocks
-    it = input_data.NewIterator()
-    it.GoToFirstItem()
-    while not it.IsDoneWithTraversal():
-        # Retrieve name and ID of current non-empty leaf
-        b_nl = it.GetCurrentMetaData().Get(vtkCommonDataModel.vtkCompositeDataSet.NAME()).lower()
-        b_id = block_IDs[block_names_lower.index(b_nl)]
 
+    # Iterate over all blocks to find ignored ones
+    for b_id, b_name in zip(meta_data["block IDs"], meta_data["block names"]):
         # Check for matching name (case insensitive) or ID
-        if (b_nl in ignored_block_keys or
+        if (b_name.lower() in ignored_block_keys or
                 b_id in ignored_block_keys):
-            # Retrieve flat index of current block and add it to list
-            idx = it.GetCurrentFlatIndex()
-            flat_indices.append(idx)
+            block_IDs.append(b_id)
 
-        # Iterate to next non-empty leaf
-        it.GoToNextItem()
+    # Return list of ignored block IDs
+    return block_IDs
 
-    # Return list of ignored block ranks
-    return flat_indices
+
+# Element type strings and Verdict quality types of VTK cell types
+element_types = {
+    vtkCommonDataModel.VTK_LINE: (r"BAR2", None),
+    vtkCommonDataModel.VTK_TRIANGLE: (r"TRI3", "Mesh Triangle Quality"),
+    vtkCommonDataModel.VTK_QUAD: (r"QUAD4", "Mesh Quadrilateral Quality"),
+    vtkCommonDataModel.VTK_TETRA: (r"TET4", "Mesh Tetrahedron Quality"),
+    vtkCommonDataModel.VTK_HEXAHEDRON: (r"HEX8", "Mesh Hexahedron Quality"),
+    vtkCommonDataModel.VTK_QUADRATIC_TRIANGLE: (r"TRI6", None),
+    vtkCommonDataModel.VTK_QUADRATIC_QUAD: (r"QUAD8", None),
+    vtkCommonDataModel.VTK_QUADRATIC_TETRA: (r"TET10", None),
+    vtkCommonDataModel.VTK_QUADRATIC_HEXAHEDRON: (r"HEX20", None),
+    vtkCommonDataModel.VTK_BIQUADRATIC_QUAD: (r"QUAD9", None),
+    vtkCommonDataModel.VTK_TRIQUADRATIC_HEXAHEDRON: (r"HEX27", None),
+    vtkCommonDataModel.VTK_BIQUADRATIC_TRIANGLE: (r"TRI7", None)}
 
 
 def get_element_types(mesh, i=0):
     """Retrieve mesh element and Verdict quality types
     """
 
-    # Retrieve element type integer ID
-    type_id = mesh.GetCellType(i)
-
-    # Determine appropriate strings depending on type ID
-    if type_id == 3:
-        type_str = r"BAR2"
-        element_q_type = None
-    elif type_id == 5:
-        type_str = r"TRI3"
-        element_q_type = "Mesh Triangle Quality"
-    elif type_id == 9:
-        type_str = r"QUAD4"
-        element_q_type = "Mesh Quadrilateral Quality"
-    elif type_id == 10:
-        type_str = r"TET4"
-        element_q_type = "Mesh Tetrahedron Quality"
-    elif type_id == 12:
-        type_str = r"HEX8"
-        element_q_type = "Mesh Hexahedron Quality"
-    elif type_id == 22:
-        type_str = r"TRI6"
-        element_q_type = None
-    elif type_id == 23:
-        type_str = r"QUAD8"
-        element_q_type = None
-    elif type_id == 24:
-        type_str = r"TET10"
-        element_q_type = None
-    elif type_id == 25:
-        type_str = r"HEX20"
-        element_q_type = None
-    elif type_id == 28:
-        type_str = r"QUAD9"
-        element_q_type = None
-    elif type_id == 29:
-        type_str = r"HEX27"
-        element_q_type = None
-    elif type_id == 34:
-        type_str = r"TRI7"
-        element_q_type = None
-    else:
-        type_str = "UNKNOWN"
-        element_q_type = None
+    # Return element type string and quality type of i-th cell
+    return element_types.get(mesh.GetCellType(i), ("UNKNOWN", None))
+
+
+def get_cell_types(mesh):
+    """Retrieve array of VTK types of all mesh cells
+    """
+
+    # Read types array of unstructured grids at once
+    n_cells = mesh.GetNumberOfCells()
+    if isinstance(mesh, vtkCommonDataModel.vtkUnstructuredGrid):
+        types = mesh.GetCellTypesArray()
+        if types:
+            return vtk_to_numpy(types)
+        if mesh.IsHomogeneous() and n_cells:
+            return np.full(n_cells, mesh.GetCellType(0), dtype=np.uint8)
+
+    # Otherwise query cells one by one
+    return np.array([mesh.GetCellType(i) for i in range(n_cells)], dtype=np.uint8)
+
+
+def get_element_type_census(cell_types):
+    """Count elements of each type in array of VTK cell types
+       NB: return dict of counts keyed by element type strings
+    """
+
+    # Count all distinct cell types at once
+    census = {}
+    for type_id, count in zip(*np.unique(cell_types, return_counts=True)):
+        type_str = element_types.get(type_id, ("UNKNOWN", None))[0]
+        census[type_str] = census.get(type_str, 0) + int(count)
+
+    # Return census of element types
+    return census
+
+
+def get_cells_subset(mesh, cell_ids):
+    """Create unstructured grid with given cells of unstructured grid
+       NB: all points are shared with input mesh
+    """
 
-    # Return first element type string and quality type
-    return type_str, element_q_type
+    # Gather offsets and connectivity of selected cells
+    cells = mesh.GetCells()
+    offsets = vtk_to_numpy(cells.GetOffsetsArray()).astype(np.int64)
+    connectivity = vtk_to_numpy(cells.GetConnectivityArray())
+    sizes = offsets[cell_ids + 1] - offsets[cell_ids]
+    new_offsets = np.concatenate(([0], np.cumsum(sizes)))
+    gather = np.repeat(offsets[cell_ids] - new_offsets[:-1], sizes) + np.arange(new_offsets[-1])
+
+    # Create unstructured grid with selected cells
+    subset = vtkCommonDataModel.vtkUnstructuredGrid()
+    subset.SetPoints(mesh.GetPoints())
+    cell_array = vtkCommonDataModel.vtkCellArray()
+    cell_array.SetData(
+        numpy_to_vtk(new_offsets, deep=1, array_type=vtkCommonCore.VTK_ID_TYPE),
+        numpy_to_vtk(connectivity[gather], deep=1, array_type=vtkCommonCore.VTK_ID_TYPE))
+    subset.SetCells(
+        numpy_to_vtk(get_cell_types(mesh)[cell_ids], deep=1, array_type=vtkCommonCore.VTK_UNSIGNED_CHAR),
+        cell_array)
+
+    # Return subset of cells
+    return subset
 
 
 def get_mesh_quality(mesh, verdict_q, eq_type, do_histogram=False):
@@ -253,27 +411,7 @@ def get_mesh_quality(mesh, verdict_q, eq_type, do_histogram=False):
 
     # Compute quality histogram when requested
     if do_histogram:
-        # Prepare input table
-        q_table = vtkCommonDataModel.vtkTable()
-        q_table.AddColumn(q_out.GetCellData().GetArray("Quality"))
-
-        # Compute quantized histogram
-        os_ = vtkFiltersStatistics.vtkOrderStatistics()
-        os_.SetInputData(vtkFiltersStatistics.vtkStatisticsAlgorithm.INPUT_DATA, q_table)
-        os_.AddColumn("Quality")
-        os_.SetLearnOption(True)
-        os_.SetDeriveOption(False)
-        os_.SetTestOption(False)
-        os_.SetQuantize(True)
-        os_.SetMaximumHistogramSize(100)
-        os_.Update()
-
-        # Convert VTK histogram table into Python map
-        histo_tab = os_.GetOutputDataObject(vtkFiltersStatistics.vtkStatisticsAlgorithm.OUTPUT_MODEL).GetBlock(0)
-        n = histo_tab.GetNumberOfRows()
-        values = histo_tab.GetColumnByName("Value")
-        counts = histo_tab.GetColumnByName("Cardinality")
-        q_histo = {values.GetValue(i): counts.GetValue(i) for i in range(n)}
+        q_histo = get_quality_histogram(vtk_to_numpy(q_out.GetCellData().GetArray("Quality")))
 
     else:
         # No histogram was requested
@@ -283,6 +421,261 @@ def get_mesh_quality(mesh, verdict_q, eq_type, do_histogram=False):
     return q_stats, q_histo
 
 
+def get_mesh_qualities(mesh, eq_type, q_functions=None):
+    """Compute all given Verdict qualities of mesh, by default all supported ones,
+       reusing a single quality filter re-executed once per quality
+       NB: return (number of cells x number of qualities) array and dict of
+           [min, mean, max, variance, number] statistics as with vtkMeshQuality
+    """
+
+    # Initialize quality values container
+    if q_functions is None:
+        q_functions = quality_functions
+    n_cells = mesh.GetNumberOfCells()
+    q_values = np.full((n_cells, len(q_functions)), np.nan, order="F")
+
+    # Share one quality filter object across all requested qualities
+    quality = vtkFiltersVerdict.vtkMeshQuality()
+    quality.SaveCellQualityOn()
+    quality.SetInputData(mesh)
+
+    # Iterate over all requested qualities
+    computed = []
+    for j, (q_name, q_vtk) in enumerate(q_functions.items()):
+        # Skip missing quality functions
+        if q_vtk is None:
+            print("*  WARNING: no quality function provided for {}".format(eq_type))
+            continue
+
+        # Traverse cells anew to retrieve per-cell values of current quality
+        quality.SetTriangleQualityMeasure(q_vtk)
+        quality.SetQuadQualityMeasure(q_vtk)
+        quality.SetTetQualityMeasure(q_vtk)
+        quality.SetHexQualityMeasure(q_vtk)
+        quality.Update()
+        q_values[:, j] = vtk_to_numpy(quality.GetOutput().GetCellData().GetArray("Quality"))
+        computed.append((j, q_name))
+
+    # Compute descriptive statistics of all qualities at once
+    if not n_cells or not computed:
+        return q_values, {}
+    q_min, q_mean, q_max = q_values.min(axis=0), q_values.mean(axis=0), q_values.max(axis=0)
+    q_var = q_values.var(axis=0, ddof=1) if n_cells > 1 else np.zeros(len(q_functions))
+
+    # Return quality values and statistics
+    return q_values, {q_name: [q_min[j], q_mean[j], q_max[j], q_var[j], float(n_cells)]
+                      for j, q_name in computed}
+
+
+def get_quality_histogram(q_values, q_name=None):
+    """Compute fixed-bin histogram of quality values, with bins spanning
+       range of quality when known or that of values otherwise
+    """
+
+    # Retrieve histogram range shared across blocks when available
+    q_range = quality_ranges.get(q_name)
+    if q_range is None:
+        q_finite = q_values[np.isfinite(q_values)]
+        if not q_finite.size:
+            return {}
+        q_range = (q_finite.min(), q_finite.max())
+
+    # Return histogram with bins shared by all aggregated histograms
+    return argMath.create_histogram(q_values, q_range, quality_histogram_size)
+
+
+def compute_mesh_block_characteristics(mesh_block):
+    """Compute topological and quality values of a single mesh block,
+       with qualities computed separately for each supported element family
+       NB: return numbers of points and cells, census of element types, and
+           per-quality and element family statistics, histograms, and
+           quantile sketches keyed by (quality name, element type) pairs
+    """
+
+    # Take census of mesh block element types
+    cell_types = get_cell_types(mesh_block)
+    families = np.unique(cell_types)
+    census = get_element_type_census(cell_types)
+    q_stats, q_histo, q_sketches = {}, {}, {}
+
+    # Compute qualities of each element family when relevant
+    for type_id in families:
+        # Skip element families unsupported by Verdict
+        type_str, elem_q_type = element_types.get(type_id, ("UNKNOWN", None))
+        if not elem_q_type:
+            continue
+
+        # Restrict mesh to element family only when mixed
+        if len(families) == 1:
+            family_mesh = mesh_block
+        elif isinstance(mesh_block, vtkCommonDataModel.vtkUnstructuredGrid):
+            family_mesh = get_cells_subset(mesh_block, np.flatnonzero(cell_types == type_id))
+        else:
+            print("*  WARNING: cannot compute qualities of {} elements in mixed {}".format(
+                type_str, mesh_block.GetClassName()))
+            continue
+
+        # Compute all desired qualities of element family with shared quality filter
+        q_values, q_s = get_mesh_qualities(family_mesh, elem_q_type)
+
+        # Retrieve statistics, histograms, and sketches of computed qualities
+        for j, q_name in enumerate(quality_functions):
+            if q_s.get(q_name):
+                q_key = (q_name, type_str)
+                q_stats[q_key] = q_s[q_name]
+                q_histo[q_key] = get_quality_histogram(q_values[:, j], q_name)
+                q_sketches[q_key] = argMath.create_quantile_sketch(q_values[:, j])
+
+    # Return mesh block characteristics
+    return (mesh_block.GetNumberOfPoints(), mesh_block.GetNumberOfCells(),
+            census, q_stats, q_histo, q_sketches)
+
+
+def iterate_leaves(composite_data):
+    """Iterate over non-empty leaves of composite dataset without copying them
+       NB: yield flat index and data object of each leaf
+    """
+
+    # Traverse composite dataset once
+    it = composite_data.NewIterator()
+    it.InitTraversal()
+    while not it.IsDoneWithTraversal():
+        yield it.GetCurrentFlatIndex(), it.GetCurrentDataObject()
+        it.GoToNextItem()
+
+
+def get_mesh_arrays(mesh):
+    """Retrieve NumPy arrays of points, cells, and active scalars of
+       an unstructured grid or polygonal mesh, e.g. to send it to other processes
+       NB: return None for other mesh types and for polyhedral cells
+    """
+
+    # Retrieve cell arrays depending on mesh type
+    arrays = {"type": mesh.GetClassName()}
+    if isinstance(mesh, vtkCommonDataModel.vtkUnstructuredGrid):
+        cell_arrays = {"cells": mesh.GetCells()}
+        types = mesh.GetCellTypesArray()
+        arrays["types"] = (vtk_to_numpy(types) if types
+                           else np.zeros(0, dtype=np.uint8))
+
+        # Polyhedral face streams are not supported
+        if (arrays["types"] == vtkCommonDataModel.VTK_POLYHEDRON).any():
+            return None
+
+    elif isinstance(mesh, vtkCommonDataModel.vtkPolyData):
+        cell_arrays = {
+            "verts": mesh.GetVerts(),
+            "lines": mesh.GetLines(),
+            "polys": mesh.GetPolys(),
+            "strips": mesh.GetStrips()}
+
+    else:
+        # Other mesh types are not supported
+        return None
+
+    # Retrieve points and cell offsets and connectivities
+    points = mesh.GetPoints()
+    arrays["points"] = vtk_to_numpy(points.GetData()) if points else None
+    for k, cells in cell_arrays.items():
+        arrays[k] = (
+            vtk_to_numpy(cells.GetOffsetsArray()),
+            vtk_to_numpy(cells.GetConnectivityArray())) if cells else None
+
+    # Retrieve named active scalars of points and cells
+    for k, attributes in (("point scalars", mesh.GetPointData()),
+                          ("cell scalars", mesh.GetCellData())):
+        scalars = attributes.GetScalars()
+        if scalars and scalars.GetName():
+            arrays[k] = (scalars.GetName(), vtk_to_numpy(scalars))
+
+    # Return mesh arrays
+    return arrays
+
+
+def create_mesh_from_arrays(arrays):
+    """Create unstructured grid or polygonal mesh from NumPy arrays
+       retrieved with get_mesh_arrays
+    """
+
+    # Create mesh with its points
+    mesh = getattr(vtkCommonDataModel, arrays["type"])()
+    if arrays["points"] is not None:
+        points = vtkCommonCore.vtkPoints()
+        points.SetData(numpy_to_vtk(arrays["points"], deep=1))
+        mesh.SetPoints(points)
+
+    # Create cell arrays from offsets and connectivities
+    cell_arrays = {}
+    for k in ("cells", "verts", "lines", "polys", "strips"):
+        if arrays.get(k) is None:
+            continue
+        cell_arrays[k] = vtkCommonDataModel.vtkCellArray()
+        cell_arrays[k].SetData(*[
+            numpy_to_vtk(a, deep=1, array_type=vtkCommonCore.VTK_ID_TYPE) for a in arrays[k]])
+
+    # Assign cells depending on mesh type
+    if "cells" in cell_arrays:
+        mesh.SetCells(
+            numpy_to_vtk(arrays["types"], deep=1, array_type=vtkCommonCore.VTK_UNSIGNED_CHAR),
+            cell_arrays["cells"])
+    else:
+        for k, cells in cell_arrays.items():
+            getattr(mesh, "Set{}".format(k.capitalize()))(cells)
+
+    # Restore named active scalars of points and cells
+    for k, attributes in (("point scalars", mesh.GetPointData()),
+                          ("cell scalars", mesh.GetCellData())):
+        if k in arrays:
+            scalars = numpy_to_vtk(arrays[k][1], deep=1)
+            scalars.SetName(arrays[k][0])
+            attributes.SetScalars(scalars)
+
+    # Return created mesh
+    return mesh
+
+
+def apply_to_mesh_arrays(function, arrays, *args):
+    """Apply function to mesh created from NumPy arrays and extra arguments,
+       e.g. in worker processes
+    """
+
+    # Return result of function applied to mesh and arguments
+    return function(create_mesh_from_arrays(arrays), *args)
+
+
+def get_indexed_surface(leaves):
+    """Extract surface of mesh leaves along with indices of its points among
+       concatenated leaf points, and a copy of its point coordinates
+    """
+
+    # Attach point indices to shallow copies of leaves
+    index_name = "argPointIndex"
+    indexed_leaves = vtkCommonDataModel.vtkMultiBlockDataSet()
+    offset = 0
+    for i, leaf in enumerate(leaves):
+        leaf_copy = leaf.NewInstance()
+        leaf_copy.ShallowCopy(leaf)
+        n_points = leaf.GetNumberOfPoints()
+        indices = numpy_to_vtk(np.arange(offset, offset + n_points, dtype=np.int64), deep=1)
+        indices.SetName(index_name)
+        leaf_copy.GetPointData().AddArray(indices)
+        indexed_leaves.SetBlock(i, leaf_copy)
+        offset += n_points
+
+    # Geometry
+    geometry = vtkFiltersGeometry.vtkCompositeDataGeometryFilter()
+    geometry.SetInputData(indexed_leaves)
+    geometry.Update()
+    surface_mesh = geometry.GetOutput()
+
+    # Retrieve and detach surface point indices
+    surface_ids = vtk_to_numpy(surface_mesh.GetPointData().GetArray(index_name)).copy()
+    surface_mesh.GetPointData().RemoveArray(index_name)
+
+    # Return surface mesh, its point indices, and its point coordinates
+    return surface_mesh, surface_ids, vtk_to_numpy(surface_mesh.GetPoints().GetData()).copy()
+
+
 def create_color_transfer_function(variable, surface_mesh):
     """Create a color transfer function on variable and polygonal data set
     """
@@ -579,65 +972,149 @@ def create_caption(backend,
     return caption_string
 
 
-def trim_image(image_full_name):
-    """Try to trim image depending on OS type
+def get_trimmed_image_extent(image):
+    """Retrieve extent of bounding box of image pixels whose color differs
+       from that of top left corner pixel, which is considered as background
+       NB: full image extent is returned when image is uniform
     """
 
-    # Distinguish between Windows (nt) and other OS types
-    try:
-        if os.name == "nt":
-            subprocess.call(["magick",
-                             "convert",
-                             image_full_name,
-                             "-trim",
-                             image_full_name])
-        else:
-            subprocess.call(["convert",
-                             image_full_name,
-                             "-trim",
-                             image_full_name])
-    except Exception:
-        print("*  WARNING: could not trim {}.".format(image_full_name))
+    # Retrieve pixels as (rows, columns, components) array, bottom row first
+    x_min, x_max, y_min, y_max, z_min, z_max = image.GetExtent()
+    pixels = vtk_to_numpy(image.GetPointData().GetScalars()).reshape(
+        y_max - y_min + 1, x_max - x_min + 1, -1)
+
+    # Find rows and columns containing non-background pixels
+    foreground = (pixels != pixels[-1, 0]).any(axis=2)
+    rows = np.flatnonzero(foreground.any(axis=1))
+    cols = np.flatnonzero(foreground.any(axis=0))
+
+    # Nothing to trim when image is uniform
+    if not rows.size:
+        return x_min, x_max, y_min, y_max, z_min, z_max
+
+    # Return extent of bounding box
+    return (x_min + int(cols[0]), x_min + int(cols[-1]),
+            y_min + int(rows[0]), y_min + int(rows[-1]),
+            z_min, z_max)
 
 
-def create_PNG_from_window(window, image_full_name):
-    """Generate a PNG image from given render window
+def write_PNG_image(algorithm, image_full_name, trim=False):
+    """Write output image of VTK algorithm as PNG file, possibly trimmed of
+       its uniform background margins
+       NB: file is replaced atomically as concurrent requests may produce it
     """
 
-    # Window to image
-    wti = vtkRenderingCore.vtkWindowToImageFilter()
-    wti.SetInput(window)
+    # Crop image to its bounding box when trimming is requested
+    if trim:
+        algorithm.Update()
+        voi = vtkImagingCore.vtkExtractVOI()
+        voi.SetInputConnection(algorithm.GetOutputPort())
+        voi.SetVOI(get_trimmed_image_extent(algorithm.GetOutput()))
+        algorithm = voi
 
-    # Write PNG image
+    # Encode PNG image in memory
     writer = vtkIOImage.vtkPNGWriter()
-    writer.SetInputConnection(wti.GetOutputPort())
-    writer.SetFileName(image_full_name)
+    writer.SetInputConnection(algorithm.GetOutputPort())
+    writer.WriteToMemoryOn()
     writer.Write()
 
+    # Write PNG image file atomically
+    try:
+        argTools.write_file_atomically(image_full_name, lambda f: f.write(
+            vtk_to_numpy(writer.GetResult()).tobytes()))
+    except OSError as e:
+        print("*  WARNING: could not write image {}: {}".format(image_full_name, e))
+
 
-def create_PNG_from_renderer(renderer, image_full_name, x_res, y_res):
-    """Generate a PNG image with specified resolution from given renderer
+def acquire_render_window(x_res, y_res, alpha_bit_planes=False, multi_samples=None):
+    """Retrieve off-screen render window with specified resolution and
+       rendering options from pool, only creating one when none is idle
+       NB: window must be handed back with release_render_window once done
     """
 
-    # Create render window with specified resolution
+    # Reuse idle pooled window with same resolution and options if any
+    options = (bool(alpha_bit_planes), multi_samples)
+    window = render_window_pool.pop((x_res, y_res) + options, None)
+    if window is not None:
+        return window
+
+    # Otherwise create render window with specified resolution and options
     window = vtkRenderingCore.vtkRenderWindow()
     window.SetOffScreenRendering(True)
-    window.AddRenderer(renderer)
     window.SetSize(x_res, y_res)
-    window.SetAlphaBitPlanes(True)
-    window.SetMultiSamples(0)
+    window.SetAlphaBitPlanes(alpha_bit_planes)
+    if multi_samples is not None:
+        window.SetMultiSamples(multi_samples)
+    window.PoolOptions = options
+    return window
+
+
+def release_render_window(window):
+    """Detach all renderers from render window and return it to pool
+       NB: at most one idle window is kept per resolution and options, and
+           at most render_window_pool_size idle windows are kept overall
+    """
+
+    # Detach renderers, which releases their graphics resources
+    renderers = window.GetRenderers()
+    for renderer in [renderers.GetItemAsObject(i)
+                     for i in range(renderers.GetNumberOfItems())]:
+        window.RemoveRenderer(renderer)
+
+    # Finalize window when one is already idle with same resolution and options
+    key = tuple(window.GetSize()) + window.PoolOptions
+    if key in render_window_pool:
+        window.Finalize()
+        return
+
+    # Otherwise pool window as most recently released one
+    render_window_pool[key] = window
+
+    # Finalize least recently released windows in excess of pool size
+    while len(render_window_pool) > render_window_pool_size:
+        render_window_pool.popitem(last=False)[1].Finalize()
+
+
+def create_PNG_from_window(window, image_full_name, trim=False):
+    """Generate a PNG image, possibly trimmed, from given render window
+    """
+
+    # Window to image
+    wti = vtkRenderingCore.vtkWindowToImageFilter()
+    wti.SetInput(window)
 
-    # Create PNG image
-    create_PNG_from_window(window, image_full_name)
+    # Write PNG image
+    write_PNG_image(wti, image_full_name, trim)
 
 
-def make_mapper(input_port, ctf, variable, variable_range):
-    """Create mapper given variable, range, and color function
+def create_PNG_from_renderer(renderer, image_full_name, x_res, y_res, trim=False):
+    """Generate a PNG image, possibly trimmed, with specified resolution
+       from given renderer
+    """
+
+    # Attach renderer to pooled render window with specified resolution
+    window = acquire_render_window(x_res, y_res, True, 0)
+    try:
+        window.AddRenderer(renderer)
+
+        # Create PNG image
+        create_PNG_from_window(window, image_full_name, trim)
+    finally:
+        # Hand window back to pool
+        release_render_window(window)
+
+
+def make_mapper(mapper_input, ctf, variable, variable_range):
+    """Create mapper of polydata or output port given variable, range,
+       and color function
     """
 
     # Create mapper
     mapper = vtkRenderingCore.vtkPolyDataMapper()
-    mapper.SetInputConnection(input_port)
+    if isinstance(mapper_input, vtkCommonDataModel.vtkDataObject):
+        mapper.SetInputData(mapper_input)
+    else:
+        mapper.SetInputConnection(mapper_input)
 
     # Distinguish between attribute types when variable is named
     if variable.GetAttributeName():
@@ -706,16 +1183,10 @@ def surface(parameters, fig_params, data, variable, file_name):
     image_full_name = os.path.join(parameters.OutputDir,
                                    output_base_name + ".png")
 
-    # Generate image only if not already present
-    if not os.path.isfile(image_full_name):
-        # Get handle on data reader output
-        input_data = data.get_VTK_reader_output_data(step)
-
-        # Geometry
-        geometry = vtkFiltersGeometry.vtkCompositeDataGeometryFilter()
-        geometry.SetInputData(input_data)
-        geometry.Update()
-        surface_mesh = geometry.GetOutput()
+    # Generate image only if no reusable one is present
+    if not argTools.is_artifact_reusable(image_full_name, fig_params):
+        # Surface of data shared with other visualizations
+        surface_mesh = data.get_VTK_surface_mesh(step)
 
         # Use surface center to initialize missing view direction
         surf_c = surface_mesh.GetCenter()
@@ -728,7 +1199,7 @@ def surface(parameters, fig_params, data, variable, file_name):
                 variable, surface_mesh)
 
         # Mapper and actors
-        mapper = make_mapper(geometry.GetOutputPort(),
+        mapper = make_mapper(surface_mesh,
                              ctf, variable, variable_range)
         actor = create_surface_or_wireframe_actor(mapper,
                                                   surface_mesh,
@@ -749,9 +1220,8 @@ def surface(parameters, fig_params, data, variable, file_name):
             renderer.SetMaximumNumberOfPeels(100)
         renderer.ResetCamera()
 
-        # Generate and trim PNG image
-        create_PNG_from_renderer(renderer, image_full_name, 600, 600)
-        trim_image(image_full_name)
+        # Generate trimmed PNG image
+        create_PNG_from_renderer(renderer, image_full_name, 600, 600, True)
 
     # Create caption
     caption = create_caption(
@@ -766,9 +1236,11 @@ def surface(parameters, fig_params, data, variable, file_name):
     return output_base_name, caption
 
 
-def four_surfaces(parameters, fig_params, data, variable, file_name, do_clip=False):
+def four_surfaces(parameters, fig_params, data, variable, file_name, do_clip=False, vtk_data=None):
     """Add 4 surface rendering figures for each whole mesh at given step
        for a specified point or cell data, scalar or vector variable
+       NB: VTK output data of step without ignored blocks is used when
+           provided instead of being retrieved from data
     """
 
     # Retrieve figure parameters
@@ -793,8 +1265,8 @@ def four_surfaces(parameters, fig_params, data, variable, file_name, do_clip=Fal
     image_full_name = os.path.join(parameters.OutputDir,
                                    output_base_name + ".png")
 
-    # Generate image only if not already present
-    if not os.path.isfile(image_full_name):
+    # Generate image only if no reusable one is present
+    if not argTools.is_artifact_reusable(image_full_name, fig_params):
         # Image must be generated
         var_name = variable.GetAttributeName()
         print("[argVTK] Creating four-surfaces visualization{}{}".format(
@@ -804,39 +1276,17 @@ def four_surfaces(parameters, fig_params, data, variable, file_name, do_clip=Fal
             if ignored_block_keys else ''))
 
         # Determine skipped blocks if any
-        ignored_blocks = get_ignored_block_flat_indices(ignored_block_keys, data)
-
-        # Get handle on data reader output
-        input_data = data.get_VTK_reader_output_data(step)
+        ignored_blocks = get_ignored_block_IDs(ignored_block_keys, data)
 
-        # Determine skipped flat indices if needed
-        if ignored_blocks:
-            # Extract blocks
-            extract = vtkFiltersExtraction.vtkExtractBlock()
-            extract.SetInputData(input_data)
-
-            # Iterate over non-empty blocks
-            it = input_data.NewIterator()
-            it.GoToFirstItem()
-            while not it.IsDoneWithTraversal():
-                # Retrieve flat index of current non-empty leaf
-                idx = it.GetCurrentFlatIndex()
-
-                # Extract current non-empty leaf only if not ignore
-                if idx not in ignored_blocks:
-                    extract.AddIndex(idx)
-
-                # Iterate to next non-empty leaf
-                it.GoToNextItem()
-
-        # Extract mesh surface depending on whether some blocks are ignored
-        geometry = vtkFiltersGeometry.vtkCompositeDataGeometryFilter()
-        if ignored_blocks:
-            geometry.SetInputConnection(extract.GetOutputPort())
+        # Surface of data without skipped blocks shared with other visualizations
+        if vtk_data is None:
+            surface_mesh = data.get_VTK_surface_mesh(step, ignored_blocks)
         else:
-            geometry.SetInputData(input_data)
-        geometry.Update()
-        surface_mesh = geometry.GetOutput()
+            # Extract surface of provided output data
+            geometry = vtkFiltersGeometry.vtkCompositeDataGeometryFilter()
+            geometry.SetInputData(vtk_data)
+            geometry.Update()
+            surface_mesh = geometry.GetOutput()
 
         # Use surface center to initialize missing view direction
         surf_c = surface_mesh.GetCenter()
@@ -852,10 +1302,8 @@ def four_surfaces(parameters, fig_params, data, variable, file_name, do_clip=Fal
             y_nor = (view_direction[1], 0., 1., 0.)
             z_nor = (view_direction[2], 0., 0., 1.)
             clip = vtkFiltersGeneral.vtkClipDataSet()
-            if ignored_blocks:
-                clip.SetInputConnection(extract.GetOutputPort())
-            else:
-                clip.SetInputData(input_data)
+            clip.SetInputData(data.get_VTK_reader_output_data(step, ignored_blocks)
+                              if vtk_data is None else vtk_data)
             clip.SetClipFunction(plane)
             clip.InsideOutOn()
 
@@ -903,7 +1351,7 @@ def four_surfaces(parameters, fig_params, data, variable, file_name, do_clip=Fal
         else:  # if do_clip
             # Mappers
             mapper = vtkRenderingCore.vtkPolyDataMapper()
-            mapper.SetInputConnection(geometry.GetOutputPort())
+            mapper.SetInputData(surface_mesh)
 
             # Create and assign color map when variable name is provided
             if var_name:
@@ -926,61 +1374,63 @@ def four_surfaces(parameters, fig_params, data, variable, file_name, do_clip=Fal
             # Surface mesh and actor are common to all views
             actors = 4 * [actor]
 
-        # Render window
-        window = vtkRenderingCore.vtkRenderWindow()
-        window.SetOffScreenRendering(True)
-        window.SetSize(600, 600)
+        # Pooled render window
+        window = acquire_render_window(600, 600)
+        try:
 
-        # Viewport ranges
-        x_min = (0., 0., .5, .5)
-        x_max = (.5, .5, 1., 1.)
-        y_min = (.5, 0., 0., .5)
-        y_max = (1., .5, .5, 1.)
+            # Viewport ranges
+            x_min = (0., 0., .5, .5)
+            x_max = (.5, .5, 1., 1.)
+            y_min = (.5, 0., 0., .5)
+            y_max = (1., .5, .5, 1.)
 
-        # Camera view-up vectors
-        x_vup = (1., 0., 0., 0.)
-        y_vup = (0., 0., 0., 1.)
-        z_vup = (0., 1., 1., 0.)
+            # Camera view-up vectors
+            x_vup = (1., 0., 0., 0.)
+            y_vup = (0., 0., 0., 1.)
+            z_vup = (0., 1., 1., 0.)
 
-        # Camera positions
-        x_cam = [view_direction[0], surf_c[0] + 1., surf_c[0], surf_c[0]]
-        y_cam = [view_direction[1], surf_c[1], surf_c[1] + 1., surf_c[1]]
-        z_cam = [view_direction[2], surf_c[2], surf_c[2], surf_c[2] + 1.]
+            # Camera positions
+            x_cam = [view_direction[0], surf_c[0] + 1., surf_c[0], surf_c[0]]
+            y_cam = [view_direction[1], surf_c[1], surf_c[1] + 1., surf_c[1]]
+            z_cam = [view_direction[2], surf_c[2], surf_c[2], surf_c[2] + 1.]
 
-        # Iterate over viewports
-        for i in range(4):
-            # Camera
-            camera = vtkRenderingCore.vtkCamera()
-            camera.SetClippingRange(1., 100.)
-            camera.SetFocalPoint(surf_c)
-            camera.SetPosition(x_cam[i], y_cam[i], z_cam[i])
-            if i:
-                camera.SetViewUp(x_vup[i], y_vup[i], z_vup[i])
-                camera.ParallelProjectionOn()
+            # Iterate over viewports
+            for i in range(4):
+                # Camera
+                camera = vtkRenderingCore.vtkCamera()
+                camera.SetClippingRange(1., 100.)
+                camera.SetFocalPoint(surf_c)
+                camera.SetPosition(x_cam[i], y_cam[i], z_cam[i])
+                if i:
+                    camera.SetViewUp(x_vup[i], y_vup[i], z_vup[i])
+                    camera.ParallelProjectionOn()
 
-            # Renderer
-            renderer = vtkRenderingCore.vtkRenderer()
-            renderer.SetViewport(x_min[i], y_min[i], x_max[i], y_max[i])
-            renderer.SetActiveCamera(camera)
-            renderer.SetBackground(1., 1., 1.)
-            renderer.AddViewProp(actors[i])
-            if show_edges:
-                actor_edges = create_edges_actor(surface_mesh)
-                renderer.AddViewProp(actor_edges)
-            if i and show_axes:
-                actor_axes = create_axes_actor(surface_mesh, renderer, i)
-                renderer.AddViewProp(actor_axes)
-            renderer.ResetCamera()
-            if not i and show_scalar_bar:
-                renderer.AddViewProp(actor_bar)
+                # Renderer
+                renderer = vtkRenderingCore.vtkRenderer()
+                renderer.SetViewport(x_min[i], y_min[i], x_max[i], y_max[i])
+                renderer.SetActiveCamera(camera)
+                renderer.SetBackground(1., 1., 1.)
+                renderer.AddViewProp(actors[i])
+                if show_edges:
+                    actor_edges = create_edges_actor(surface_mesh)
+                    renderer.AddViewProp(actor_edges)
+                if i and show_axes:
+                    actor_axes = create_axes_actor(surface_mesh, renderer, i)
+                    renderer.AddViewProp(actor_axes)
+                renderer.ResetCamera()
+                if not i and show_scalar_bar:
+                    renderer.AddViewProp(actor_bar)
 
-            # Properly light this renderer and add to render window
-            vtkRenderingCore.vtkLightKit().AddLightsToRenderer(renderer)
-            window.AddRenderer(renderer)
+                # Properly light this renderer and add to render window
+                vtkRenderingCore.vtkLightKit().AddLightsToRenderer(renderer)
+                window.AddRenderer(renderer)
 
-        # Generate and trim PNG image
-        create_PNG_from_window(window, image_full_name)
-        trim_image(image_full_name)
+            # Generate trimmed PNG image
+            create_PNG_from_window(window, image_full_name, True)
+
+        finally:
+            # Hand render window back to pool
+            release_render_window(window)
 
     # Create caption
     if parameters.BackendType == "LaTeX":
@@ -1020,250 +1470,198 @@ def many_modes(parameters, fig_params, data, variable, file_name):
        laid out in n_cols columns by n_rows rows
     """
 
+    # Render single page of modes
+    return many_modes_pages(
+        parameters, fig_params, data, variable, file_name, [fig_params["range"]])[0]
+
+
+def many_modes_pages(parameters, fig_params, data, variable, file_name, mode_ranges):
+    """Add surface rendering figures for several pages of mode shapes
+       for a specified point or cell data, scalar or vector variable,
+       with a normalized displacement with given factor,
+       laid out in n_cols columns by n_rows rows on each page
+       NB: surface geometry and rendering pipeline are built once for all pages,
+           only surface points and variable values are swapped between modes
+    """
+
     # Retrieve figure parameters
     show_edges = fig_params.get("edges", False)
     view_direction = fig_params.get("view_direction", ())
-    mode_range = fig_params["range"]
     disp_factor = fig_params["displacement"]
-    block_range = fig_params.get("range")
     n_cols = fig_params.get("n_cols")
-    n_rows = fig_params.get("n_rows")
     x_scaling = fig_params.get("scaling") == 'x'
     var_name = variable.GetAttributeName()
 
     # Fix incomplete requests
-    if mode_range[0] < 0:
-        print("*  WARNING: mode range lower bound = {} resetting to 0".format(mode_range[0]))
-        mode_range[0] = 0
-
-    if mode_range[1] < 1:
-        print("*  WARNING: mode range upper bound = {} resetting to 0".format(mode_range[1]))
-        mode_range[1] = 0
-
     if n_cols < 1:
         print("*  WARNING: requested number of columns = {} resetting to 1".format(n_cols))
         n_cols = 1
 
     # Determine skipped blocks if any
     ignored_block_keys = fig_params.get("ignore_blocks")
-    ignored_blocks = get_ignored_block_flat_indices(ignored_block_keys, data)
-    viz_string = "[argVTK] Creating modes {} to {} visualization".format(
-        mode_range[0],
-        mode_range[1])
-    if ignored_blocks:
-        viz_string += " ignoring {} blocks".format(len(ignored_block_keys))
-    viz_string += " for variable {}".format(var_name)
+    ignored_blocks = get_ignored_block_IDs(ignored_block_keys, data)
+
+    # Create caption suffix about skipped blocks if any
+    ignored_string = None
+    if ignored_block_keys:
+        if parameters.BackendType == "LaTeX":
+            ignored_set = "\{{{}\}}".format(
+                ", ".join([r"\texttt{{{}}}".format(x) for x in ignored_block_keys]))
+        else:
+            ignored_set = "{{{}}}".format(", ".join(["{}".format(x) for x in ignored_block_keys]))
+        ignored_string = r". Blocks with indices or case-independent names in {} are omitted".format(
+            ignored_set)
 
     # Retrieve all modes which are stored as time steps
     times = data.get_available_times()
     n_steps = len(times)
-    if mode_range[1] >= n_steps:
-        mode_range[1] = n_steps - 1
-    n_modes = mode_range[1] - mode_range[0] + 1
-
-    # Assemble image file name
-    output_base_name = make_base_name(
-        "many_modes_{}_{}".format(mode_range[0], mode_range[1])
-        + ("_with_edges" if show_edges else ''),
-        variable,
-        view_direction,
-        [disp_factor],
-        -1,
-        ignored_block_keys if ignored_blocks else None)
-    image_full_name = os.path.join(parameters.OutputDir, output_base_name + ".png")
 
-    # Generate image only if not already present
-    if not os.path.isfile(image_full_name):
-        # Image must be generated
-        print(viz_string)
+    # Assemble image names and captions of all pages, collecting those to be rendered
+    results, pages = [], []
+    for mode_range in mode_ranges:
+        # Fix incomplete requests
+        if mode_range[0] < 0:
+            print("*  WARNING: mode range lower bound = {} resetting to 0".format(mode_range[0]))
+            mode_range[0] = 0
+        if mode_range[1] < 1:
+            print("*  WARNING: mode range upper bound = {} resetting to 0".format(mode_range[1]))
+            mode_range[1] = 0
+        if mode_range[1] >= n_steps:
+            mode_range[1] = n_steps - 1
 
-        # Compute actual number of rows
-        n_rows = (n_modes + n_cols // 2) // n_cols
-        if not n_rows:
-            print("*  WARNING: 0 rows to display")
-            return None, ''
+        # Assemble image file name
+        output_base_name = make_base_name(
+            "many_modes_{}_{}".format(mode_range[0], mode_range[1])
+            + ("_with_edges" if show_edges else ''),
+            variable,
+            view_direction,
+            [disp_factor],
+            -1,
+            ignored_block_keys if ignored_blocks else None)
+        image_full_name = os.path.join(parameters.OutputDir, output_base_name + ".png")
 
-        # Viewport ranges
-        x_min = []
-        x_max = []
-        y_min = []
-        y_int = []
-        y_max = []
-        dx = 1. / n_cols
-        dy = 1. / n_rows
-        y = 1. + dy
-        for i in range(n_rows * n_cols):
-            if not (i % n_cols):
-                x = 0.
-                y -= dy
-            else:
-                x += dx
-            x_min.append(x)
-            x_max.append(x + dx)
-            y_min.append(y - dy)
-            y_int.append(y - .9 * dy)
-            y_max.append(y)
+        # Create caption
+        caption = create_caption(
+            parameters.Backend,
+            "Modes {} to {} ".format(
+                mode_range[0],
+                mode_range[1]),
+            file_name,
+            None,
+            variable,
+            None,
+            ignored_string)
+        results.append((output_base_name, caption))
 
-        # Render window
-        window = vtkRenderingCore.vtkRenderWindow()
-        window.SetOffScreenRendering(True)
-        window.SetSize(1200, (1200 * n_rows) // n_cols)
-
-        # Iterate over all time steps and create images
-        edges_done = False
-        y_offset_done = False
-        for i in range(n_modes):
-            # Get handle on data reader output for desired mode
-            mode = i + mode_range[0]
-            input_data = data.get_VTK_reader_output_data(mode)
-            if not input_data:
-                print("*  WARNING: No data retrieved for mode {}".format(mode))
-                return None, ''
-
-            # Deatermine skipped flat indices if needed
-            if ignored_blocks:
-                # Extract blocks
-                extract = vtkFiltersExtraction.vtkExtractBlock()
-                extract.SetInputData(input_data)
+        # Generate image only if no reusable one is present
+        if not argTools.is_artifact_reusable(image_full_name, fig_params):
+            pages.append((len(results) - 1, list(range(mode_range[0], mode_range[1] + 1)), image_full_name))
 
-                # Iterate over non-empty blocks
-                it = input_data.NewIterator()
-                it.GoToFirstItem()
-                while not it.IsDoneWithTraversal():
-                    # Retrieve flat index of current non-empty leaf
-                    idx = it.GetCurrentFlatIndex()
+    # Bail out early if all images are present
+    if not pages:
+        return results
 
-                    # Extract current non-empty leaf only if not ignore
-                    if idx not in ignored_blocks:
-                        extract.AddIndex(idx)
+    # Read all modes to be rendered in one pass, next one read in background
+    mode_data = data.iter_time_steps(
+        None, [mode for _, page_modes, _ in pages for mode in page_modes], 1, ignored_blocks)
 
-                    # Iterate to next non-empty leaf
-                    it.GoToNextItem()
+    # Pooled render window sized for first page and viewports are shared by all pages
+    n_rows = (len(pages[0][1]) + n_cols - 1) // n_cols
+    window = acquire_render_window(1200, (1200 * n_rows) // n_cols)
+    try:
+        viewports = []
+        surface_mesh, actor_edges = None, None
 
-                # Retrieve extracted blocks
-                extract.Update()
-                input_data = extract.GetOutput()
-
-            # Create input edges actor only once if requested
-            if not edges_done:
-                # Geometry of input
-                input_geometry = vtkFiltersGeometry.vtkCompositeDataGeometryFilter()
-                input_geometry.SetInputData(input_data)
-                input_geometry.Update()
-                actor_edges = create_edges_actor(input_geometry.GetOutput())
-                edges_done = True
-
-            # Compute resized displacement vectors
-            max_norm = 1.e-16
-            it = input_data.NewIterator()
-            it.UnRegister(None)
-            it.InitTraversal()
-            while not it.IsDoneWithTraversal():
-                da = it.GetCurrentDataObject().GetPointData().GetArray(var_name)
-                if da is not None:
-                    nt = da.GetNumberOfTuples()
-                    for t in range(nt):
-                        dv = da.GetTuple3(t)
-                        d2 = sum([x * x for x in dv])
-                        if d2 > max_norm:
-                            max_norm = d2
-                it.GoToNextItem()
-            f = disp_factor / math.sqrt(max_norm)
+        # Iterate over all pages to be rendered
+        for i_page, (i_result, page_modes, image_full_name) in enumerate(pages):
+            # Image must be generated
+            n_modes = len(page_modes)
+            viz_string = "[argVTK] Creating modes {} to {} visualization".format(
+                page_modes[0],
+                page_modes[-1])
+            if ignored_blocks:
+                viz_string += " ignoring {} blocks".format(len(ignored_block_keys))
+            print(viz_string + " for variable {}".format(var_name))
+
+            # Compute actual number of rows
+            n_rows = (n_modes + n_cols - 1) // n_cols
+            if not n_rows:
+                print("*  WARNING: 0 rows to display")
+                results[i_result] = (None, '')
+                continue
 
-            # Warp each block of data set with computed factor
-            warped_data = input_data.NewInstance()
-            warped_data.CopyStructure(input_data)
-            it.GoToFirstItem()
-            while not it.IsDoneWithTraversal():
-                curInput = it.GetCurrentDataObject()
-                curInput.GetPointData().SetActiveVectors(var_name)
-                warp = vtkFiltersGeneral.vtkWarpVector()
-                warp.SetScaleFactor(f)
-                warp.SetInputData(curInput)
-                warp.Update()
-                warped_data.SetDataSet(it, warp.GetOutput())
-                it.GoToNextItem()
+            # Size render window for page layout
+            window.SetSize(1200, (1200 * n_rows) // n_cols)
+            dx = 1. / n_cols
+            dy = 1. / n_rows
+
+            # Iterate over all viewports of page
+            page_view_direction = view_direction
+            for i in range(n_rows * n_cols):
+                # Data reader output for next mode without skipped blocks
+                points, surface_values, frequency = None, None, None
+                if i < n_modes:
+                    mode, input_data = next(mode_data)
+                    if not input_data:
+                        print("*  WARNING: No data retrieved for mode {}".format(mode))
+                        for j, _, _ in pages[i_page:]:
+                            results[j] = (None, '')
+                        return results
+
+                    # Gather variable values of all leaves in traversal order
+                    leaves = [leaf for _, leaf in iterate_leaves(input_data)]
+                    values = np.concatenate([
+                        vtk_to_numpy(leaf.GetPointData().GetArray(var_name))
+                        if leaf.GetPointData().GetArray(var_name) is not None
+                        else np.zeros((leaf.GetNumberOfPoints(), 3)) for leaf in leaves])
+
+                    # Extract surface and create edges actor only once as mesh does not vary
+                    if surface_mesh is None:
+                        surface_mesh, surface_ids, surface_points = get_indexed_surface(leaves)
+                        n_values = len(values)
+                        actor_edges = create_edges_actor(surface_mesh)
+
+                    # Warp surface points so that largest displacement has given norm
+                    if len(values) == n_values:
+                        max_norm = max(1.e-16, float((values.astype(float) ** 2).sum(axis=1).max()))
+                        surface_values = values[surface_ids]
+                        points = (surface_points + disp_factor / math.sqrt(max_norm) * surface_values).astype(
+                            surface_points.dtype)
+                        frequency = times[mode]
+                    else:
+                        print("*  WARNING: mesh of mode {} differs from that of first mode".format(mode))
 
-            # Geometry
-            geometry = vtkFiltersGeometry.vtkCompositeDataGeometryFilter()
-            geometry.SetInputData(warped_data)
-            geometry.Update()
-            surface_mesh = geometry.GetOutput()
+                # Create missing viewports
+                while len(viewports) <= i:
+                    viewports.append(argVTKModeViewport(
+                        surface_mesh, variable, actor_edges, show_edges, 40 - 5 * n_cols, x_scaling))
 
-            # Use surface center to initialize missing view direction
-            surf_c = surface_mesh.GetCenter()
-            if not view_direction:
-                view_direction = tuple([1. + c for c in surf_c])
+                # Show mode or leave viewport empty
+                viewport = viewports[i]
+                viewport.set_mode(points, surface_values, frequency)
 
-            # Color transfer function
-            ctf, variable_range = create_color_transfer_function(variable, surface_mesh)
+                # Use first warped surface center to initialize missing view direction
+                if not page_view_direction:
+                    page_view_direction = tuple([1. + c for c in viewport.Mesh.GetCenter()])
 
-            # Mapper and actor
-            mapper = vtkRenderingCore.vtkPolyDataMapper()
-            mapper.SetInputConnection(geometry.GetOutputPort())
-            mapper.SetLookupTable(ctf)
-            mapper.SelectColorArray(var_name)
-            mapper.SetScalarModeToUsePointFieldData()
-            if variable_range is not None:
-                mapper.SetScalarRange(variable_range)
-            actor = create_surface_or_wireframe_actor(mapper, surface_mesh)
+                # Lay viewports out row by row from top left corner
+                x = (i % n_cols) * dx
+                y = 1. - (i // n_cols) * dy
+                viewport.place(window, (x, y - dy, x + dx, y), y - .9 * dy, page_view_direction)
 
-            # Text actor
-            text_actor = vtkRenderingCore.vtkTextActor()
-            text_actor.SetInput("      %.1f" % times[mode] + " Hz")
-            props = text_actor.GetTextProperty()
-            props.SetColor(0., 0., 0.)
-            props.SetFontSize(40 - 5 * n_cols)
+            # Remove viewports not used by current page
+            for viewport in viewports[n_rows * n_cols:]:
+                viewport.remove(window)
 
-            # Renderers
-            renderer = create_unique_renderer(actor_edges, view_direction)
-            renderer.SetViewport(x_min[i], y_int[i], x_max[i], y_max[i])
-            renderer.AddViewProp(actor)
-            if show_edges:
-                renderer.AddViewProp(actor_edges)
-            renderer_text = create_unique_renderer(None, view_direction)
-            renderer_text.SetViewport(x_min[i], y_min[i], x_max[i], y_int[i])
-            renderer_text.AddViewProp(text_actor)
+            # Generate trimmed PNG image
+            create_PNG_from_window(window, image_full_name, True)
 
-            # Reset cameras and add renderers to window
-            if x_scaling:
-                renderer.GetActiveCamera().UseHorizontalViewAngleOn()
-            renderer.ResetCamera()
-            window.AddRenderer(renderer)
-            renderer_text.ResetCamera()
-            window.AddRenderer(renderer_text)
+    finally:
+        # Hand render window back to pool
+        release_render_window(window)
 
-        # Fill voids in matrix with empty viewports
-        for i in range(n_modes, n_rows * n_cols):
-            renderer = create_unique_renderer(None, view_direction)
-            renderer.SetViewport(x_min[i], y_min[i], x_max[i], y_max[i])
-            window.AddRenderer(renderer)
-
-        # Generate and trim PNG image
-        create_PNG_from_window(window, image_full_name)
-        trim_image(image_full_name)
-
-    # Create caption
-    if ignored_block_keys:
-        if parameters.BackendType == "LaTeX":
-            ignored_set = "\{{{}\}}".format(
-                ", ".join([r"\texttt{{{}}}".format(x) for x in ignored_block_keys]))
-        else:
-            ignored_set = "{{{}}}".format(", ".join(["{}".format(x) for x in ignored_block_keys]))
-    caption = create_caption(
-        parameters.Backend,
-        "Modes {} to {} ".format(
-            mode_range[0],
-            mode_range[1]),
-        file_name,
-        None,
-        variable,
-        None,
-        r". Blocks with indices or case-independent names in {} are omitted".format(ignored_set)
-        if ignored_block_keys else None)
-
-    # Return image base name and caption
-    return output_base_name, caption
+    # Return image base names and captions of all pages
+    return results
 
 
 def many_blocks(parameters, fig_params, data, variable, file_name):
@@ -1296,8 +1694,8 @@ def many_blocks(parameters, fig_params, data, variable, file_name):
         view_direction)
     image_full_name = os.path.join(parameters.OutputDir, output_base_name + ".png")
 
-    # Generate image only if not already present
-    if not os.path.isfile(image_full_name):
+    # Generate image only if no reusable one is present
+    if not argTools.is_artifact_reusable(image_full_name, fig_params):
         # Figure out number of non-empty blocks to determine number of viewports
         it = input_data.NewIterator()
         it.GoToFirstItem()
@@ -1340,97 +1738,99 @@ def many_blocks(parameters, fig_params, data, variable, file_name):
             y_int.append(y - .9 * dy)
             y_max.append(y)
 
-        # Render window
-        window = vtkRenderingCore.vtkRenderWindow()
-        window.SetOffScreenRendering(True)
-        window.SetSize(1200, (1200 * n_rows) // n_cols)
+        # Pooled render window
+        window = acquire_render_window(1200, (1200 * n_rows) // n_cols)
+        try:
 
-        # Iterate over non-empty blocks and create images
-        y_offset_done = False
-        it.GoToFirstItem()
-        i = -1
-        while not it.IsDoneWithTraversal():
-            # Increment block index and check if in range
-            i += 1
-            if i < block_range[0]:
-                # Index below range, continue loop
-                it.GoToNextItem()
-                continue
+            # Iterate over non-empty blocks and create images
+            y_offset_done = False
+            it.GoToFirstItem()
+            i = -1
+            while not it.IsDoneWithTraversal():
+                # Increment block index and check if in range
+                i += 1
+                if i < block_range[0]:
+                    # Index below range, continue loop
+                    it.GoToNextItem()
+                    continue
 
-            if i > block_range[1]:
-                # Index above range, terminate loop
-                break
+                if i > block_range[1]:
+                    # Index above range, terminate loop
+                    break
 
-            # Retrieve flat index of current non-empty leaf
-            idx = it.GetCurrentFlatIndex()
+                # Retrieve flat index of current non-empty leaf
+                idx = it.GetCurrentFlatIndex()
 
-            # Extract block
-            extract = vtkFiltersExtraction.vtkExtractBlock()
-            extract.SetInputData(input_data)
-            extract.AddIndex(idx)
+                # Extract block
+                extract = vtkFiltersExtraction.vtkExtractBlock()
+                extract.SetInputData(input_data)
+                extract.AddIndex(idx)
 
-            # Geometry
-            geometry = vtkFiltersGeometry.vtkCompositeDataGeometryFilter()
-            geometry.SetInputConnection(extract.GetOutputPort())
-            geometry.Update()
-            surface_mesh = geometry.GetOutput()
+                # Geometry
+                geometry = vtkFiltersGeometry.vtkCompositeDataGeometryFilter()
+                geometry.SetInputConnection(extract.GetOutputPort())
+                geometry.Update()
+                surface_mesh = geometry.GetOutput()
 
-            # Use surface center to initialize missing view direction
-            surf_c = surface_mesh.GetCenter()
-            if not view_direction:
-                view_direction = tuple([1. + c for c in surf_c])
+                # Use surface center to initialize missing view direction
+                surf_c = surface_mesh.GetCenter()
+                if not view_direction:
+                    view_direction = tuple([1. + c for c in surf_c])
 
-            # Mapper and actor
-            mapper = vtkRenderingCore.vtkPolyDataMapper()
-            mapper.SetInputConnection(geometry.GetOutputPort())
-            actor = create_surface_or_wireframe_actor(mapper, surface_mesh)
+                # Mapper and actor
+                mapper = vtkRenderingCore.vtkPolyDataMapper()
+                mapper.SetInputConnection(geometry.GetOutputPort())
+                actor = create_surface_or_wireframe_actor(mapper, surface_mesh)
+
+                # Retrieve block name if it exists and insert into image
+                meta_data = extract.GetOutput().GetMetaData(0)
+                if meta_data:
+                    # Text actor
+                    text_actor = vtkRenderingCore.vtkTextActor()
+                    text_actor.SetInput("  " + meta_data.Get(vtkCommonDataModel.vtkCompositeDataSet.NAME()))
+                    props = text_actor.GetTextProperty()
+                    props.SetColor(0., 0., 0.)
+                    props.SetFontSize(50 - 6 * n_cols)
+
+                # Renderers
+                renderer = create_unique_renderer(surface_mesh, view_direction)
+                renderer.SetViewport(x_min[i], y_int[i], x_max[i], y_max[i])
+                renderer.AddViewProp(actor)
+                if show_edges:
+                    actor_edges = create_edges_actor(surface_mesh)
+                    renderer.AddViewProp(actor_edges)
+                if i and show_axes:
+                    actor_axes = create_edges_actor(surface_mesh)
+                    renderer.AddViewProp(actor_axes)
+                if meta_data:
+                    renderer_text = create_unique_renderer(None, view_direction)
+                    renderer_text.SetViewport(x_min[i], y_min[i], x_max[i], y_int[i])
+                    renderer_text.AddViewProp(text_actor)
+
+                # Reset cameras and add renderers to window
+                if x_scaling:
+                    renderer.GetActiveCamera().UseHorizontalViewAngleOn()
+                renderer.ResetCamera()
+                window.AddRenderer(renderer)
+                if meta_data:
+                    renderer_text.ResetCamera()
+                    window.AddRenderer(renderer_text)
 
-            # Retrieve block name if it exists and insert into image
-            meta_data = extract.GetOutput().GetMetaData(0)
-            if meta_data:
-                # Text actor
-                text_actor = vtkRenderingCore.vtkTextActor()
-                text_actor.SetInput("  " + meta_data.Get(vtkCommonDataModel.vtkCompositeDataSet.NAME()))
-                props = text_actor.GetTextProperty()
-                props.SetColor(0., 0., 0.)
-                props.SetFontSize(50 - 6 * n_cols)
-
-            # Renderers
-            renderer = create_unique_renderer(surface_mesh, view_direction)
-            renderer.SetViewport(x_min[i], y_int[i], x_max[i], y_max[i])
-            renderer.AddViewProp(actor)
-            if show_edges:
-                actor_edges = create_edges_actor(surface_mesh)
-                renderer.AddViewProp(actor_edges)
-            if i and show_axes:
-                actor_axes = create_edges_actor(surface_mesh)
-                renderer.AddViewProp(actor_axes)
-            if meta_data:
-                renderer_text = create_unique_renderer(None, view_direction)
-                renderer_text.SetViewport(x_min[i], y_min[i], x_max[i], y_int[i])
-                renderer_text.AddViewProp(text_actor)
-
-            # Reset cameras and add renderers to window
-            if x_scaling:
-                renderer.GetActiveCamera().UseHorizontalViewAngleOn()
-            renderer.ResetCamera()
-            window.AddRenderer(renderer)
-            if meta_data:
-                renderer_text.ResetCamera()
-                window.AddRenderer(renderer_text)
+                # Iterate to next non-empty leaf
+                it.GoToNextItem()
 
-            # Iterate to next non-empty leaf
-            it.GoToNextItem()
+            # Fill voids in matrix with empty viewports
+            for i in range(n_blocks, n_rows * n_cols):
+                renderer = create_unique_renderer(None, view_direction)
+                renderer.SetViewport(x_min[i], y_min[i], x_max[i], y_max[i])
+                window.AddRenderer(renderer)
 
-        # Fill voids in matrix with empty viewports
-        for i in range(n_blocks, n_rows * n_cols):
-            renderer = create_unique_renderer(None, view_direction)
-            renderer.SetViewport(x_min[i], y_min[i], x_max[i], y_max[i])
-            window.AddRenderer(renderer)
+            # Generate trimmed PNG image
+            create_PNG_from_window(window, image_full_name, True)
 
-        # Generate and trim PNG image
-        create_PNG_from_window(window, image_full_name)
-        trim_image(image_full_name)
+        finally:
+            # Hand render window back to pool
+            release_render_window(window)
 
     # Create caption
     caption = create_caption(
@@ -1447,9 +1847,9 @@ def many_blocks(parameters, fig_params, data, variable, file_name):
     return output_base_name, caption
 
 
-def all_blocks(parameters, fig_params, data, variable, file_name):
-    """Add surface rendering figures for each mesh block
-       for a specified point or cell data, scalar or vector variable
+def render_four_surfaces(surface_mesh, image_full_name, view_direction, show_edges, show_axes):
+    """Render perspective and three parallel views of surface mesh into
+       a single trimmed PNG image
     """
 
     # Viewport ranges
@@ -1463,52 +1863,106 @@ def all_blocks(parameters, fig_params, data, variable, file_name):
     y_vup = (0., 0., 0., 1.)
     z_vup = (0., 1., 1., 0.)
 
+    # Mapper and actor
+    mapper = vtkRenderingCore.vtkPolyDataMapper()
+    mapper.SetInputData(surface_mesh)
+    actor = create_surface_or_wireframe_actor(mapper, surface_mesh)
+
+    # Pooled render window
+    window = acquire_render_window(600, 600)
+    try:
+
+        # Camera positions
+        surf_c = surface_mesh.GetCenter()
+        x_cam = [view_direction[0], surf_c[0] + 1., surf_c[0], surf_c[0]]
+        y_cam = [view_direction[1], surf_c[1], surf_c[1] + 1., surf_c[1]]
+        z_cam = [view_direction[2], surf_c[2], surf_c[2], surf_c[2] + 1.]
+
+        # Iterate over viewports
+        for i in range(4):
+            # Camera
+            camera = vtkRenderingCore.vtkCamera()
+            camera.SetClippingRange(1., 100.)
+            camera.SetFocalPoint(surface_mesh.GetCenter())
+            camera.SetPosition(x_cam[i], y_cam[i], z_cam[i])
+            if i:
+                camera.SetViewUp(x_vup[i], y_vup[i], z_vup[i])
+                camera.ParallelProjectionOn()
+
+            # Renderer
+            renderer = vtkRenderingCore.vtkRenderer()
+            renderer.SetViewport(x_min[i], y_min[i], x_max[i], y_max[i])
+            renderer.SetActiveCamera(camera)
+            renderer.SetBackground(1., 1., 1.)
+            renderer.AddViewProp(actor)
+            if show_edges:
+                actor_edges = create_edges_actor(surface_mesh)
+                renderer.AddViewProp(actor_edges)
+            if i and show_axes:
+                actor_axes = create_axes_actor(surface_mesh, renderer, i)
+                renderer.AddViewProp(actor_axes)
+            renderer.ResetCamera()
+
+            # Properly light this renderer and add to render window
+            vtkRenderingCore.vtkLightKit().AddLightsToRenderer(renderer)
+            window.AddRenderer(renderer)
+
+        # Generate trimmed PNG image
+        create_PNG_from_window(window, image_full_name, True)
+
+    finally:
+        # Hand render window back to pool
+        release_render_window(window)
+
+
+def all_blocks(parameters, fig_params, data, variable, file_name, executor=None, block_outputs=None,
+               block_IDs=None):
+    """Add surface rendering figures for each mesh block
+       for a specified point or cell data, scalar or vector variable
+       NB: images are rendered by worker processes when an executor is given,
+           blocks are consumed one at a time when block_outputs is given as
+           pairs of block ID and output data where only that block is non-empty,
+           and data are read only if some image must be generated when IDs of
+           non-empty blocks are given instead; block map then lacks these blocks
+    """
+
     # Determine skipped blocks if any
-    ignored_blocks = get_ignored_block_flat_indices(
+    ignored_blocks = get_ignored_block_IDs(
         fig_params.get("ignore_blocks"), data)
     viz_string = "[argVTK] Creating four-surface visualization"
 
-    # Get handle on data reader output
-    input_data = data.get_VTK_reader_output_data(0)
-
-    # Retrieve block meta-information
-    meta_data = data.get_meta_information()[0]
-    block_names_lower = [n.lower() for n in meta_data["block names"]]
-    block_IDs = list(meta_data["block IDs"])
+    # Iterate over leaves of each block, read either one block at a time or all at once
+    if block_outputs is not None:
+        blocks_leaves = (
+            (b_id, list(iterate_leaves(output))) for b_id, output in block_outputs)
+    elif block_IDs is not None:
+        # Defer reading until leaves of some block are needed
+        blocks_leaves = ((b_id, None) for b_id in block_IDs)
+    else:
+        # Get handle on data reader output without skipped blocks
+        input_data = data.get_VTK_reader_output_data(0, ignored_blocks)
 
-    # Map from block IDs to flat indices
-    block_id_to_flat = {}
-
-    # Iterate over non-empty blocks of possibly split mesh
-    it = input_data.NewIterator()
-    it.GoToFirstItem()
-    while not it.IsDoneWithTraversal():
-        # Retrieve name and ID of current non-empty leaf
-        b_nl = it.GetCurrentMetaData().Get(vtkCommonDataModel.vtkCompositeDataSet.NAME()).lower()
-        b_id = list(block_IDs)[block_names_lower.index(b_nl)]
-
-        # Retrieve flat index and name of current block and update map
-        idx = it.GetCurrentFlatIndex()
-
-        # Update map depending on whether ID was already encountered
-        if b_id in block_id_to_flat:
-            # Key was already present, just append new flat index
-            block_id_to_flat[b_id].append(idx)
-        elif idx not in ignored_blocks:
-            # Otherwise create new entry only if block is not ignored
-            block_id_to_flat[b_id] = [idx]
-
-        # Iterate to next non-empty leaf
-        it.GoToNextItem()
+        # Map from block IDs to flat indices and from flat indices to leaves
+        leaves = dict(iterate_leaves(input_data))
+        blocks_leaves = (
+            (b_id, [(idx, leaves[idx]) for idx in b_flat_ids])
+            for b_id, b_flat_ids in data.get_block_flat_indices(ignored_blocks).items())
 
     # Retrieve figure parameters
     show_edges = fig_params.get("edges", False)
     view_direction = fig_params.get("view_direction", ())
     show_axes = fig_params.get("axes", False)
 
-    # Iterate over non-omitted blocks and create images and titles
+    # Iterate over non-omitted and non-empty blocks and create images and titles
+    block_id_to_flat = {}
     block_images_and_captions = {}
-    for b_id, b_flat_ids in block_id_to_flat.items():
+    renderings = []
+    for b_id, b_leaves in blocks_leaves:
+        # Map block ID to flat indices of its leaves when these were read
+        if b_leaves is not None:
+            if not b_leaves:
+                continue
+            block_id_to_flat[b_id] = [idx for idx, _ in b_leaves]
 
         # Assemble image file name
         output_base_name = make_base_name(
@@ -1519,78 +1973,43 @@ def all_blocks(parameters, fig_params, data, variable, file_name):
         image_full_name = os.path.join(parameters.OutputDir,
                                        "{}.png".format(output_base_name))
 
-        # Generate image only if not already present
-        if not os.path.isfile(image_full_name):
+        # Generate image only if no reusable one is present
+        if not argTools.is_artifact_reusable(image_full_name, fig_params):
             # Image must be generated
             print("{} of block {}".format(
                 viz_string,
                 b_id))
 
-            # Extract relevant blocks
-            extract = vtkFiltersExtraction.vtkExtractBlock()
-            extract.SetInputData(input_data)
-            for idx in b_flat_ids:
-                extract.AddIndex(idx)
+            # Read leaves of block from data output when deferred
+            if b_leaves is None:
+                leaves = dict(iterate_leaves(data.get_VTK_reader_output_data(0, ignored_blocks)))
+                b_leaves = [(idx, leaves[idx]) for idx in data.get_block_flat_indices(ignored_blocks)[b_id]]
+
+            # Gather relevant leaves
+            block_leaves = vtkCommonDataModel.vtkMultiBlockDataSet()
+            for i, (_, leaf) in enumerate(b_leaves):
+                block_leaves.SetBlock(i, leaf)
 
             # Geometry
             geometry = vtkFiltersGeometry.vtkCompositeDataGeometryFilter()
-            geometry.SetInputConnection(extract.GetOutputPort())
+            geometry.SetInputData(block_leaves)
             geometry.Update()
             surface_mesh = geometry.GetOutput()
 
-            # Use surface center to initialize missing view direction
+            # Use surface center of block to initialize missing view direction
+            # NB: requested view direction is left unchanged for subsequent blocks,
+            #     whose image names would otherwise depend on rendered blocks
             surf_c = surface_mesh.GetCenter()
-            if not view_direction:
-                view_direction = tuple([1. + c for c in surf_c])
-
-            # Mapper and actor
-            mapper = vtkRenderingCore.vtkPolyDataMapper()
-            mapper.SetInputConnection(geometry.GetOutputPort())
-            actor = create_surface_or_wireframe_actor(mapper, surface_mesh)
-
-            # Render window
-            window = vtkRenderingCore.vtkRenderWindow()
-            window.SetOffScreenRendering(True)
-            window.SetSize(600, 600)
-
-            # Camera positions
-            surf_c = surface_mesh.GetCenter()
-            x_cam = [view_direction[0], surf_c[0] + 1., surf_c[0], surf_c[0]]
-            y_cam = [view_direction[1], surf_c[1], surf_c[1] + 1., surf_c[1]]
-            z_cam = [view_direction[2], surf_c[2], surf_c[2], surf_c[2] + 1.]
-
-            # Iterate over viewports
-            for i in range(4):
-                # Camera
-                camera = vtkRenderingCore.vtkCamera()
-                camera.SetClippingRange(1., 100.)
-                camera.SetFocalPoint(surface_mesh.GetCenter())
-                camera.SetPosition(x_cam[i], y_cam[i], z_cam[i])
-                if i:
-                    camera.SetViewUp(x_vup[i], y_vup[i], z_vup[i])
-                    camera.ParallelProjectionOn()
-
-                # Renderer
-                renderer = vtkRenderingCore.vtkRenderer()
-                renderer.SetViewport(x_min[i], y_min[i], x_max[i], y_max[i])
-                renderer.SetActiveCamera(camera)
-                renderer.SetBackground(1., 1., 1.)
-                renderer.AddViewProp(actor)
-                if show_edges:
-                    actor_edges = create_edges_actor(surface_mesh)
-                    renderer.AddViewProp(actor_edges)
-                if i and show_axes:
-                    actor_axes = create_axes_actor(surface_mesh, renderer, i)
-                    renderer.AddViewProp(actor_axes)
-                renderer.ResetCamera()
-
-                # Properly light this renderer and add to render window
-                vtkRenderingCore.vtkLightKit().AddLightsToRenderer(renderer)
-                window.AddRenderer(renderer)
-
-            # Generate and trim PNG image
-            create_PNG_from_window(window, image_full_name)
-            trim_image(image_full_name)
+            block_view_direction = view_direction or tuple([1. + c for c in surf_c])
+
+            # Render images in worker processes when possible
+            render_args = (image_full_name, block_view_direction, show_edges, show_axes)
+            mesh_arrays = get_mesh_arrays(surface_mesh) if executor else None
+            if mesh_arrays:
+                renderings.append(executor.submit(
+                    apply_to_mesh_arrays, render_four_surfaces, mesh_arrays, *render_args))
+            else:
+                render_four_surfaces(surface_mesh, *render_args)
 
         # Create caption
         if parameters.BackendType == "LaTeX":
@@ -1617,6 +2036,10 @@ def all_blocks(parameters, fig_params, data, variable, file_name):
         block_images_and_captions[int(b_id)] = (
             output_base_name, caption)
 
+    # Wait for images rendered by worker processes
+    for rendering in renderings:
+        rendering.result()
+
     # Return block map and per-block image base names and captions
     return block_id_to_flat, block_images_and_captions
 
@@ -1645,8 +2068,8 @@ def contour(parameters, fig_params, data, variable, file_name):
     image_full_name = os.path.join(parameters.OutputDir,
                                    output_base_name + ".png")
 
-    # Generate image only if not already present
-    if not os.path.isfile(image_full_name):
+    # Generate image only if no reusable one is present
+    if not argTools.is_artifact_reusable(image_full_name, fig_params):
         # Get handle on data reader output
         input_data = data.get_VTK_reader_output_data(step)
 
@@ -1658,11 +2081,8 @@ def contour(parameters, fig_params, data, variable, file_name):
         contour.SetNumberOfContours(1)
         contour.SetValue(0, iso_value)
 
-        # Geometries
-        geometry_full = vtkFiltersGeometry.vtkCompositeDataGeometryFilter()
-        geometry_full.SetInputData(input_data)
-        geometry_full.Update()
-        surface_mesh = geometry_full.GetOutput()
+        # Surface of data shared with other visualizations
+        surface_mesh = data.get_VTK_surface_mesh(step)
 
         # Use surface center to initialize missing view direction
         surf_c = surface_mesh.GetCenter()
@@ -1698,9 +2118,8 @@ def contour(parameters, fig_params, data, variable, file_name):
         renderer.AddViewProp(actor)
         renderer.ResetCamera()
 
-        # Generate and trim PNG image
-        create_PNG_from_renderer(renderer, image_full_name, 600, 600)
-        trim_image(image_full_name)
+        # Generate trimmed PNG image
+        create_PNG_from_renderer(renderer, image_full_name, 600, 600, True)
 
     # Create caption
     caption = create_caption(
@@ -1743,8 +2162,8 @@ def cut(parameters, fig_params, data, variable, file_name):
     image_full_name = os.path.join(parameters.OutputDir,
                                    output_base_name + ".png")
 
-    # Generate image only if not already present
-    if not os.path.isfile(image_full_name):
+    # Generate image only if no reusable one is present
+    if not argTools.is_artifact_reusable(image_full_name, fig_params):
         # Get handle on data reader output
         input_data = data.get_VTK_reader_output_data(step)
 
@@ -1752,11 +2171,8 @@ def cut(parameters, fig_params, data, variable, file_name):
         plane.SetOrigin(0., 0., 0.)
         plane.SetNormal(normal_vector)
 
-        # Geometry
-        geometry_full = vtkFiltersGeometry.vtkCompositeDataGeometryFilter()
-        geometry_full.SetInputData(input_data)
-        geometry_full.Update()
-        surface_mesh = geometry_full.GetOutput()
+        # Surface of data shared with other visualizations
+        surface_mesh = data.get_VTK_surface_mesh(step)
 
         # Use surface center to initialize missing view direction
         surf_c = surface_mesh.GetCenter()
@@ -1800,7 +2216,7 @@ def cut(parameters, fig_params, data, variable, file_name):
         renderer = create_unique_renderer(surface_mesh, view_direction)
         renderer.AddViewProp(actor)
         if ghost_opacity:
-            ghostMapper = make_mapper(geometry_full.GetOutputPort(),
+            ghostMapper = make_mapper(surface_mesh,
                                       ctf, variable, variable_range)
             ghostActor = create_surface_or_wireframe_actor(
                 ghostMapper, surface_mesh, ghost_opacity)
@@ -1815,9 +2231,8 @@ def cut(parameters, fig_params, data, variable, file_name):
             renderer.AddViewProp(actor_bar)
         renderer.ResetCamera()
 
-        # Generate and trim PNG image
-        create_PNG_from_renderer(renderer, image_full_name, 600, 600)
-        trim_image(image_full_name)
+        # Generate trimmed PNG image
+        create_PNG_from_renderer(renderer, image_full_name, 600, 600, True)
 
     # Create caption
     caption = create_caption(
@@ -1859,8 +2274,8 @@ def clip(parameters, fig_params, data, variable, file_name):
     image_full_name = os.path.join(parameters.OutputDir,
                                    output_base_name + ".png")
 
-    # Generate image only if not already present
-    if not os.path.isfile(image_full_name):
+    # Generate image only if no reusable one is present
+    if not argTools.is_artifact_reusable(image_full_name, fig_params):
         # Get handle on data reader output
         input_data = data.get_VTK_reader_output_data(step)
 
@@ -1872,12 +2287,8 @@ def clip(parameters, fig_params, data, variable, file_name):
         clip.SetInputData(input_data)
         clip.SetClipFunction(plane)
 
-        # Geometry
-        geometry_full = vtkFiltersGeometry.vtkCompositeDataGeometryFilter()
-        geometry_full.SetInputData(input_data)
-        geometry_full.Update()
-
-        surface_mesh = geometry_full.GetOutput()
+        # Surface of data shared with other visualizations
+        surface_mesh = data.get_VTK_surface_mesh(step)
 
         # Use surface center to initialize missing view direction
         surf_c = surface_mesh.GetCenter()
@@ -1893,7 +2304,7 @@ def clip(parameters, fig_params, data, variable, file_name):
 
         # vtkClipPolyData requires an implicit function
         clipper = vtkFiltersCore.vtkClipPolyData()
-        clipper.SetInputConnection(geometry_full.GetOutputPort())
+        clipper.SetInputData(surface_mesh)
         clipper.SetClipFunction(plane)
         clipper.GenerateClipScalarsOn()
         clipper.GenerateClippedOutputOn()
@@ -1952,9 +2363,8 @@ def clip(parameters, fig_params, data, variable, file_name):
             renderer.AddViewProp(actor_bar)
         renderer.ResetCamera()
 
-        # Generate and trim PNG image
-        create_PNG_from_renderer(renderer, image_full_name, 600, 600)
-        trim_image(image_full_name)
+        # Generate trimmed PNG image
+        create_PNG_from_renderer(renderer, image_full_name, 600, 600, True)
 
     # Create caption
     caption = create_caption(
@@ -1995,16 +2405,13 @@ def multiclip(parameters, fig_params, data, variable, file_name):
     image_full_name = os.path.join(parameters.OutputDir,
                                    output_base_name + ".png")
 
-    # Generate image only if not already present
-    if not os.path.isfile(image_full_name):
+    # Generate image only if no reusable one is present
+    if not argTools.is_artifact_reusable(image_full_name, fig_params):
         # Get handle on data reader output
         input_data = data.get_VTK_reader_output_data(step)
 
-        # Geometry
-        geometry_full = vtkFiltersGeometry.vtkCompositeDataGeometryFilter()
-        geometry_full.SetInputData(input_data)
-        geometry_full.Update()
-        surface_mesh = geometry_full.GetOutput()
+        # Surface of data shared with other visualizations
+        surface_mesh = data.get_VTK_surface_mesh(step)
 
         # Use surface center to initialize missing view direction
         surf_c = surface_mesh.GetCenter()
@@ -2035,13 +2442,12 @@ def multiclip(parameters, fig_params, data, variable, file_name):
             clip = new_clip
             i += 1
         geometry_clip = vtkFiltersGeometry.vtkCompositeDataGeometryFilter()
-        geometry_full.SetInputData(input_data)
         geometry_clip.SetInputConnection(clip.GetOutputPort())
         geometry_clip.Update()
 
         if ghost_opacity:
             clipper = vtkFiltersCore.vtkClipPolyData()
-            clipper.SetInputConnection(geometry_full.GetOutputPort())
+            clipper.SetInputData(surface_mesh)
             clipper.SetClipFunction(planes[0])
             clipper.GenerateClipScalarsOn()
             clipper.GenerateClippedOutputOn()
@@ -2076,9 +2482,8 @@ def multiclip(parameters, fig_params, data, variable, file_name):
             renderer.AddViewProp(actor_edges)
         renderer.ResetCamera()
 
-        # Generate and trim PNG image
-        create_PNG_from_renderer(renderer, image_full_name, 600, 600)
-        trim_image(image_full_name)
+        # Generate trimmed PNG image
+        create_PNG_from_renderer(renderer, image_full_name, 600, 600, True)
 
     # Create caption
     caption = create_caption(
@@ -2126,16 +2531,13 @@ def multicut(parameters, fig_params, data, variable, file_name):
     image_full_name = os.path.join(parameters.OutputDir,
                                    output_base_name + ".png")
 
-    # Generate image only if not already present
-    if not os.path.isfile(image_full_name):
+    # Generate image only if no reusable one is present
+    if not argTools.is_artifact_reusable(image_full_name, fig_params):
         # Get handle on data reader output
         input_data = data.get_VTK_reader_output_data(step)
 
-        # Geometry
-        geometry_full = vtkFiltersGeometry.vtkCompositeDataGeometryFilter()
-        geometry_full.SetInputData(input_data)
-        geometry_full.Update()
-        surface_mesh = geometry_full.GetOutput()
+        # Surface of data shared with other visualizations
+        surface_mesh = data.get_VTK_surface_mesh(step)
 
         # Use surface center to initialize missing view direction
         surf_c = surface_mesh.GetCenter()
@@ -2190,9 +2592,8 @@ def multicut(parameters, fig_params, data, variable, file_name):
             renderer.AddViewProp(actor_bar)
         renderer.ResetCamera()
 
-        # Generate and trim PNG image
-        create_PNG_from_renderer(renderer, image_full_name, 600, 600)
-        trim_image(image_full_name)
+        # Generate trimmed PNG image
+        create_PNG_from_renderer(renderer, image_full_name, 600, 600, True)
 
     # Create caption
     caption = create_caption(
@@ -2238,17 +2639,13 @@ def cut3D(parameters, fig_params, data, variable, file_name):
     image_full_name = os.path.join(parameters.OutputDir,
                                    output_base_name + ".png")
 
-    # Generate image only if not already present
-    if not os.path.isfile(image_full_name):
+    # Generate image only if no reusable one is present
+    if not argTools.is_artifact_reusable(image_full_name, fig_params):
         # Get handle on data reader output
         input_data = data.get_VTK_reader_output_data(step)
 
-        # Create full geometry
-        geometry_full = vtkFiltersGeometry.vtkCompositeDataGeometryFilter()
-        geometry_full.SetInputData(input_data)
-        geometry_full.Update()
-
-        surface_mesh = geometry_full.GetOutput()
+        # Surface of data shared with other visualizations
+        surface_mesh = data.get_VTK_surface_mesh(step)
 
         # Use surface center to initialize missing view direction
         surf_c = surface_mesh.GetCenter()
@@ -2306,7 +2703,7 @@ def cut3D(parameters, fig_params, data, variable, file_name):
             renderer.AddViewProp(actor)
 
         if ghost_opacity:
-            ghostMapper = make_mapper(geometry_full.GetOutputPort(),
+            ghostMapper = make_mapper(surface_mesh,
                                       ctf, variable, variable_range)
             ghostActor = create_surface_or_wireframe_actor(
                 ghostMapper, surface_mesh, ghost_opacity)
@@ -2321,9 +2718,8 @@ def cut3D(parameters, fig_params, data, variable, file_name):
         #     renderer.AddViewProp(actor_bar)
         renderer.ResetCamera()
 
-        # Generate and trim PNG image
-        create_PNG_from_renderer(renderer, image_full_name, 600, 600)
-        trim_image(image_full_name)
+        # Generate trimmed PNG image
+        create_PNG_from_renderer(renderer, image_full_name, 600, 600, True)
 
     # Create caption
     caption = create_caption(
@@ -2367,17 +2763,13 @@ def slice_(parameters, fig_params, data, variable, file_name):
     image_full_name = os.path.join(parameters.OutputDir,
                                    output_base_name + ".png")
 
-    # Generate image only if not already present
-    if not os.path.isfile(image_full_name):
+    # Generate image only if no reusable one is present
+    if not argTools.is_artifact_reusable(image_full_name, fig_params):
         # Get handle on data reader output
         input_data = data.get_VTK_reader_output_data(step)
 
-        # Create full geometry
-        geometry_full = vtkFiltersGeometry.vtkCompositeDataGeometryFilter()
-        geometry_full.SetInputData(input_data)
-        geometry_full.Update()
-
-        surface_mesh = geometry_full.GetOutput()
+        # Surface of data shared with other visualizations
+        surface_mesh = data.get_VTK_surface_mesh(step)
 
         # Use surface center to initialize missing view direction
         surf_c = surface_mesh.GetCenter()
@@ -2427,7 +2819,7 @@ def slice_(parameters, fig_params, data, variable, file_name):
             renderer.AddViewProp(actor)
 
         if ghost_opacity:
-            ghostMapper = make_mapper(geometry_full.GetOutputPort(),
+            ghostMapper = make_mapper(surface_mesh,
                                       ctf, variable, variable_range)
             ghostActor = create_surface_or_wireframe_actor(ghostMapper, surface_mesh, ghost_opacity)
             if ghost_wireframe:
@@ -2441,9 +2833,8 @@ def slice_(parameters, fig_params, data, variable, file_name):
         #     renderer.AddViewProp(actor_bar)
         renderer.ResetCamera()
 
-        # Generate and trim PNG image
-        create_PNG_from_renderer(renderer, image_full_name, 600, 600)
-        trim_image(image_full_name)
+        # Generate trimmed PNG image
+        create_PNG_from_renderer(renderer, image_full_name, 600, 600, True)
 
     # Create caption
     caption = create_caption(
@@ -0,0 +1,139 @@
+#HEADER
+#                   arg/tests/test_argDataInterface.py
+#               Automatic Report Generator (ARG) v. 1.0
+#
+# Copyright 2020 National Technology & Engineering Solutions of Sandia, LLC
+# (NTESS). Under the terms of Contract DE-NA0003525 with NTESS, the U.S.
+# Government retains certain rights in this software.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# Questions? Visit gitlab.com/AutomaticReportGenerator/arg
+#
+#HEADER
+
+import os
+import tempfile
+from unittest import TestCase, skipUnless
+
+import numpy as np
+
+from tests.test_argHDF5ExodusReader import HAS_READERS, make_grid, write_Exodus_file
+
+from arg.DataInterface.argDataInterface import argDataInterface
+
+
+@skipUnless(HAS_READERS, "netCDF4, h5py, or VTK not available")
+class TestRegistry(TestCase):
+    def setUp(self):
+        self.TemporaryDirectory = tempfile.TemporaryDirectory()
+        self.Coordinates, self.Connectivity = make_grid(2, 2, 2)
+        self.FileNames = [self.write_model("model{}.e".format(i)) for i in range(3)]
+        self.Capacity = argDataInterface.RegistryCapacity
+        self.Budget = argDataInterface.MemoryBudget
+        argDataInterface.clear_registry()
+
+    def tearDown(self):
+        argDataInterface.clear_registry()
+        argDataInterface.set_registry_capacity(self.Capacity)
+        argDataInterface.set_memory_budget(self.Budget)
+        self.TemporaryDirectory.cleanup()
+
+    def write_model(self, file_name, n_steps=2):
+        full_name = os.path.join(self.TemporaryDirectory.name, file_name)
+        write_Exodus_file(full_name, self.Coordinates, self.Connectivity,
+                          [(10, np.arange(len(self.Connectivity)))], n_steps)
+        return full_name
+
+    def test_unchanged_database_is_reused(self):
+        reader = argDataInterface.factory("HDF5ExodusII", self.FileNames[0], "Temp")
+        self.assertIs(argDataInterface.factory("HDF5ExodusII", self.FileNames[0], "Temp"), reader)
+        self.assertIsNot(argDataInterface.factory("HDF5ExodusII", self.FileNames[0], "V"), reader)
+
+    def test_modification_time_change_invalidates_key(self):
+        reader = argDataInterface.factory("HDF5ExodusII", self.FileNames[0], "Temp")
+        stat = os.stat(self.FileNames[0])
+        os.utime(self.FileNames[0], ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        self.assertIsNot(argDataInterface.factory("HDF5ExodusII", self.FileNames[0], "Temp"), reader)
+
+    def test_size_change_invalidates_key(self):
+        reader = argDataInterface.factory("HDF5ExodusII", self.FileNames[0], "Temp")
+        stat = os.stat(self.FileNames[0])
+        os.replace(self.write_model("new.e", 5), self.FileNames[0])
+        os.utime(self.FileNames[0], ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        self.assertNotEqual(os.stat(self.FileNames[0]).st_size, stat.st_size)
+        other = argDataInterface.factory("HDF5ExodusII", self.FileNames[0], "Temp")
+        self.assertIsNot(other, reader)
+        self.assertEqual(len(other.get_available_times()), 5)
+
+    def test_least_recently_used_reader_is_evicted_and_closed(self):
+        argDataInterface.set_registry_capacity(2)
+        readers = [argDataInterface.factory("HDF5ExodusII", f, "Temp") for f in self.FileNames[:2]]
+        files = readers[0].get_accessors()
+
+        # Reusing first reader makes second one least recently used
+        self.assertIs(argDataInterface.factory("HDF5ExodusII", self.FileNames[0], "Temp"), readers[0])
+        argDataInterface.factory("HDF5ExodusII", self.FileNames[2], "Temp")
+        self.assertEqual(len(argDataInterface.Registry), 2)
+        self.assertIs(argDataInterface.factory("HDF5ExodusII", self.FileNames[0], "Temp"), readers[0])
+        self.assertIsNone(readers[1].OpenFiles)
+        self.assertTrue(all(f.id.valid for f in files))
+
+        # Closed readers reopen their files when used again
+        np.testing.assert_array_equal(readers[1].get_variable_time_slice_array(1, "Temp"),
+                                      readers[0].get_variable_time_slice_array(1, "Temp"))
+
+    def test_cleared_registry_closes_readers(self):
+        reader = argDataInterface.factory("HDF5ExodusII", self.FileNames[0], "Temp")
+        files = reader.get_accessors()
+        argDataInterface.clear_registry()
+        self.assertEqual(len(argDataInterface.Registry), 0)
+        self.assertFalse(any(f.id.valid for f in files))
+
+    def test_cached_outputs_share_memory_budget(self):
+        readers = [argDataInterface.factory("ExodusII", f, "Temp") for f in self.FileNames[:2]]
+        size = 1024 * readers[0].get_VTK_reader_output_data(0).GetActualMemorySize()
+        argDataInterface.set_memory_budget(size)
+        self.assertEqual(argDataInterface.CachedSize, size)
+
+        # Caching output of other reader evicts least recently used one
+        readers[1].get_VTK_reader_output_data(0)
+        self.assertEqual(len(readers[0].OutputCache), 0)
+        self.assertEqual(len(readers[1].OutputCache), 1)
+        self.assertLessEqual(argDataInterface.CachedSize, argDataInterface.MemoryBudget)
+
+        # Outputs which cannot fit in budget are not retained
+        argDataInterface.set_memory_budget(size // 2)
+        readers[0].get_VTK_reader_output_data(1)
+        self.assertEqual(argDataInterface.CachedSize, 0)
+        self.assertEqual([len(r.OutputCache) for r in readers], [0, 0])
+
+        # Closed readers no longer account for cached outputs
+        argDataInterface.set_memory_budget(4 * size)
+        readers[0].get_VTK_reader_output_data(1)
+        argDataInterface.evict(database_name=self.FileNames[0])
+        self.assertEqual(argDataInterface.CachedSize, 0)
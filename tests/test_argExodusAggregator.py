@@ -0,0 +1,216 @@
+#HEADER
+#                   arg/tests/test_argExodusAggregator.py
+#               Automatic Report Generator (ARG) v. 1.0
+#
+# Copyright 2020 National Technology & Engineering Solutions of Sandia, LLC
+# (NTESS). Under the terms of Contract DE-NA0003525 with NTESS, the U.S.
+# Government retains certain rights in this software.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# Questions? Visit gitlab.com/AutomaticReportGenerator/arg
+#
+#HEADER
+
+import os
+import tempfile
+import types
+from unittest import TestCase, skipUnless
+from unittest.mock import Mock, patch
+
+import numpy as np
+
+from tests.test_argHDF5ExodusReader import HAS_READERS, make_grid, write_Exodus_file
+
+if HAS_READERS:
+    from arg.Aggregation.argExodusAggregator import argExodusAggregator
+    from arg.Backend.argBackendBase import argBackendBase
+    from arg.Common import argMath, argTools
+    from arg.DataInterface.argDataInterface import argDataInterface
+    from arg.DataInterface.argExodusReaderBase import argExodusReaderBase
+    from arg.Generation import argPlot, argVTK
+    from tests.test_argVTKExodusReader import make_polyhedral_cube
+
+
+@skipUnless(HAS_READERS, "netCDF4, h5py, or VTK not available")
+class TestAggregatorArtifacts(TestCase):
+    REQUEST = {"datatype": "ExodusII", "name": "show_mesh_surface", "model": "model.e", "var_name": "Temp"}
+
+    def setUp(self):
+        self.TemporaryDirectory = tempfile.TemporaryDirectory()
+        self.DataDir = os.path.join(self.TemporaryDirectory.name, "data")
+        self.OutputDir = os.path.join(self.TemporaryDirectory.name, "output")
+        os.makedirs(self.DataDir)
+        os.makedirs(self.OutputDir)
+        self.ModelName = os.path.join(self.DataDir, "model.e")
+        coords, conn = make_grid(2, 2, 1)
+        write_Exodus_file(self.ModelName, coords, conn, [(10, np.arange(len(conn)))], 2)
+
+        # Backend only needs parameters and figure insertion
+        self.Backend = Mock(spec=argBackendBase)
+        self.Backend.Parameters = types.SimpleNamespace(
+            DataDir=self.DataDir, OutputDir=self.OutputDir, KeySeparator=':', BackendType="Word",
+            Backend=self.Backend)
+
+    def tearDown(self):
+        self.TemporaryDirectory.cleanup()
+
+    def aggregate(self, request):
+        # Age existing images so that rewritten ones can be told apart
+        for f in os.listdir(self.OutputDir):
+            if f.endswith(".png"):
+                os.utime(os.path.join(self.OutputDir, f), ns=(0, 0))
+        argBackendBase.add_aggregation(self.Backend, dict(request))
+
+        # Return names of figures inserted and of images written
+        figures = [c.args[0]["figure_file"] for c in self.Backend.add_figure.call_args_list]
+        self.Backend.add_figure.reset_mock()
+        return figures, sorted(f for f in os.listdir(self.OutputDir)
+                               if f.endswith(".png") and os.stat(os.path.join(self.OutputDir, f)).st_mtime_ns)
+
+    def test_unchanged_aggregator_figures_are_reused(self):
+        figures, written = self.aggregate(self.REQUEST)
+        self.assertEqual(len(figures), 1)
+        self.assertEqual(written, figures)
+        manifest = argTools.load_artifact_manifest(self.OutputDir)
+        self.assertEqual(sorted(manifest["images"]), figures)
+        self.assertEqual(self.aggregate(self.REQUEST), (figures, []))
+
+    def test_touched_model_regenerates_aggregator_figures(self):
+        figures, _ = self.aggregate(self.REQUEST)
+        stat = os.stat(self.ModelName)
+        os.utime(self.ModelName, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        self.assertEqual(self.aggregate(self.REQUEST), (figures, figures))
+        self.assertEqual(self.aggregate(self.REQUEST), (figures, []))
+
+    def test_modified_request_regenerates_aggregator_figures(self):
+        figures, _ = self.aggregate(self.REQUEST)
+        self.assertEqual(self.aggregate(dict(self.REQUEST, width="10cm")), (figures, figures))
+
+    def test_removed_figures_are_pruned(self):
+        figures, _ = self.aggregate(self.REQUEST)
+        os.remove(os.path.join(self.OutputDir, figures[0]))
+        argTools.record_checked_artifacts(self.OutputDir)
+        self.assertEqual(argTools.load_artifact_manifest(self.OutputDir)["images"], {})
+        self.assertEqual(self.aggregate(self.REQUEST), (figures, figures))
+
+
+@skipUnless(HAS_READERS, "netCDF4, h5py, or VTK not available")
+class TestAggregatorFieldStatistics(TestCase):
+    NUMBER_OF_STEPS = 7
+
+    def setUp(self):
+        self.TemporaryDirectory = tempfile.TemporaryDirectory()
+        self.DataDir = self.TemporaryDirectory.name
+        coords, conn = make_grid(3, 2, 1)
+        write_Exodus_file(os.path.join(self.DataDir, "model.e"), coords, conn,
+                          [(10, np.arange(3)), (20, np.arange(3, len(conn)))], self.NUMBER_OF_STEPS)
+
+        # Backend only needs parameters and document insertion methods
+        self.Backend = Mock(spec=argBackendBase)
+        self.Backend.add_subtitle = Mock()
+        self.Backend.Parameters = types.SimpleNamespace(
+            DataDir=self.DataDir, OutputDir=self.DataDir, KeySeparator=':', BackendType="Word",
+            Backend=self.Backend)
+
+    def tearDown(self):
+        argDataInterface.clear_registry()
+        self.TemporaryDirectory.cleanup()
+
+    def aggregate(self, var_name):
+        # Record envelope plot data instead of plotting it
+        request = {"datatype": "ExodusII", "name": "show_field_statistics",
+                   "model": "model.e", "var_name": var_name}
+        with patch.object(argPlot, "create_plot", return_value=(None, None)) as create_plot, \
+                patch.object(argExodusAggregator, "EnvelopeSize", 3), \
+                patch.object(argExodusReaderBase, "iter_time_steps",
+                             autospec=True, side_effect=argExodusReaderBase.iter_time_steps) as iter_time_steps:
+            argBackendBase.add_aggregation(self.Backend, request)
+        self.assertEqual(iter_time_steps.call_count, 1)
+        envelopes = {c.args[3]: c.args[2]["time"] for c in create_plot.call_args_list}
+        return self.Backend.add_table.call_args.args[1], envelopes
+
+    def test_statistics_are_streamed_into_bounded_envelopes(self):
+        for var_name in ("Temp", "V", "Stress"):
+            body, envelopes = self.aggregate(var_name)
+            data = argDataInterface.factory(
+                "ExodusII", os.path.join(self.DataDir, "model.e"), var_name)
+            times = data.get_available_times()
+            steps = [data.get_variable_time_slice_block_arrays(i, var_name, var_name == "V")
+                     for i in range(len(times))]
+            bins = [[0, 1, 2], [3, 4], [5, 6]]
+            for row, b_id in zip(body, (10, 20)):
+                # Envelopes are downsampled to at most EnvelopeSize rows
+                stats = [argMath.compute_descriptive_statistics(s[b_id]) for s in steps]
+                envelope = envelopes["block {}".format(b_id)]
+                self.assertEqual(envelope["statistics"].shape, (3, 5))
+                np.testing.assert_allclose(envelope["times"], [np.mean([times[i] for i in b]) for b in bins])
+                np.testing.assert_allclose(envelope["statistics"], [
+                    argMath.aggregate_descriptive_statistics_array([stats[i] for i in b]) for b in bins])
+
+                # Extrema times are those of first steps reaching them
+                t_min = times[int(np.argmin([s[0] for s in stats]))]
+                t_max = times[int(np.argmax([s[2] for s in stats]))]
+                self.assertEqual(row[-2:], ["{:.4g}".format(t_min), "{:.4g}".format(t_max)])
+                self.assertEqual(row[1], "{:.4g}".format(min(s[0] for s in stats)))
+                self.assertEqual(row[3], "{:.4g}".format(max(s[2] for s in stats)))
+
+
+@skipUnless(HAS_READERS, "netCDF4, h5py, or VTK not available")
+class TestAggregatorMeshBlocks(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Create model with two element blocks
+        cls.TemporaryDirectory = tempfile.TemporaryDirectory()
+        coords, conn = make_grid(3, 2, 2)
+        cls.ModelName = os.path.join(cls.TemporaryDirectory.name, "model.e")
+        write_Exodus_file(cls.ModelName, coords, conn, [(10, np.arange(4)), (20, np.arange(4, len(conn)))], 1)
+
+    @classmethod
+    def tearDownClass(cls):
+        argDataInterface.clear_registry()
+        cls.TemporaryDirectory.cleanup()
+
+    def test_blocks_analyzed_in_process_pool_match_serial_analysis(self):
+        # Polyhedral blocks cannot be shipped to worker processes
+        data = argDataInterface.factory("ExodusII", self.ModelName, "Temp")
+        mesh_blocks = [(b_id, leaf) for b_id, output in data.iterate_element_blocks(0)
+                       for _, leaf in argVTK.iterate_leaves(output)]
+        mesh_blocks.append((30, make_polyhedral_cube()))
+        aggregator = argExodusAggregator.__new__(argExodusAggregator)
+        serial = aggregator.analyze_mesh_blocks(mesh_blocks)
+
+        # Blocks are analyzed by workers and returned in block order
+        executor = argTools.create_process_pool(2)
+        self.addCleanup(executor.shutdown)
+        executor.submit = Mock(wraps=executor.submit)
+        parallel = aggregator.analyze_mesh_blocks(mesh_blocks, executor)
+        self.assertEqual(executor.submit.call_count, 2)
+        self.assertEqual([b_id for b_id, _ in parallel], [10, 20, 30])
+        self.assertEqual([c[:3] for _, c in parallel], [
+            (18, 4, {"HEX8": 4}), (27, 8, {"HEX8": 8}), (8, 1, {"UNKNOWN": 1})])
+        np.testing.assert_equal(parallel, serial)
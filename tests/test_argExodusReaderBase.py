@@ -0,0 +1,100 @@
+#HEADER
+#                   arg/tests/test_argExodusReaderBase.py
+#               Automatic Report Generator (ARG) v. 1.0
+#
+# Copyright 2020 National Technology & Engineering Solutions of Sandia, LLC
+# (NTESS). Under the terms of Contract DE-NA0003525 with NTESS, the U.S.
+# Government retains certain rights in this software.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# Questions? Visit gitlab.com/AutomaticReportGenerator/arg
+#
+#HEADER
+
+import random
+import threading
+import time
+from unittest import TestCase
+
+from arg.DataInterface.argExodusReaderBase import argExodusReaderBase
+
+
+class SlowReader(argExodusReaderBase):
+    """Reader whose time steps take random times to read
+    """
+
+    def __init__(self, n_steps):
+        self.Times = [.1 * i for i in range(n_steps)]
+        self.Started = []
+        self.Lock = threading.Lock()
+
+    def get_accessors(self):
+        return []
+
+    def get_available_times(self):
+        return self.Times
+
+    def read_time_step(self, step, var_name=None, ignored_blocks=None, by_block=False):
+        with self.Lock:
+            self.Started.append(step)
+        time.sleep(random.uniform(0., .005))
+        return step, var_name, ignored_blocks
+
+
+class TestIterTimeSteps(TestCase):
+    def assert_window_bounded(self, reader, steps, prefetch, ignored_blocks=None):
+        yielded = []
+        for step, data in reader.iter_time_steps("Temp", steps, prefetch, ignored_blocks):
+            # Data of each step is yielded with requested variable and blocks
+            self.assertEqual(data, (step, "Temp", ignored_blocks))
+            yielded.append(step)
+
+            # No more than prefetch steps are read ahead of consumed ones
+            with reader.Lock:
+                self.assertLessEqual(len(reader.Started), len(yielded) + max(prefetch, 0))
+        return yielded
+
+    def test_steps_are_yielded_in_order(self):
+        random.seed(0)
+        for prefetch in (0, 1, 3):
+            steps = [5, 2, 7, 0, 9, 1, 8]
+            reader = SlowReader(10)
+            self.assertEqual(self.assert_window_bounded(reader, steps, prefetch, [10]), steps)
+            self.assertEqual(reader.Started, steps)
+
+    def test_all_steps_are_iterated_by_default(self):
+        reader = SlowReader(6)
+        self.assertEqual(self.assert_window_bounded(reader, None, 2), list(range(6)))
+
+    def test_interrupted_iteration_stops_reading(self):
+        reader = SlowReader(50)
+        for step, _ in reader.iter_time_steps(None, None, 2):
+            if step == 3:
+                break
+        time.sleep(.05)
+        self.assertLessEqual(len(reader.Started), 4 + 2)
@@ -0,0 +1,182 @@
+#HEADER
+#                       arg/tests/test_argGenerator.py
+#               Automatic Report Generator (ARG) v. 1.0
+#
+# Copyright 2020 National Technology & Engineering Solutions of Sandia, LLC
+# (NTESS). Under the terms of Contract DE-NA0003525 with NTESS, the U.S.
+# Government retains certain rights in this software.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# Questions? Visit gitlab.com/AutomaticReportGenerator/arg
+#
+#HEADER
+
+import json
+import os
+import tempfile
+import types
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+import yaml
+
+from arg.Applications import argGenerator
+from arg.Common import argTools
+from arg.DataInterface.argVTKExodusReader import argVTKExodusReader
+
+
+class TestArtifactManifest(TestCase):
+    REQUESTS = [
+        {"n": "vtk", "model": "model.e", "render": "surface", "var_name": "Temp", "title": "model.e"},
+        {"n": "plot", "type": "time", "files": ["history.txt"], "var_name": "Disp"}]
+
+    def setUp(self) -> None:
+        self.TemporaryDirectory = tempfile.TemporaryDirectory()
+        self.DataDir = os.path.join(self.TemporaryDirectory.name, "data")
+        self.OutputDir = os.path.join(self.TemporaryDirectory.name, "output")
+        os.makedirs(self.DataDir)
+        os.makedirs(self.OutputDir)
+        for file_name in ("model.e", "history.txt"):
+            self.write_input(file_name, "input")
+        self.Generated = []
+
+    def tearDown(self) -> None:
+        self.TemporaryDirectory.cleanup()
+
+    def write_input(self, file_name, contents):
+        with open(os.path.join(self.DataDir, file_name), 'w') as f:
+            f.write(contents)
+
+    def fake_generate_artifact(self, parameters, request_params):
+        # Name artifact after request as generation functions do
+        base_name = "{}_{}".format(request_params.get("render", request_params.get("type")),
+                                   request_params["var_name"])
+        image_name = os.path.join(parameters.OutputDir, "{}.png".format(base_name))
+        if request_params.get("regenerate") or not os.path.isfile(image_name):
+            self.Generated.append(base_name)
+            with open(image_name, 'w') as f:
+                f.write("image")
+        return base_name, None
+
+    def generate(self, requests):
+        artifact_file = os.path.join(self.TemporaryDirectory.name, "artifacts.yml")
+        with open(artifact_file, 'w') as f:
+            yaml.safe_dump(requests, f)
+        parameters = types.SimpleNamespace(
+            ArtifactFile=artifact_file, Application="test", DataDir=self.DataDir,
+            OutputDir=self.OutputDir, Backend=None)
+        self.Generated = []
+        with patch.object(argGenerator, "generate_artifact", self.fake_generate_artifact):
+            argGenerator.argGenerator(parameters).generate_artefacts()
+        return sorted(self.Generated)
+
+    def read_manifest(self):
+        with open(os.path.join(self.OutputDir, argTools.ArtifactManifestFile)) as f:
+            return json.load(f)["artifacts"]
+
+    def test_unchanged_artifacts_are_reused(self):
+        self.assertEqual(self.generate(self.REQUESTS), ["surface_Temp", "time_Disp"])
+        self.assertEqual(sorted(self.read_manifest()), ["surface_Temp", "time_Disp"])
+        self.assertEqual(self.generate(self.REQUESTS), [])
+
+    def test_modified_input_invalidates_artifact(self):
+        self.generate(self.REQUESTS)
+        self.write_input("history.txt", "modified input")
+        self.assertEqual(self.generate(self.REQUESTS), ["time_Disp"])
+
+    def test_non_input_values_are_not_inputs(self):
+        # Title names an input file but is not an input key
+        requests = [dict(self.REQUESTS[0], title="history.txt"), self.REQUESTS[1]]
+        self.generate(requests)
+        self.write_input("history.txt", "modified input")
+        self.assertEqual(self.generate(requests), ["time_Disp"])
+
+    def test_modified_request_invalidates_artifact(self):
+        self.generate(self.REQUESTS)
+        requests = [dict(self.REQUESTS[0], opacity=.5), self.REQUESTS[1]]
+        self.assertEqual(self.generate(requests), ["surface_Temp"])
+        self.assertEqual(self.generate(requests), [])
+
+    def test_removed_image_is_regenerated(self):
+        self.generate(self.REQUESTS)
+        os.remove(os.path.join(self.OutputDir, "surface_Temp.png"))
+        self.assertEqual(self.generate(self.REQUESTS), ["surface_Temp"])
+
+    def test_stale_entries_are_pruned(self):
+        self.generate(self.REQUESTS)
+        self.generate(self.REQUESTS[1:])
+        self.assertEqual(sorted(self.read_manifest()), ["time_Disp"])
+        self.assertEqual(self.generate(self.REQUESTS), ["surface_Temp"])
+
+    def test_shared_artifacts_are_not_recorded(self):
+        requests = [self.REQUESTS[0], dict(self.REQUESTS[0], opacity=.5)]
+        self.generate(requests)
+        self.assertEqual(self.read_manifest(), {})
+        self.assertEqual(self.generate(requests), ["surface_Temp", "surface_Temp"])
+
+    def test_failed_atomic_write_leaves_no_file(self):
+        def write(f):
+            f.write(b"partial")
+            raise RuntimeError("write failed")
+
+        file_name = os.path.join(self.OutputDir, "image.png")
+        with self.assertRaises(RuntimeError):
+            argTools.write_file_atomically(file_name, write)
+        self.assertEqual(os.listdir(self.OutputDir), [])
+
+
+class TestWorkerArtifact(TestCase):
+    def setUp(self) -> None:
+        # Restore module state altered by worker initialization
+        self.addCleanup(setattr, argGenerator, "worker_parameters", argGenerator.worker_parameters)
+        self.addCleanup(argVTKExodusReader.set_number_of_workers, argVTKExodusReader.NumberOfWorkers)
+        self.Parameters = types.SimpleNamespace(ReportType=None, BackendType=None)
+
+    def test_worker_reads_partitions_itself(self):
+        argVTKExodusReader.set_number_of_workers(4)
+        with patch.object(argGenerator.argBackend, "factory", return_value="backend") as factory:
+            argGenerator.initialize_worker(self.Parameters)
+        factory.assert_called_once_with(self.Parameters)
+        self.assertIs(argGenerator.worker_parameters, self.Parameters)
+        self.assertEqual(self.Parameters.Backend, "backend")
+        self.assertEqual(argVTKExodusReader.NumberOfWorkers, 1)
+
+    def test_worker_requests_do_not_spawn_processes(self):
+        argGenerator.worker_parameters = self.Parameters
+        request = {"n": "vtk", "model": "model.e", "workers": 4}
+        with patch.object(argGenerator, "generate_artifact", Mock(return_value=("image", None))) as generate:
+            self.assertEqual(argGenerator.generate_worker_artifact(request), ("image", None))
+        generate.assert_called_once_with(self.Parameters, dict(request, workers=1))
+        self.assertEqual(request["workers"], 4)
+
+    def test_worker_artifact_is_generated_in_process_pool(self):
+        executor = argTools.create_process_pool(
+            2, argGenerator.initialize_worker, (self.Parameters,))
+        self.addCleanup(executor.shutdown)
+        self.assertEqual(executor.submit(argGenerator.generate_worker_artifact, {"n": "table"}).result(),
+                         (None, "unsupported artifact type table"))
@@ -0,0 +1,230 @@
+#HEADER
+#                   arg/tests/test_argHDF5ExodusReader.py
+#               Automatic Report Generator (ARG) v. 1.0
+#
+# Copyright 2020 National Technology & Engineering Solutions of Sandia, LLC
+# (NTESS). Under the terms of Contract DE-NA0003525 with NTESS, the U.S.
+# Government retains certain rights in this software.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# Questions? Visit gitlab.com/AutomaticReportGenerator/arg
+#
+#HEADER
+
+import os
+import tempfile
+from unittest import TestCase, skipUnless
+
+import numpy as np
+
+try:
+    import netCDF4
+    from arg.DataInterface.argHDF5ExodusReader import argHDF5ExodusReader
+    from arg.DataInterface.argVTKExodusReader import argVTKExodusReader
+    HAS_READERS = True
+except ImportError:
+    HAS_READERS = False
+
+
+def make_grid(n_x, n_y, n_z):
+    """Create node coordinates and 1-based HEX8 connectivity of a structured grid
+    """
+
+    # Create node coordinates
+    x, y, z = np.meshgrid(np.arange(n_x + 1.), np.arange(n_y + 1.), np.arange(n_z + 1.), indexing="ij")
+    coords = np.stack([x.ravel(), y.ravel(), z.ravel()], axis=1)
+
+    # Create connectivity of all hexahedra
+    node = lambda i, j, k: (i * (n_y + 1) + j) * (n_z + 1) + k + 1
+    conn = [[node(i, j, k), node(i + 1, j, k), node(i + 1, j + 1, k), node(i, j + 1, k),
+             node(i, j, k + 1), node(i + 1, j, k + 1), node(i + 1, j + 1, k + 1), node(i, j + 1, k + 1)]
+            for i in range(n_x) for j in range(n_y) for k in range(n_z)]
+    return coords, np.array(conn, dtype=np.int64)
+
+
+def write_names(d, var_name, dim_name, names):
+    """Write list of names as netCDF character array
+    """
+
+    chars = np.zeros((len(names), 33), dtype="S1")
+    for i, name in enumerate(names):
+        chars[i, :len(name)] = list(name)
+    d.createVariable(var_name, "S1", (dim_name, "len_name"))[:] = chars
+
+
+def write_Exodus_file(file_name, coords, conn, blocks, n_steps):
+    """Write ExodusII file stored as netCDF4/HDF5 with given blocks of
+       global element indices, nodal scalar Temp, nodal vector V, and
+       element scalar Stress, whose values depend only on global IDs
+    """
+
+    # Retain only nodes used by blocks, in increasing global order
+    used = np.unique(np.concatenate([conn[e] for _, e in blocks]).ravel()) - 1
+    g2l = np.full(len(coords), -1, dtype=np.int64)
+    g2l[used] = np.arange(len(used))
+
+    # Create dimensions
+    d = netCDF4.Dataset(file_name, "w", format="NETCDF4")
+    d.api_version = np.float32(8.0)
+    d.version = np.float32(8.0)
+    d.floating_point_word_size = np.int32(8)
+    d.file_size = np.int32(1)
+    d.title = "parity"
+    for dim_name, length in (("len_string", 33), ("len_name", 33), ("len_line", 81), ("four", 4),
+                             ("time_step", None), ("num_dim", 3), ("num_nodes", len(used)),
+                             ("num_elem", sum(len(e) for _, e in blocks)), ("num_el_blk", len(blocks)),
+                             ("num_nod_var", 4), ("num_elem_var", 1)):
+        d.createDimension(dim_name, length)
+
+    # Write blocks, coordinates, and ID maps
+    d.createVariable("eb_status", "i4", ("num_el_blk",))[:] = 1
+    prop = d.createVariable("eb_prop1", "i4", ("num_el_blk",))
+    prop.setncattr("name", "ID")
+    prop[:] = [b_id for b_id, _ in blocks]
+    for k, c in enumerate("xyz"):
+        d.createVariable("coord" + c, "f8", ("num_nodes",))[:] = coords[used, k]
+    write_names(d, "coor_names", "num_dim", ["x", "y", "z"])
+    d.createVariable("node_num_map", "i4", ("num_nodes",))[:] = used + 1
+    d.createVariable("elem_num_map", "i4", ("num_elem",))[:] = np.concatenate([e for _, e in blocks]) + 1
+    for i, (_, elems) in enumerate(blocks, 1):
+        d.createDimension("num_el_in_blk{}".format(i), len(elems))
+        d.createDimension("num_nod_per_el{}".format(i), 8)
+        connect = d.createVariable("connect{}".format(i), "i4",
+                                   ("num_el_in_blk{}".format(i), "num_nod_per_el{}".format(i)))
+        connect.elem_type = "HEX8"
+        connect[:] = g2l[conn[elems] - 1] + 1
+
+    # Write variable values at all time steps
+    write_names(d, "name_nod_var", "num_nod_var", ["Temp", "VX", "VY", "VZ"])
+    write_names(d, "name_elem_var", "num_elem_var", ["Stress"])
+    times = d.createVariable("time_whole", "f8", ("time_step",))
+    nod_vars = [d.createVariable("vals_nod_var{}".format(k + 1), "f8", ("time_step", "num_nodes"))
+                for k in range(4)]
+    elem_vars = [d.createVariable("vals_elem_var1eb{}".format(i + 1), "f8",
+                                  ("time_step", "num_el_in_blk{}".format(i + 1)))
+                 for i in range(len(blocks))]
+    for s in range(n_steps):
+        times[s] = .5 * s
+        for k in range(4):
+            nod_vars[k][s, :] = (used + 1) * (k + 1.) + s
+        for i, (_, elems) in enumerate(blocks):
+            elem_vars[i][s, :] = (elems + 1) * (s + 1.)
+    d.close()
+
+
+@skipUnless(HAS_READERS, "netCDF4, h5py, or VTK not available")
+class TestArgHDF5ExodusReader(TestCase):
+    NUMBER_OF_STEPS = 4
+
+    @classmethod
+    def setUpClass(cls):
+        # Create single file and 2-way partition of same model
+        # NB: elements of first block are listed in decreasing order, so that
+        #     order of first appearance of its nodes differs from node order
+        cls.TemporaryDirectory = tempfile.TemporaryDirectory()
+        coords, conn = make_grid(3, 2, 2)
+        n_half = len(conn) // 2
+        blocks = [(10, np.arange(n_half)[::-1]), (20, np.arange(n_half, len(conn)))]
+        cls.SingleFileName = os.path.join(cls.TemporaryDirectory.name, "single.e")
+        write_Exodus_file(cls.SingleFileName, coords, conn, blocks, cls.NUMBER_OF_STEPS)
+        cls.PartitionName = os.path.join(cls.TemporaryDirectory.name, "partition.e.2")
+        for r in range(2):
+            write_Exodus_file("{}.{}".format(cls.PartitionName, r), coords, conn,
+                              [(b_id, elems[r::2]) for b_id, elems in blocks], cls.NUMBER_OF_STEPS)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.TemporaryDirectory.cleanup()
+
+    def get_reader_pair(self, database_name, var_name):
+        return (argHDF5ExodusReader(database_name, var_name),
+                argVTKExodusReader(database_name, var_name, False))
+
+    def assert_time_slices_equal(self, database_name):
+        for var_name in ("Temp", "V", "Stress"):
+            hdf5_reader, vtk_reader = self.get_reader_pair(database_name, var_name)
+            self.assertEqual(hdf5_reader.get_attribute_type(), vtk_reader.get_attribute_type())
+            for t in range(self.NUMBER_OF_STEPS):
+                for modulus in (False, True):
+                    np.testing.assert_allclose(
+                        hdf5_reader.get_variable_time_slice_array(t, var_name, modulus),
+                        vtk_reader.get_variable_time_slice_array(t, var_name, modulus))
+                hdf5_blocks = hdf5_reader.get_variable_time_slice_block_arrays(t, var_name)
+                vtk_blocks = vtk_reader.get_variable_time_slice_block_arrays(t, var_name)
+                self.assertEqual(sorted(hdf5_blocks), sorted(vtk_blocks))
+                for b_id, values in vtk_blocks.items():
+                    np.testing.assert_allclose(hdf5_blocks[b_id], values)
+
+    def assert_time_series_equal(self, database_name):
+        for var_name in ("Temp", "V", "Stress"):
+            hdf5_reader, vtk_reader = self.get_reader_pair(database_name, var_name)
+            for blocks in (None, [20]):
+                n_values = len(vtk_reader.get_variable_time_slice_block_arrays(0, var_name, blocks=blocks)[20]) \
+                    if blocks else len(vtk_reader.get_variable_time_slice_array(0, var_name))
+                indices = [0, n_values // 3, n_values - 1]
+                np.testing.assert_allclose(
+                    hdf5_reader.get_variable_time_series(var_name, indices, blocks),
+                    vtk_reader.get_variable_time_series(var_name, indices, blocks))
+                np.testing.assert_allclose(
+                    hdf5_reader.get_variable_time_series(var_name, indices, blocks, True),
+                    vtk_reader.get_variable_time_series(var_name, indices, blocks, True))
+
+    def test_is_HDF5_database(self):
+        self.assertTrue(argHDF5ExodusReader.is_HDF5_database(self.SingleFileName))
+        self.assertTrue(argHDF5ExodusReader.is_HDF5_database(self.PartitionName))
+        self.assertFalse(argHDF5ExodusReader.is_HDF5_database(self.SingleFileName + ".2"))
+
+    def test_meta_information(self):
+        for database_name in (self.SingleFileName, self.PartitionName):
+            hdf5_reader, vtk_reader = self.get_reader_pair(database_name, "Temp")
+            self.assertEqual(hdf5_reader.get_available_times(), vtk_reader.get_available_times())
+            for hdf5_meta, vtk_meta in zip(hdf5_reader.get_meta_information_snapshots(),
+                                           vtk_reader.get_meta_information_snapshots()):
+                for key in ("nodes", "elements", "time-steps", "block IDs", "node fields", "element fields"):
+                    self.assertEqual(hdf5_meta[key], vtk_meta[key])
+
+    def test_single_file_time_slices(self):
+        self.assert_time_slices_equal(self.SingleFileName)
+
+    def test_partition_time_slices(self):
+        self.assert_time_slices_equal(self.PartitionName)
+
+    def test_single_file_time_series(self):
+        self.assert_time_series_equal(self.SingleFileName)
+
+    def test_partition_time_series(self):
+        self.assert_time_series_equal(self.PartitionName)
+
+    def test_block_point_ordering(self):
+        # Nodal values encode global node IDs, hence their order is that of block points
+        hdf5_reader, vtk_reader = self.get_reader_pair(self.SingleFileName, "Temp")
+        values = hdf5_reader.get_variable_time_slice_block_arrays(0, "Temp")[10]
+        node_ids = hdf5_reader.get_ID_map("node_num_map")[hdf5_reader.get_block_node_order(0, 0)]
+        np.testing.assert_allclose(values, node_ids)
+        self.assertFalse(np.all(np.diff(node_ids) > 0))
+        np.testing.assert_allclose(values, vtk_reader.get_variable_time_slice_block_arrays(0, "Temp")[10])
@@ -0,0 +1,145 @@
+#HEADER
+#                         arg/tests/test_argMath.py
+#               Automatic Report Generator (ARG) v. 1.0
+#
+# Copyright 2020 National Technology & Engineering Solutions of Sandia, LLC
+# (NTESS). Under the terms of Contract DE-NA0003525 with NTESS, the U.S.
+# Government retains certain rights in this software.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# Questions? Visit gitlab.com/AutomaticReportGenerator/arg
+#
+#HEADER
+
+from unittest import TestCase
+
+import numpy as np
+
+from arg.Common import argMath
+
+
+class TestHistograms(TestCase):
+    def test_same_bins_add_counts(self):
+        h_1 = argMath.create_histogram([0., .25, .5, 1.], (0., 1.), 4)
+        h_2 = argMath.create_histogram([.1, .9], (0., 1.), 4)
+        h = argMath.aggregate_histograms(h_1, h_2)
+        self.assertEqual(h["range"], (0., 1.))
+        np.testing.assert_array_equal(h["counts"], [2, 1, 1, 2])
+
+    def test_different_bins_spread_counts_by_overlap(self):
+        h_1 = {"range": (0., 1.), "counts": np.full(10, 100)}
+        h_2 = {"range": (.5, 2.), "counts": np.full(10, 100)}
+        h = argMath.aggregate_histograms(h_1, h_2)
+        self.assertEqual(h["range"], (0., 2.))
+        np.testing.assert_allclose(
+            h["counts"], [200, 200, 800 / 3, 1000 / 3, 1000 / 3] + [400 / 3] * 5)
+
+    def test_same_bins_with_list_range_add_counts(self):
+        h_1 = {"range": [0, 1], "counts": np.array([1, 2, 3, 4])}
+        h_2 = argMath.create_histogram([.1, .9], (0., 1.), 4)
+        h = argMath.aggregate_histograms(h_1, h_2)
+        self.assertEqual(h["range"], (0., 1.))
+        np.testing.assert_array_equal(h["counts"], [2, 2, 3, 5])
+
+    def test_aggregated_counts_have_same_dtype(self):
+        h_1 = argMath.create_histogram([0., .5], (0., 1.), 4)
+        for h_2 in (argMath.create_histogram([.1], (0., 1.), 4),
+                    argMath.create_histogram([.1], (0., 2.), 4)):
+            for h in (argMath.aggregate_histograms({}, h_2), argMath.aggregate_histograms(h_1, h_2)):
+                self.assertEqual(h["counts"].dtype, np.float64)
+                self.assertIsInstance(h["range"], tuple)
+
+    def test_aggregation_preserves_total_count(self):
+        rng = np.random.default_rng(0)
+        h = {}
+        for v_range in ((0., 1.), (-.3, .4), (.2, 3.)):
+            h = argMath.aggregate_histograms(
+                h, argMath.create_histogram(rng.uniform(*v_range, 500), v_range, 20))
+        self.assertEqual(h["range"], (-.3, 3.))
+        self.assertAlmostEqual(h["counts"].sum(), 1500.)
+
+
+class TestDescriptiveStatistics(TestCase):
+    def test_empty_values(self):
+        self.assertEqual(argMath.compute_descriptive_statistics([]), [])
+        self.assertEqual(argMath.compute_descriptive_statistics([np.nan, np.inf]), [])
+
+    def test_array_aggregation_matches_whole_values(self):
+        values = np.random.default_rng(1).normal(2., 3., 1000)
+        parts = np.split(values, [1, 2, 300, 301, 700])
+        s = argMath.aggregate_descriptive_statistics_array(
+            [argMath.compute_descriptive_statistics(p) for p in parts])
+        np.testing.assert_allclose(
+            s, [values.min(), values.mean(), values.max(), np.var(values, ddof=1), len(values)])
+
+    def test_array_aggregation_matches_pairwise_aggregation(self):
+        parts = np.split(np.random.default_rng(2).uniform(0., 1., 100), [10, 55])
+        s_parts = [argMath.compute_descriptive_statistics(p) for p in parts]
+        s_pairwise = []
+        for s in s_parts:
+            s_pairwise = argMath.aggregate_descriptive_statistics(s_pairwise, s)
+        np.testing.assert_allclose(argMath.aggregate_descriptive_statistics_array(s_parts), s_pairwise)
+
+    def test_array_aggregation_of_empty_statistics(self):
+        self.assertEqual(argMath.aggregate_descriptive_statistics_array([]), [])
+        self.assertEqual(argMath.aggregate_descriptive_statistics_array([[], []]), [])
+        s = argMath.compute_descriptive_statistics([1., 2., 4.])
+        np.testing.assert_allclose(argMath.aggregate_descriptive_statistics_array([[], s, []]), s)
+
+
+class TestQuantileSketches(TestCase):
+    QUANTILES = (0., .01, .1, .5, .9, .99, 1.)
+
+    def test_empty_values(self):
+        self.assertEqual(argMath.create_quantile_sketch([]), {})
+        self.assertEqual(argMath.create_quantile_sketch([np.nan]), {})
+
+    def test_small_sketch_is_exact(self):
+        values = [3., 1., 2., 5., 4.]
+        sketch = argMath.create_quantile_sketch(values)
+        self.assertEqual(sketch["weights"].sum(), len(values))
+        self.assertEqual((sketch["min"], sketch["max"]), (1., 5.))
+        np.testing.assert_allclose(argMath.get_quantiles(sketch, (0., .5, 1.)), [1., 3., 5.])
+
+    def test_aggregated_sketch_matches_quantiles_of_split_values(self):
+        values = np.random.default_rng(3).normal(0., 1., 20000)
+        sketch = {}
+        for part in np.array_split(values, 7):
+            sketch = argMath.aggregate_quantile_sketches(sketch, argMath.create_quantile_sketch(part))
+        self.assertEqual(sketch["weights"].sum(), len(values))
+        self.assertLessEqual(len(sketch["means"]), sketch["compression"])
+        np.testing.assert_allclose(
+            argMath.get_quantiles(sketch, self.QUANTILES), np.quantile(values, self.QUANTILES), atol=2e-2)
+
+    def test_aggregation_of_empty_sketches(self):
+        sketch = argMath.create_quantile_sketch(np.arange(10.))
+        self.assertEqual(argMath.aggregate_quantile_sketches({}, {}), {})
+        for aggregated in (argMath.aggregate_quantile_sketches({}, sketch),
+                           argMath.aggregate_quantile_sketches(sketch, {})):
+            np.testing.assert_allclose(
+                argMath.get_quantiles(aggregated, self.QUANTILES), argMath.get_quantiles(sketch, self.QUANTILES))
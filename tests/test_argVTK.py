@@ -0,0 +1,107 @@
+#HEADER
+#                   arg/tests/test_argVTK.py
+#               Automatic Report Generator (ARG) v. 1.0
+#
+# Copyright 2020 National Technology & Engineering Solutions of Sandia, LLC
+# (NTESS). Under the terms of Contract DE-NA0003525 with NTESS, the U.S.
+# Government retains certain rights in this software.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# Questions? Visit gitlab.com/AutomaticReportGenerator/arg
+#
+#HEADER
+import os
+import tempfile
+from unittest import TestCase, skipUnless
+from unittest.mock import Mock, patch
+
+try:
+    import vtkmodules.vtkRenderingCore as vtkRenderingCore
+    from arg.Generation import argVTK
+    HAS_VTK = True
+except ImportError:
+    HAS_VTK = False
+
+
+@skipUnless(HAS_VTK, "VTK not available")
+class TestRenderWindowPool(TestCase):
+    def setUp(self):
+        # Start from an empty pool and leave it empty
+        self.empty_pool()
+        self.addCleanup(self.empty_pool)
+
+    @staticmethod
+    def empty_pool():
+        while argVTK.render_window_pool:
+            argVTK.render_window_pool.popitem()[1].Finalize()
+
+    @staticmethod
+    def acquire_render_window(x_res, y_res):
+        # Record finalization of windows without creating graphics contexts
+        window = argVTK.acquire_render_window(x_res, y_res)
+        if not isinstance(getattr(window, "Finalize", None), Mock):
+            window.Finalize = Mock()
+        return window
+
+    def test_idle_windows_are_reused(self):
+        window = self.acquire_render_window(100, 80)
+        argVTK.release_render_window(window)
+        self.assertIs(self.acquire_render_window(100, 80), window)
+        self.assertIsNot(self.acquire_render_window(100, 80), window)
+
+    def test_pool_is_bounded(self):
+        windows = [self.acquire_render_window(100, 80 + i)
+                   for i in range(argVTK.render_window_pool_size + 2)]
+        for window in windows:
+            argVTK.release_render_window(window)
+
+        # Least recently released windows are finalized
+        self.assertEqual(len(argVTK.render_window_pool), argVTK.render_window_pool_size)
+        self.assertEqual([w.Finalize.call_count for w in windows], [1, 1] + [0] * argVTK.render_window_pool_size)
+        self.assertEqual(list(argVTK.render_window_pool.values()), windows[2:])
+
+    def test_duplicate_idle_window_is_finalized(self):
+        windows = [self.acquire_render_window(100, 80) for _ in range(2)]
+        for window in windows:
+            argVTK.release_render_window(window)
+        self.assertEqual(len(argVTK.render_window_pool), 1)
+        self.assertEqual([w.Finalize.call_count for w in windows], [0, 1])
+
+    def test_window_is_released_after_exception(self):
+        with tempfile.TemporaryDirectory() as output_dir, \
+                patch.object(argVTK, "create_PNG_from_window", side_effect=RuntimeError("no image")):
+            with self.assertRaises(RuntimeError):
+                argVTK.create_PNG_from_renderer(
+                    vtkRenderingCore.vtkRenderer(), os.path.join(output_dir, "image.png"), 100, 80)
+
+        # Window was handed back to pool without its renderer
+        self.assertEqual(list(argVTK.render_window_pool), [(100, 80, True, 0)])
+        window = argVTK.render_window_pool[(100, 80, True, 0)]
+        self.assertEqual(window.GetRenderers().GetNumberOfItems(), 0)
+        self.assertIs(argVTK.acquire_render_window(100, 80, True, 0), window)
+        argVTK.release_render_window(window)
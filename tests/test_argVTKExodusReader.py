@@ -0,0 +1,351 @@
+#HEADER
+#                   arg/tests/test_argVTKExodusReader.py
+#               Automatic Report Generator (ARG) v. 1.0
+#
+# Copyright 2020 National Technology & Engineering Solutions of Sandia, LLC
+# (NTESS). Under the terms of Contract DE-NA0003525 with NTESS, the U.S.
+# Government retains certain rights in this software.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# Questions? Visit gitlab.com/AutomaticReportGenerator/arg
+#
+#HEADER
+
+import os
+import tempfile
+from unittest import TestCase, skipUnless
+from unittest.mock import patch
+
+import numpy as np
+
+from tests.test_argHDF5ExodusReader import HAS_READERS, make_grid, write_Exodus_file
+
+if HAS_READERS:
+    import vtkmodules.vtkCommonCore as vtkCommonCore
+    import vtkmodules.vtkCommonDataModel as vtkCommonDataModel
+    import vtkmodules.vtkIOExodus as vtkIOExodus
+    from vtkmodules.util.numpy_support import numpy_to_vtk, vtk_to_numpy
+    from arg.DataInterface.argDataInterface import argDataInterface
+    from arg.DataInterface.argVTKExodusReader import argVTKExodusReader
+    from arg.Generation import argVTK
+
+
+def get_point_array(output, name):
+    """Concatenate point data array of given name over all leaves of output
+    """
+
+    arrays = []
+    it = output.NewIterator()
+    it.InitTraversal()
+    while not it.IsDoneWithTraversal():
+        arrays.append(vtk_to_numpy(it.GetCurrentDataObject().GetPointData().GetArray(name)))
+        it.GoToNextItem()
+    return np.concatenate(arrays)
+
+
+def make_polyhedral_cube():
+    """Create unstructured grid made of a single polyhedral unit cube
+       carrying global node and element IDs
+    """
+
+    # Create cube corners
+    points = vtkCommonCore.vtkPoints()
+    for p in ((0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0), (0, 0, 1), (1, 0, 1), (1, 1, 1), (0, 1, 1)):
+        points.InsertNextPoint(p)
+
+    # Insert single polyhedron given by its face stream
+    faces = ((0, 3, 2, 1), (4, 5, 6, 7), (0, 1, 5, 4), (1, 2, 6, 5), (2, 3, 7, 6), (3, 0, 4, 7))
+    face_stream = vtkCommonCore.vtkIdList()
+    for i in [len(faces)] + [i for f in faces for i in (len(f),) + f]:
+        face_stream.InsertNextId(i)
+    grid = vtkCommonDataModel.vtkUnstructuredGrid()
+    grid.SetPoints(points)
+    grid.InsertNextCell(vtkCommonDataModel.VTK_POLYHEDRON, face_stream)
+
+    # Attach global IDs
+    for data, n, name in (
+            (grid.GetPointData(), 8, vtkIOExodus.vtkExodusIIReader.GetGlobalNodeIdArrayName()),
+            (grid.GetCellData(), 1, vtkIOExodus.vtkExodusIIReader.GetGlobalElementIdArrayName())):
+        ids = numpy_to_vtk(np.arange(1, n + 1), deep=1, array_type=vtkCommonCore.VTK_ID_TYPE)
+        ids.SetName(name)
+        data.AddArray(ids)
+    return grid
+
+
+@skipUnless(HAS_READERS, "netCDF4, h5py, or VTK not available")
+class TestArgVTKExodusReaderWorkers(TestCase):
+    NUMBER_OF_STEPS = 4
+
+    @classmethod
+    def setUpClass(cls):
+        # Create 2-way partition large enough for reads to take some time
+        cls.TemporaryDirectory = tempfile.TemporaryDirectory()
+        coords, conn = make_grid(16, 16, 8)
+        blocks = [(10, np.arange(len(conn) // 2)), (20, np.arange(len(conn) // 2, len(conn)))]
+        cls.PartitionName = os.path.join(cls.TemporaryDirectory.name, "partition.e.2")
+        for r in range(2):
+            write_Exodus_file("{}.{}".format(cls.PartitionName, r), coords, conn,
+                              [(b_id, elems[r::2]) for b_id, elems in blocks], cls.NUMBER_OF_STEPS)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.TemporaryDirectory.cleanup()
+
+    def tearDown(self):
+        argVTKExodusReader.set_number_of_workers(1)
+
+    def get_reader(self, n_workers):
+        argVTKExodusReader.set_number_of_workers(n_workers)
+        reader = argVTKExodusReader(self.PartitionName, "Temp", False)
+        self.addCleanup(reader.close)
+        return reader
+
+    def test_partitions_read_concurrently(self):
+        reader = self.get_reader(2)
+
+        # Spawn workers and load their meta-information prior to timing reads
+        reader.read_VTK_reader_output_data(0)
+        overlapping = []
+        for t in range(1, self.NUMBER_OF_STEPS):
+            reader.read_VTK_reader_output_data(t)
+            timings = list(reader.PartitionTimings.values())
+
+            # Each partition is read by a worker process of its own
+            workers = {v["worker"] for v in timings}
+            self.assertEqual(len(workers), 2)
+            self.assertNotIn(os.getpid(), workers)
+
+            # Keep track of whether read intervals overlapped
+            (s_0, e_0), (s_1, e_1) = (v["interval"] for v in timings)
+            overlapping.append(s_0 < e_1 and s_1 < e_0)
+        self.assertTrue(any(overlapping))
+        self.assertEqual([v["reads"] for v in reader.PartitionTimings.values()], [self.NUMBER_OF_STEPS] * 2)
+
+    def test_worker_reads_match_serial_reads(self):
+        serial_reader, worker_reader = self.get_reader(1), self.get_reader(2)
+        for t in range(self.NUMBER_OF_STEPS):
+            serial, parallel = (r.read_VTK_reader_output_data(t, frozenset([20]))
+                                for r in (serial_reader, worker_reader))
+            self.assertEqual(serial.GetNumberOfPoints(), parallel.GetNumberOfPoints())
+            self.assertEqual(serial.GetNumberOfCells(), parallel.GetNumberOfCells())
+            np.testing.assert_array_equal(get_point_array(serial, "Temp"), get_point_array(parallel, "Temp"))
+            np.testing.assert_array_equal(
+                serial_reader.get_variable_time_slice_array(t, "Temp"),
+                worker_reader.get_variable_time_slice_array(t, "Temp"))
+        np.testing.assert_array_equal(
+            serial_reader.get_variable_time_series("Temp", [0, 7, 100]),
+            worker_reader.get_variable_time_series("Temp", [0, 7, 100]))
+        self.assertEqual(worker_reader.WorkerPools, worker_reader.get_worker_pools())
+        self.assertEqual(len(worker_reader.WorkerPools), 2)
+        self.assertEqual(serial_reader.WorkerPools, [])
+
+
+@skipUnless(HAS_READERS, "netCDF4, h5py, or VTK not available")
+class TestArgVTKExodusReaderTimeSlices(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Create single file with one block and 2-way partition with two blocks
+        cls.TemporaryDirectory = tempfile.TemporaryDirectory()
+        coords, conn = make_grid(2, 2, 2)
+        cls.SingleFileName = os.path.join(cls.TemporaryDirectory.name, "single.e")
+        write_Exodus_file(cls.SingleFileName, coords, conn, [(10, np.arange(len(conn)))], 2)
+        cls.PartitionName = os.path.join(cls.TemporaryDirectory.name, "partition.e.2")
+        for r in range(2):
+            write_Exodus_file("{}.{}".format(cls.PartitionName, r), coords, conn,
+                              [(10, np.arange(r, len(conn), 2))], 2)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.TemporaryDirectory.cleanup()
+
+    def test_time_slices_are_not_overwritten_by_updates(self):
+        for database_name in (self.SingleFileName, self.PartitionName):
+            reader = argVTKExodusReader(database_name, "Temp", False)
+            values = reader.get_variable_time_slice_array(0, "Temp")
+            expected = values.copy()
+            self.assertTrue(values.flags.owndata)
+            self.assertTrue(values.flags.writeable)
+
+            # Reading another time step leaves values unchanged
+            self.assertFalse(np.array_equal(reader.get_variable_time_slice_array(1, "Temp"), expected))
+            np.testing.assert_array_equal(values, expected)
+            np.testing.assert_array_equal(reader.read_time_step(0, "Temp"), expected)
+
+
+@skipUnless(HAS_READERS, "netCDF4, h5py, or VTK not available")
+class TestArgVTKExodusReaderMerge(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Create single file and its 2-way partition sharing nodes across ranks
+        cls.TemporaryDirectory = tempfile.TemporaryDirectory()
+        coords, conn = make_grid(3, 2, 2)
+        cls.SingleFileName = os.path.join(cls.TemporaryDirectory.name, "single.e")
+        write_Exodus_file(cls.SingleFileName, coords, conn, [(10, np.arange(len(conn)))], 1)
+        cls.PartitionName = os.path.join(cls.TemporaryDirectory.name, "partition.e.2")
+        for r in range(2):
+            write_Exodus_file("{}.{}".format(cls.PartitionName, r), coords, conn,
+                              [(10, np.arange(r, len(conn), 2))], 1)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.TemporaryDirectory.cleanup()
+
+    def get_shard_blocks(self):
+        # Retrieve copies of single leaf of each partition
+        reader = argVTKExodusReader(self.PartitionName, "Temp", False)
+        self.addCleanup(reader.close)
+        blocks = []
+        for output in reader.update_VTK_readers(reader.Readers, 0):
+            (_, leaf), = argVTK.iterate_leaves(output)
+            block = leaf.NewInstance()
+            block.DeepCopy(leaf)
+            blocks.append(block)
+        return blocks
+
+    def test_shared_nodes_are_stitched_by_global_IDs(self):
+        blocks = self.get_shard_blocks()
+        merged = argVTKExodusReader.merge_blocks_by_global_IDs(blocks)
+        self.assertIsNotNone(merged)
+        self.assertLess(merged.GetNumberOfPoints(), sum(b.GetNumberOfPoints() for b in blocks))
+
+        # Merged block matches unpartitioned one up to point and cell ordering
+        single = argVTKExodusReader(self.SingleFileName, "Temp", False)
+        self.addCleanup(single.close)
+        (_, expected), = argVTK.iterate_leaves(single.get_VTK_reader_output_data(0))
+        self.assertEqual(merged.GetNumberOfPoints(), expected.GetNumberOfPoints())
+        self.assertEqual(merged.GetNumberOfCells(), expected.GetNumberOfCells())
+        sorted_points, sorted_temps, sorted_cells = [], [], []
+        for g in (merged, expected):
+            points = vtk_to_numpy(g.GetPoints().GetData())
+            nodes = np.lexsort(points.T)
+            sorted_points.append(points[nodes])
+            sorted_temps.append(vtk_to_numpy(g.GetPointData().GetArray("Temp"))[nodes])
+            cells = points[vtk_to_numpy(g.GetCells().GetConnectivityArray())].reshape(g.GetNumberOfCells(), -1)
+            sorted_cells.append(cells[np.lexsort(cells.T)])
+        for merged_values, expected_values in (sorted_points, sorted_temps, sorted_cells):
+            np.testing.assert_array_equal(merged_values, expected_values)
+
+    def test_missing_global_IDs_are_not_stitched(self):
+        for attr, name in (
+                ("GetPointData", vtkIOExodus.vtkExodusIIReader.GetGlobalNodeIdArrayName()),
+                ("GetCellData", vtkIOExodus.vtkExodusIIReader.GetGlobalElementIdArrayName())):
+            blocks = self.get_shard_blocks()
+            getattr(blocks[1], attr)().RemoveArray(name)
+            self.assertIsNone(argVTKExodusReader.merge_blocks_by_global_IDs(blocks))
+
+    def test_inconsistent_global_IDs_are_not_stitched(self):
+        blocks = self.get_shard_blocks()
+        vtk_to_numpy(blocks[1].GetPoints().GetData())[:] += .5
+        self.assertIsNone(argVTKExodusReader.merge_blocks_by_global_IDs(blocks))
+
+    def test_polyhedra_are_not_stitched(self):
+        self.assertIsNone(argVTKExodusReader.merge_blocks_by_global_IDs(
+            [make_polyhedral_cube(), make_polyhedral_cube()]))
+
+
+@skipUnless(HAS_READERS, "netCDF4, h5py, or VTK not available")
+class TestArgVTKExodusReaderOutputCache(TestCase):
+    NUMBER_OF_STEPS = 3
+
+    @classmethod
+    def setUpClass(cls):
+        # Create single file with two blocks
+        cls.TemporaryDirectory = tempfile.TemporaryDirectory()
+        coords, conn = make_grid(2, 2, 2)
+        cls.FileName = os.path.join(cls.TemporaryDirectory.name, "model.e")
+        write_Exodus_file(cls.FileName, coords, conn,
+                          [(10, np.arange(4)), (20, np.arange(4, len(conn)))], cls.NUMBER_OF_STEPS)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.TemporaryDirectory.cleanup()
+
+    def setUp(self):
+        # Count reads of reader created with default memory budget
+        self.addCleanup(argDataInterface.set_memory_budget, argDataInterface.MemoryBudget)
+        self.Reader = argVTKExodusReader(self.FileName, "Temp", False)
+        self.addCleanup(self.Reader.close)
+        read = patch.object(self.Reader, "read_VTK_reader_output_data",
+                            wraps=self.Reader.read_VTK_reader_output_data)
+        self.Reads = read.start()
+        self.addCleanup(read.stop)
+
+    def test_outputs_are_read_once_per_step_and_blocks(self):
+        outputs = [self.Reader.get_VTK_reader_output_data(t) for t in (-1, 0, 0)]
+        self.Reader.get_VTK_reader_output_data(0, [20])
+        self.assertEqual(self.Reads.call_count, 2)
+        self.assertEqual(set(self.Reader.OutputCache), {(0, frozenset()), (0, frozenset([20]))})
+
+        # Callers get copies which do not alter cached outputs
+        self.assertIsNot(outputs[0], outputs[1])
+        (_, leaf), _ = argVTK.iterate_leaves(outputs[0])
+        leaf.GetPointData().RemoveArray("Temp")
+        (_, leaf), _ = argVTK.iterate_leaves(self.Reader.get_VTK_reader_output_data(0))
+        self.assertIsNotNone(leaf.GetPointData().GetArray("Temp"))
+
+    def test_surfaces_are_cached_per_step_and_blocks(self):
+        surface = self.Reader.get_VTK_surface_mesh(0)
+        self.assertEqual(set(self.Reader.OutputCache), {(0, frozenset()), ("surface", 0, frozenset())})
+        cached = self.Reader.OutputCache[("surface", 0, frozenset())]
+
+        # Surfaces are extracted once and handed out as copies
+        other = self.Reader.get_VTK_surface_mesh(-1)
+        self.assertIs(self.Reader.OutputCache[("surface", 0, frozenset())], cached)
+        self.assertIsNot(other, surface)
+        self.assertIsNot(other, cached)
+        self.assertEqual(other.GetNumberOfCells(), cached.GetNumberOfCells())
+        self.assertEqual(self.Reads.call_count, 1)
+
+        # Ignored blocks and time steps yield surfaces of their own
+        partial = self.Reader.get_VTK_surface_mesh(0, [20])
+        self.Reader.get_VTK_surface_mesh(1)
+        self.assertLess(partial.GetNumberOfCells(), surface.GetNumberOfCells())
+        self.assertIn(("surface", 0, frozenset([20])), self.Reader.OutputCache)
+        self.assertIn(("surface", 1, frozenset()), self.Reader.OutputCache)
+        self.assertEqual(self.Reads.call_count, 3)
+
+    def test_least_recently_used_outputs_are_evicted(self):
+        size = 1024 * self.Reader.get_VTK_reader_output_data(0).GetActualMemorySize()
+        argDataInterface.set_memory_budget(2 * size)
+        self.Reader.get_VTK_reader_output_data(1)
+
+        # Using first step again makes second one least recently used
+        self.Reader.get_VTK_reader_output_data(0)
+        self.Reader.get_VTK_reader_output_data(2)
+        self.assertEqual(set(self.Reader.OutputCache), {(0, frozenset()), (2, frozenset())})
+        self.assertLessEqual(argDataInterface.CachedSize, argDataInterface.MemoryBudget)
+        self.assertEqual(self.Reads.call_count, 3)
+
+        # Evicted outputs are read again when needed
+        self.Reader.get_VTK_reader_output_data(1)
+        self.assertEqual(self.Reads.call_count, 4)
+
+        # Closed reader no longer accounts for cached outputs
+        self.Reader.close()
+        self.assertEqual(self.Reader.OutputCache, {})
+        self.assertFalse(any(owner is self.Reader for owner, _ in argDataInterface.CachedItems))